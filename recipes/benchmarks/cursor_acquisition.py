@@ -0,0 +1,107 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# benchmarks/cursor_acquisition.py
+#
+# Measure the overhead of select_ai.cursor() with 1 to 64 threads, using a
+# connection pool and per-thread standalone connections. Run it with a
+# free-threaded build (python3.13t, python3.14t) and a regular build to
+# compare how the connection registry scales with and without the GIL.
+# -----------------------------------------------------------------------------
+
+import os
+import statistics
+import sys
+import threading
+import time
+
+import select_ai
+
+user = os.getenv("SELECT_AI_USER")
+password = os.getenv("SELECT_AI_PASSWORD")
+dsn = os.getenv("SELECT_AI_DB_CONNECT_STRING")
+
+thread_counts = [
+    int(count)
+    for count in os.getenv(
+        "SELECT_AI_BENCH_THREADS", "1,2,4,8,16,32,64"
+    ).split(",")
+]
+iterations = int(os.getenv("SELECT_AI_BENCH_ITERATIONS", "2000"))
+modes = os.getenv("SELECT_AI_BENCH_MODES", "pool,standalone").split(",")
+
+
+def run(num_threads: int, standalone: bool):
+    """Returns the cursor() latencies, in microseconds, of num_threads
+    threads opening iterations cursors each, and the elapsed time
+    """
+    barrier = threading.Barrier(num_threads + 1)
+    latencies = [[] for _ in range(num_threads)]
+
+    def worker(index: int):
+        if standalone:
+            select_ai.connect(user=user, password=password, dsn=dsn)
+        timings = latencies[index]
+        barrier.wait()
+        try:
+            for _ in range(iterations):
+                started_at = time.perf_counter()
+                with select_ai.cursor():
+                    pass
+                timings.append((time.perf_counter() - started_at) * 1e6)
+        finally:
+            if standalone:
+                select_ai.disconnect()
+
+    threads = [
+        threading.Thread(target=worker, args=(index,))
+        for index in range(num_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started_at = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started_at
+    return [latency for timings in latencies for latency in timings], elapsed
+
+
+def report(mode: str, num_threads: int, latencies, elapsed: float):
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{mode:<11} {num_threads:>7} {len(latencies) / elapsed:>12,.0f} "
+        f"{statistics.mean(latencies):>10.1f} {p99:>10.1f}"
+    )
+
+
+is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+print(f"Python {sys.version.split()[0]}, GIL enabled: {is_gil_enabled}")
+print(f"{iterations} cursor() calls per thread\n")
+print(
+    f"{'mode':<11} {'threads':>7} {'cursors/s':>12} {'mean us':>10} "
+    f"{'p99 us':>10}"
+)
+
+for mode in modes:
+    if mode == "pool":
+        select_ai.create_pool(
+            user=user,
+            password=password,
+            dsn=dsn,
+            min_size=max(thread_counts),
+            max_size=max(thread_counts),
+        )
+    try:
+        for num_threads in thread_counts:
+            latencies, elapsed = run(num_threads, mode == "standalone")
+            report(mode, num_threads, latencies, elapsed)
+    finally:
+        if mode == "pool":
+            select_ai.disconnect()
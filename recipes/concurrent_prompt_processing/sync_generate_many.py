@@ -0,0 +1,44 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# concurrent_prompt_processing/sync_generate_many.py
+#
+# Send multiple prompts in one database round trip using generate_many().
+# -----------------------------------------------------------------------------
+
+import os
+
+import select_ai
+
+user = os.getenv("SELECT_AI_USER")
+password = os.getenv("SELECT_AI_PASSWORD")
+dsn = os.getenv("SELECT_AI_DB_CONNECT_STRING")
+
+profile_name = os.getenv("SELECT_AI_PROFILE_NAME", "oci_ai_profile")
+
+prompt_specifications = [
+    ("How many customers?", select_ai.Action.SHOWSQL),
+    ("How many promotions?", select_ai.Action.RUNSQL),
+    ("Explain how to count products.", select_ai.Action.EXPLAINSQL),
+]
+
+select_ai.connect(user=user, password=password, dsn=dsn)
+
+try:
+    profile = select_ai.Profile(profile_name=profile_name)
+    results = profile.generate_many(prompt_specifications)
+
+    for (prompt, action), result in zip(prompt_specifications, results):
+        print(f"\nPrompt: {prompt}")
+        print(f"Action: {action}")
+        if isinstance(result, select_ai.GenerateError):
+            print(f"Error: {result}")
+        else:
+            print(result)
+finally:
+    select_ai.disconnect()
@@ -6,8 +6,17 @@
 # -----------------------------------------------------------------------------
 
 from .action import Action
-from .async_profile import AsyncProfile
-from .base_profile import BaseProfile, ProfileAttributes
+from .async_profile import AsyncProfile, PipelineChunkTiming
+from .base_profile import BaseProfile, ProfileAttributes, SQLResult
+from .batch import AttributeBatch, async_batch_update, batch_update
+from .cache import (
+    CacheStats,
+    DatabaseEmbedder,
+    LRUCache,
+    ResponseCache,
+    SemanticCache,
+    SQLiteCache,
+)
 from .conversation import (
     AsyncConversation,
     Conversation,
@@ -21,6 +30,7 @@ from .credential import (
 )
 from .db import (
     async_connect,
+    async_connection_scope,
     async_cursor,
     async_disconnect,
     async_is_connected,
@@ -30,6 +40,8 @@ from .db import (
     cursor,
     disconnect,
     is_connected,
+    liveness_stats,
+    set_ping_interval,
 )
 from .errors import *
 from .privilege import (
@@ -58,6 +70,13 @@ from .provider import (
     OpenAIProvider,
     Provider,
 )
+from .query_guard import PlanMetrics, QueryGuard
+from .single_flight import (
+    CoalescingStats,
+    coalescing_stats,
+    disable_coalescing,
+    enable_coalescing,
+)
 from .synthetic_data import (
     SyntheticDataAttributes,
     SyntheticDataParams,
@@ -70,3 +89,20 @@ from .vector_index import (
     VectorIndexAttributes,
 )
 from .version import __version__ as __version__
+
+# select_ai.catalog imports select_ai.agent, so it is only imported when
+# one of its classes is first used
+_CATALOG_NAMES = (
+    "AsyncCatalog",
+    "Catalog",
+    "CatalogChanges",
+    "CatalogObjectType",
+)
+
+
+def __getattr__(name):
+    if name in _CATALOG_NAMES:
+        from . import catalog
+
+        return getattr(catalog, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
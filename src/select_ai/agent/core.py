@@ -5,13 +5,16 @@
 # http://oss.oracle.com/licenses/upl.
 # -----------------------------------------------------------------------------
 
+import json
 from abc import ABC
 from dataclasses import dataclass
 from typing import (
     Any,
     AsyncGenerator,
     Iterator,
+    Mapping,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -21,9 +24,15 @@ from select_ai._abc import SelectAIDataClass
 from select_ai.agent.sql import (
     GET_USER_AI_AGENT,
     GET_USER_AI_AGENT_ATTRIBUTES,
-    LIST_USER_AI_AGENTS,
+    LIST_USER_AI_AGENTS_WITH_ATTRIBUTES,
 )
-from select_ai.db import async_cursor, cursor
+from select_ai.batch import (
+    AsyncBatchUpdateMixin,
+    BatchUpdateMixin,
+    async_pending_batch,
+    pending_batch,
+)
+from select_ai.db import LIST_ARRAYSIZE, async_cursor, cursor
 from select_ai.errors import AgentAttributesEmptyError, AgentNotFoundError
 
 
@@ -69,8 +78,42 @@ class BaseAgent(ABC):
             f"attributes={self.attributes}, description={self.description})"
         )
 
+    @classmethod
+    def _from_row(
+        cls,
+        agent_name: str,
+        description: Optional[str],
+        attributes: Optional[str],
+    ):
+        """Builds an agent object from a row of
+        LIST_USER_AI_AGENTS_WITH_ATTRIBUTES without querying the database
+        again
+
+        :param str agent_name: Name of the agent
+        :param str description: Description of the agent
+        :param str attributes: Agent attributes aggregated as a JSON object
+        """
+        return cls(
+            agent_name=agent_name,
+            description=description,
+            attributes=(
+                AgentAttributes(**json.loads(attributes))
+                if attributes
+                else None
+            ),
+        )
+
+    def _batch_procedure(self) -> Tuple[str, Mapping]:
+        """Returns the procedure which saves the attribute changes collected
+        by a batch, and its parameters other than the attributes
+        """
+        return "DBMS_CLOUD_AI_AGENT.SET_ATTRIBUTES", {
+            "object_name": self.agent_name,
+            "object_type": "agent",
+        }
+
 
-class Agent(BaseAgent):
+class Agent(BaseAgent, BatchUpdateMixin):
     """
     select_ai.agent.Agent class lets you create, delete, enable, disable
     and list AI agents
@@ -248,13 +291,15 @@ class Agent(BaseAgent):
         :return: Iterator[Agent]
         """
         with cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
             cr.execute(
-                LIST_USER_AI_AGENTS,
+                LIST_USER_AI_AGENTS_WITH_ATTRIBUTES,
                 agent_name_pattern=agent_name_pattern,
+                fetch_lobs=False,
             )
-            for row in cr.fetchall():
-                agent_name = row[0]
-                yield cls.fetch(agent_name=agent_name)
+            for agent_name, description, attributes in cr:
+                yield cls._from_row(agent_name, description, attributes)
 
     def set_attributes(self, attributes: AgentAttributes) -> None:
         """
@@ -263,6 +308,10 @@ class Agent(BaseAgent):
         :param select_ai.agent.AgentAttributes attributes: Multiple attributes
          can be specified by passing an AgentAttributes object
         """
+        batch = pending_batch(self)
+        if batch is not None:
+            batch.add(self, attributes)
+            return
         parameters = {
             "object_name": self.agent_name,
             "object_type": "agent",
@@ -279,6 +328,10 @@ class Agent(BaseAgent):
         """
         Set a single AI Agent attribute specified using name and value
         """
+        batch = pending_batch(self)
+        if batch is not None:
+            batch.add(self, {attribute_name: attribute_value})
+            return
         parameters = {
             "object_name": self.agent_name,
             "object_type": "agent",
@@ -293,7 +346,7 @@ class Agent(BaseAgent):
         self.attributes = self._get_attributes(agent_name=self.agent_name)
 
 
-class AsyncAgent(BaseAgent):
+class AsyncAgent(BaseAgent, AsyncBatchUpdateMixin):
     """
     select_ai.agent.AsyncAgent class lets you create, delete, enable, disable
     and list AI agents asynchronously
@@ -473,15 +526,15 @@ class AsyncAgent(BaseAgent):
         :return: AsyncGenerator[AsyncAgent]
         """
         async with async_cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
             await cr.execute(
-                LIST_USER_AI_AGENTS,
+                LIST_USER_AI_AGENTS_WITH_ATTRIBUTES,
                 agent_name_pattern=agent_name_pattern,
+                fetch_lobs=False,
             )
-            rows = await cr.fetchall()
-            for row in rows:
-                agent_name = row[0]
-                agent = await cls.fetch(agent_name=agent_name)
-                yield agent
+            async for agent_name, description, attributes in cr:
+                yield cls._from_row(agent_name, description, attributes)
 
     async def set_attributes(self, attributes: AgentAttributes) -> None:
         """
@@ -490,6 +543,10 @@ class AsyncAgent(BaseAgent):
         :param select_ai.agent.AgentAttributes attributes: Multiple attributes
          can be specified by passing an AgentAttributes object
         """
+        batch = async_pending_batch(self)
+        if batch is not None:
+            batch.add(self, attributes)
+            return
         parameters = {
             "object_name": self.agent_name,
             "object_type": "agent",
@@ -510,6 +567,10 @@ class AsyncAgent(BaseAgent):
         """
         Set a single AI Agent attribute specified using name and value
         """
+        batch = async_pending_batch(self)
+        if batch is not None:
+            batch.add(self, {attribute_name: attribute_value})
+            return
         parameters = {
             "object_name": self.agent_name,
             "object_type": "agent",
@@ -80,3 +80,59 @@ SELECT t.AGENT_TEAM_NAME as team_name, description
 FROM USER_AI_AGENT_TEAMS t
 WHERE REGEXP_LIKE(t.AGENT_TEAM_NAME, :team_name_pattern, 'i')
 """
+
+# The LIST_*_WITH_ATTRIBUTES queries return each object with its attributes
+# aggregated as a JSON object, so that listing needs a single round trip per
+# fetched batch instead of a round trip per object
+
+LIST_USER_AI_AGENTS_WITH_ATTRIBUTES = """
+SELECT a.agent_name,
+       a.description,
+       (SELECT JSON_OBJECTAGG(
+                   KEY aa.attribute_name VALUE aa.attribute_value
+                   RETURNING CLOB
+               )
+        FROM USER_AI_AGENT_ATTRIBUTES aa
+        WHERE aa.agent_name = a.agent_name) AS attributes
+FROM USER_AI_AGENTS a
+WHERE REGEXP_LIKE(a.agent_name, :agent_name_pattern, 'i')
+"""
+
+LIST_USER_AI_AGENT_TASKS_WITH_ATTRIBUTES = """
+SELECT t.task_name,
+       t.description,
+       (SELECT JSON_OBJECTAGG(
+                   KEY ta.attribute_name VALUE ta.attribute_value
+                   RETURNING CLOB
+               )
+        FROM USER_AI_AGENT_TASK_ATTRIBUTES ta
+        WHERE ta.task_name = t.task_name) AS attributes
+FROM USER_AI_AGENT_TASKS t
+WHERE REGEXP_LIKE(t.task_name, :task_name_pattern, 'i')
+"""
+
+LIST_USER_AI_AGENT_TOOLS_WITH_ATTRIBUTES = """
+SELECT t.tool_name,
+       t.description,
+       (SELECT JSON_OBJECTAGG(
+                   KEY ta.attribute_name VALUE ta.attribute_value
+                   RETURNING CLOB
+               )
+        FROM USER_AI_AGENT_TOOL_ATTRIBUTES ta
+        WHERE ta.tool_name = t.tool_name) AS attributes
+FROM USER_AI_AGENT_TOOLS t
+WHERE REGEXP_LIKE(t.tool_name, :tool_name_pattern, 'i')
+"""
+
+LIST_USER_AI_AGENT_TEAMS_WITH_ATTRIBUTES = """
+SELECT t.agent_team_name AS team_name,
+       t.description,
+       (SELECT JSON_OBJECTAGG(
+                   KEY ta.attribute_name VALUE ta.attribute_value
+                   RETURNING CLOB
+               )
+        FROM USER_AI_AGENT_TEAM_ATTRIBUTES ta
+        WHERE ta.agent_team_name = t.agent_team_name) AS attributes
+FROM USER_AI_AGENT_TEAMS t
+WHERE REGEXP_LIKE(t.agent_team_name, :team_name_pattern, 'i')
+"""
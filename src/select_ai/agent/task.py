@@ -5,6 +5,7 @@
 # http://oss.oracle.com/licenses/upl.
 # -----------------------------------------------------------------------------
 
+import json
 from abc import ABC
 from dataclasses import dataclass
 from typing import (
@@ -12,7 +13,9 @@ from typing import (
     AsyncGenerator,
     Iterator,
     List,
+    Mapping,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -22,9 +25,15 @@ from select_ai._abc import SelectAIDataClass
 from select_ai.agent.sql import (
     GET_USER_AI_AGENT_TASK,
     GET_USER_AI_AGENT_TASK_ATTRIBUTES,
-    LIST_USER_AI_AGENT_TASKS,
+    LIST_USER_AI_AGENT_TASKS_WITH_ATTRIBUTES,
 )
-from select_ai.db import async_cursor, cursor
+from select_ai.batch import (
+    AsyncBatchUpdateMixin,
+    BatchUpdateMixin,
+    async_pending_batch,
+    pending_batch,
+)
+from select_ai.db import LIST_ARRAYSIZE, async_cursor, cursor
 from select_ai.errors import (
     AgentTaskAttributesEmptyError,
     AgentTaskNotFoundError,
@@ -80,8 +89,42 @@ class BaseTask(ABC):
             f"attributes={self.attributes}, description={self.description})"
         )
 
+    @classmethod
+    def _from_row(
+        cls,
+        task_name: str,
+        description: Optional[str],
+        attributes: Optional[str],
+    ):
+        """Builds a task object from a row of
+        LIST_USER_AI_AGENT_TASKS_WITH_ATTRIBUTES without querying the database
+        again
+
+        :param str task_name: Name of the task
+        :param str description: Description of the task
+        :param str attributes: Task attributes aggregated as a JSON object
+        """
+        return cls(
+            task_name=task_name,
+            description=description,
+            attributes=(
+                TaskAttributes(**json.loads(attributes))
+                if attributes
+                else None
+            ),
+        )
 
-class Task(BaseTask):
+    def _batch_procedure(self) -> Tuple[str, Mapping]:
+        """Returns the procedure which saves the attribute changes collected
+        by a batch, and its parameters other than the attributes
+        """
+        return "DBMS_CLOUD_AI_AGENT.SET_ATTRIBUTES", {
+            "object_name": self.task_name,
+            "object_type": "task",
+        }
+
+
+class Task(BaseTask, BatchUpdateMixin):
     """
     select_ai.agent.Task class lets you create, delete, enable, disable and
     list AI Tasks
@@ -231,25 +274,15 @@ class Task(BaseTask):
         :return: Iterator[Task]
         """
         with cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
             cr.execute(
-                LIST_USER_AI_AGENT_TASKS,
+                LIST_USER_AI_AGENT_TASKS_WITH_ATTRIBUTES,
                 task_name_pattern=task_name_pattern,
+                fetch_lobs=False,
             )
-            for row in cr.fetchall():
-                task_name = row[0]
-                if row[1]:
-                    description = row[1].read()  # Oracle.LOB
-                else:
-                    description = None
-                try:
-                    attributes = cls._get_attributes(task_name=task_name)
-                except AgentTaskAttributesEmptyError:
-                    attributes = None
-                yield cls(
-                    task_name=task_name,
-                    description=description,
-                    attributes=attributes,
-                )
+            for task_name, description, attributes in cr:
+                yield cls._from_row(task_name, description, attributes)
 
     @classmethod
     def fetch(cls, task_name: str) -> "Task":
@@ -282,6 +315,10 @@ class Task(BaseTask):
         :param select_ai.agent.TaskAttributes attributes: Multiple attributes
          can be specified by passing a TaskAttributes object
         """
+        batch = pending_batch(self)
+        if batch is not None:
+            batch.add(self, attributes)
+            return
         parameters = {
             "object_name": self.task_name,
             "object_type": "task",
@@ -301,6 +338,10 @@ class Task(BaseTask):
         :param str attribute_value: The value of the AI Task attribute
 
         """
+        batch = pending_batch(self)
+        if batch is not None:
+            batch.add(self, {attribute_name: attribute_value})
+            return
         parameters = {
             "object_name": self.task_name,
             "object_type": "task",
@@ -314,7 +355,7 @@ class Task(BaseTask):
             )
 
 
-class AsyncTask(BaseTask):
+class AsyncTask(BaseTask, AsyncBatchUpdateMixin):
     """
     select_ai.agent.AsyncTask class lets you create, delete, enable, disable and
     list AI Tasks asynchronously
@@ -468,26 +509,15 @@ class AsyncTask(BaseTask):
         :return: AsyncGenerator[Task]
         """
         async with async_cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
             await cr.execute(
-                LIST_USER_AI_AGENT_TASKS,
+                LIST_USER_AI_AGENT_TASKS_WITH_ATTRIBUTES,
                 task_name_pattern=task_name_pattern,
+                fetch_lobs=False,
             )
-            rows = await cr.fetchall()
-            for row in rows:
-                task_name = row[0]
-                if row[1]:
-                    description = await row[1].read()  # Oracle.AsyncLOB
-                else:
-                    description = None
-                try:
-                    attributes = await cls._get_attributes(task_name=task_name)
-                except AgentTaskAttributesEmptyError:
-                    attributes = None
-                yield cls(
-                    task_name=task_name,
-                    description=description,
-                    attributes=attributes,
-                )
+            async for task_name, description, attributes in cr:
+                yield cls._from_row(task_name, description, attributes)
 
     @classmethod
     async def fetch(cls, task_name: str) -> "AsyncTask":
@@ -520,6 +550,10 @@ class AsyncTask(BaseTask):
         :param select_ai.agent.TaskAttributes attributes: Multiple attributes
          can be specified by passing a TaskAttributes object
         """
+        batch = async_pending_batch(self)
+        if batch is not None:
+            batch.add(self, attributes)
+            return
         parameters = {
             "object_name": self.task_name,
             "object_type": "task",
@@ -539,6 +573,10 @@ class AsyncTask(BaseTask):
         :param str attribute_value: The value of the AI Task attribute
 
         """
+        batch = async_pending_batch(self)
+        if batch is not None:
+            batch.add(self, {attribute_name: attribute_value})
+            return
         parameters = {
             "object_name": self.task_name,
             "object_type": "task",
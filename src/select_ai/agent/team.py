@@ -15,6 +15,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -24,13 +25,20 @@ from select_ai._abc import SelectAIDataClass
 from select_ai.agent.sql import (
     GET_USER_AI_AGENT_TEAM,
     GET_USER_AI_AGENT_TEAM_ATTRIBUTES,
-    LIST_USER_AI_AGENT_TEAMS,
+    LIST_USER_AI_AGENT_TEAMS_WITH_ATTRIBUTES,
 )
-from select_ai.db import async_cursor, cursor
+from select_ai.batch import (
+    AsyncBatchUpdateMixin,
+    BatchUpdateMixin,
+    async_pending_batch,
+    pending_batch,
+)
+from select_ai.db import LIST_ARRAYSIZE, async_cursor, cursor
 from select_ai.errors import (
     AgentTeamAttributesEmptyError,
     AgentTeamNotFoundError,
 )
+from select_ai.streaming import async_callfunc_clob, callfunc_clob
 
 
 @dataclass
@@ -75,6 +83,40 @@ class BaseTeam(ABC):
             f"attributes={self.attributes}, description={self.description})"
         )
 
+    @classmethod
+    def _from_row(
+        cls,
+        team_name: str,
+        description: Optional[str],
+        attributes: Optional[str],
+    ):
+        """Builds a team object from a row of
+        LIST_USER_AI_AGENT_TEAMS_WITH_ATTRIBUTES without querying the database
+        again
+
+        :param str team_name: Name of the team
+        :param str description: Description of the team
+        :param str attributes: Team attributes aggregated as a JSON object
+        """
+        return cls(
+            team_name=team_name,
+            description=description,
+            attributes=(
+                TeamAttributes(**json.loads(attributes))
+                if attributes
+                else None
+            ),
+        )
+
+    def _batch_procedure(self) -> Tuple[str, Mapping]:
+        """Returns the procedure which saves the attribute changes collected
+        by a batch, and its parameters other than the attributes
+        """
+        return "DBMS_CLOUD_AI_AGENT.SET_ATTRIBUTES", {
+            "object_name": self.team_name,
+            "object_type": "team",
+        }
+
 
 def _json_or_none(value: Optional[Union[str, Mapping]]) -> Optional[str]:
     if value is None:
@@ -97,7 +139,7 @@ def _validate_object_storage_location(
         )
 
 
-class Team(BaseTeam):
+class Team(BaseTeam, BatchUpdateMixin):
     """
     A Team of AI agents work together to accomplish tasks
     select_ai.agent.Team class lets you create, delete, enable, disable and
@@ -272,25 +314,15 @@ class Team(BaseTeam):
 
         """
         with cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
             cr.execute(
-                LIST_USER_AI_AGENT_TEAMS,
+                LIST_USER_AI_AGENT_TEAMS_WITH_ATTRIBUTES,
                 team_name_pattern=team_name_pattern,
+                fetch_lobs=False,
             )
-            for row in cr.fetchall():
-                team_name = row[0]
-                if row[1]:
-                    description = row[1].read()  # Oracle.LOB
-                else:
-                    description = None
-                try:
-                    attributes = cls._get_attributes(team_name=team_name)
-                except AgentTeamAttributesEmptyError:
-                    attributes = None
-                yield cls(
-                    team_name=team_name,
-                    description=description,
-                    attributes=attributes,
-                )
+            for team_name, description, attributes in cr:
+                yield cls._from_row(team_name, description, attributes)
 
     def run(self, prompt: str = None, params: Mapping = None):
         """
@@ -321,16 +353,9 @@ class Team(BaseTeam):
             parameters["params"] = json.dumps(params)
 
         with cursor() as cr:
-            data = cr.callfunc(
-                "DBMS_CLOUD_AI_AGENT.RUN_TEAM",
-                oracledb.DB_TYPE_CLOB,
-                keyword_parameters=parameters,
+            return callfunc_clob(
+                cr, "DBMS_CLOUD_AI_AGENT.RUN_TEAM", parameters
             )
-            if data is not None:
-                result = data.read()
-            else:
-                result = None
-            return result
 
     @classmethod
     def export_team(
@@ -507,6 +532,10 @@ class Team(BaseTeam):
         """
         Set the attributes of the AI Agent team
         """
+        batch = pending_batch(self)
+        if batch is not None:
+            batch.add(self, attributes)
+            return
         parameters = {
             "object_name": self.team_name,
             "object_type": "team",
@@ -523,6 +552,10 @@ class Team(BaseTeam):
         Set the attribute of the AI Agent team specified by
         `attribute_name` and `attribute_value`.
         """
+        batch = pending_batch(self)
+        if batch is not None:
+            batch.add(self, {attribute_name: attribute_value})
+            return
         parameters = {
             "object_name": self.team_name,
             "object_type": "team",
@@ -536,7 +569,7 @@ class Team(BaseTeam):
             )
 
 
-class AsyncTeam(BaseTeam):
+class AsyncTeam(BaseTeam, AsyncBatchUpdateMixin):
     """
     A Team of AI agents work together to accomplish tasks
     select_ai.agent.Team class lets you create, delete, enable, disable and
@@ -715,26 +748,15 @@ class AsyncTeam(BaseTeam):
 
         """
         async with async_cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
             await cr.execute(
-                LIST_USER_AI_AGENT_TEAMS,
+                LIST_USER_AI_AGENT_TEAMS_WITH_ATTRIBUTES,
                 team_name_pattern=team_name_pattern,
+                fetch_lobs=False,
             )
-            rows = await cr.fetchall()
-            for row in rows:
-                team_name = row[0]
-                if row[1]:
-                    description = await row[1].read()  # Oracle.AsyncLOB
-                else:
-                    description = None
-                try:
-                    attributes = await cls._get_attributes(team_name=team_name)
-                except AgentTeamAttributesEmptyError:
-                    attributes = None
-                yield cls(
-                    team_name=team_name,
-                    description=description,
-                    attributes=attributes,
-                )
+            async for team_name, description, attributes in cr:
+                yield cls._from_row(team_name, description, attributes)
 
     async def run(self, prompt: str = None, params: Mapping = None):
         """
@@ -765,16 +787,9 @@ class AsyncTeam(BaseTeam):
             parameters["params"] = json.dumps(params)
 
         async with async_cursor() as cr:
-            data = await cr.callfunc(
-                "DBMS_CLOUD_AI_AGENT.RUN_TEAM",
-                oracledb.DB_TYPE_CLOB,
-                keyword_parameters=parameters,
+            return await async_callfunc_clob(
+                cr, "DBMS_CLOUD_AI_AGENT.RUN_TEAM", parameters
             )
-            if data is not None:
-                result = await data.read()
-            else:
-                result = None
-            return result
 
     @classmethod
     async def export_team(
@@ -951,6 +966,10 @@ class AsyncTeam(BaseTeam):
         """
         Set the attributes of the AI Agent team
         """
+        batch = async_pending_batch(self)
+        if batch is not None:
+            batch.add(self, attributes)
+            return
         parameters = {
             "object_name": self.team_name,
             "object_type": "team",
@@ -969,6 +988,10 @@ class AsyncTeam(BaseTeam):
         Set the attribute of the AI Agent team specified by
         `attribute_name` and `attribute_value`.
         """
+        batch = async_pending_batch(self)
+        if batch is not None:
+            batch.add(self, {attribute_name: attribute_value})
+            return
         parameters = {
             "object_name": self.team_name,
             "object_type": "team",
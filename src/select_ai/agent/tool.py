@@ -15,6 +15,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -26,10 +27,16 @@ from select_ai._enums import StrEnum
 from select_ai.agent.sql import (
     GET_USER_AI_AGENT_TOOL,
     GET_USER_AI_AGENT_TOOL_ATTRIBUTES,
-    LIST_USER_AI_AGENT_TOOLS,
+    LIST_USER_AI_AGENT_TOOLS_WITH_ATTRIBUTES,
 )
 from select_ai.async_profile import AsyncProfile
-from select_ai.db import async_cursor, cursor
+from select_ai.batch import (
+    AsyncBatchUpdateMixin,
+    BatchUpdateMixin,
+    async_pending_batch,
+    pending_batch,
+)
+from select_ai.db import LIST_ARRAYSIZE, async_cursor, cursor
 from select_ai.errors import (
     AgentToolAttributesEmptyError,
     AgentToolNotFoundError,
@@ -269,8 +276,42 @@ class _BaseTool(ABC):
             f"attributes={self.attributes}, description={self.description})"
         )
 
+    @classmethod
+    def _from_row(
+        cls,
+        tool_name: str,
+        description: Optional[str],
+        attributes: Optional[str],
+    ):
+        """Builds a tool object from a row of
+        LIST_USER_AI_AGENT_TOOLS_WITH_ATTRIBUTES without querying the database
+        again
 
-class Tool(_BaseTool):
+        :param str tool_name: Name of the tool
+        :param str description: Description of the tool
+        :param str attributes: Tool attributes aggregated as a JSON object
+        """
+        return cls(
+            tool_name=tool_name,
+            description=description,
+            attributes=(
+                ToolAttributes.create(**json.loads(attributes))
+                if attributes
+                else None
+            ),
+        )
+
+    def _batch_procedure(self) -> Tuple[str, Mapping]:
+        """Returns the procedure which saves the attribute changes collected
+        by a batch, and its parameters other than the attributes
+        """
+        return "DBMS_CLOUD_AI_AGENT.SET_ATTRIBUTES", {
+            "object_name": self.tool_name,
+            "object_type": "tool",
+        }
+
+
+class Tool(_BaseTool, BatchUpdateMixin):
 
     @staticmethod
     def _get_attributes(tool_name: str) -> ToolAttributes:
@@ -686,18 +727,24 @@ class Tool(_BaseTool):
         :return: Iterator[Tool]
         """
         with cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
             cr.execute(
-                LIST_USER_AI_AGENT_TOOLS,
+                LIST_USER_AI_AGENT_TOOLS_WITH_ATTRIBUTES,
                 tool_name_pattern=tool_name_pattern,
+                fetch_lobs=False,
             )
-            for row in cr.fetchall():
-                tool_name = row[0]
-                yield cls.fetch(tool_name=tool_name)
+            for tool_name, description, attributes in cr:
+                yield cls._from_row(tool_name, description, attributes)
 
     def set_attributes(self, attributes: ToolAttributes) -> None:
         """
         Set the attributes of the AI Agent tool
         """
+        batch = pending_batch(self)
+        if batch is not None:
+            batch.add(self, attributes)
+            return
         parameters = {
             "object_name": self.tool_name,
             "object_type": "tool",
@@ -714,6 +761,10 @@ class Tool(_BaseTool):
         Set the attribute of the AI Agent tool specified by
         `attribute_name` and `attribute_value`.
         """
+        batch = pending_batch(self)
+        if batch is not None:
+            batch.add(self, {attribute_name: attribute_value})
+            return
         parameters = {
             "object_name": self.tool_name,
             "object_type": "tool",
@@ -727,7 +778,7 @@ class Tool(_BaseTool):
             )
 
 
-class AsyncTool(_BaseTool):
+class AsyncTool(_BaseTool, AsyncBatchUpdateMixin):
 
     @staticmethod
     async def _get_attributes(tool_name: str) -> ToolAttributes:
@@ -1152,28 +1203,24 @@ class AsyncTool(_BaseTool):
         :return: Iterator[Tool]
         """
         async with async_cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
             await cr.execute(
-                LIST_USER_AI_AGENT_TOOLS,
+                LIST_USER_AI_AGENT_TOOLS_WITH_ATTRIBUTES,
                 tool_name_pattern=tool_name_pattern,
+                fetch_lobs=False,
             )
-            rows = await cr.fetchall()
-            for row in rows:
-                tool_name = row[0]
-                if row[1]:
-                    description = await row[1].read()  # Oracle.AsyncLOB
-                else:
-                    description = None
-                attributes = await cls._get_attributes(tool_name=tool_name)
-                yield cls(
-                    tool_name=tool_name,
-                    description=description,
-                    attributes=attributes,
-                )
+            async for tool_name, description, attributes in cr:
+                yield cls._from_row(tool_name, description, attributes)
 
     async def set_attributes(self, attributes: ToolAttributes) -> None:
         """
         Set the attributes of the AI Agent tool
         """
+        batch = async_pending_batch(self)
+        if batch is not None:
+            batch.add(self, attributes)
+            return
         parameters = {
             "object_name": self.tool_name,
             "object_type": "tool",
@@ -1192,6 +1239,10 @@ class AsyncTool(_BaseTool):
         Set the attribute of the AI Agent tool specified by
         `attribute_name` and `attribute_value`.
         """
+        batch = async_pending_batch(self)
+        if batch is not None:
+            batch.add(self, {attribute_name: attribute_value})
+            return
         parameters = {
             "object_name": self.tool_name,
             "object_type": "tool",
@@ -5,9 +5,14 @@
 # http://oss.oracle.com/licenses/upl.
 # -----------------------------------------------------------------------------
 
+import asyncio
 import json
+import time
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import (
+    TYPE_CHECKING,
+    Any,
     AsyncGenerator,
     List,
     Mapping,
@@ -23,37 +28,91 @@ from select_ai.action import Action
 from select_ai.base_profile import (
     BaseProfile,
     ProfileAttributes,
+    SQLResult,
     convert_json_rows_to_df,
+    convert_oracle_df_batch_to_output_type,
+    convert_oracle_df_batches_to_output_type,
+    validate_batch_params,
+    validate_generated_query,
+    validate_output_type,
     validate_params_for_feedback,
     validate_params_for_summary,
 )
+from select_ai.batch import AsyncBatchUpdateMixin, async_pending_batch
+from select_ai.cache import ResponseCache
 from select_ai.conversation import AsyncConversation
 from select_ai.db import (
+    DATAFRAME_ARRAYSIZE,
+    LIST_ARRAYSIZE,
     AsyncConnectionManager,
     async_cursor,
     async_get_connection,
 )
 from select_ai.errors import (
+    InvalidSQLError,
     ProfileAttributesEmptyError,
     ProfileNotFoundError,
+    ProfileNotLoadedError,
 )
 from select_ai.feedback import (
     FeedbackOperation,
     FeedbackType,
 )
 from select_ai.provider import Provider
+from select_ai.query_guard import (
+    QueryGuard,
+    async_guarded_batches,
+    call_timeout_for,
+)
+from select_ai.single_flight import (
+    __async_single_flight__,
+    async_request_key,
+)
 from select_ai.sql import (
     GET_USER_AI_PROFILE,
     GET_USER_AI_PROFILE_ATTRIBUTES,
-    LIST_USER_AI_PROFILES,
+    LIST_USER_AI_PROFILES_WITH_ATTRIBUTES,
+)
+from select_ai.streaming import (
+    async_callfunc_clob,
+    async_read_lob,
+    async_read_lob_ahead,
 )
 from select_ai.summary import SummaryParams
 from select_ai.synthetic_data import SyntheticDataAttributes
 
-__all__ = ["AsyncProfile"]
+if TYPE_CHECKING:
+    import pyarrow
+
+__all__ = ["AsyncProfile", "PipelineChunkTiming"]
+
+AFFINITY_NOT_SUPPORTED = (
+    "connection affinity is not supported by async connections: they use "
+    "python-oracledb Thin mode, which ignores pool tags"
+)
+
 
+@dataclass
+class PipelineChunkTiming:
+    """Timing of one pipeline run by AsyncProfile.run_pipeline()
 
-class AsyncProfile(BaseProfile):
+    :param int index: Position of the pipeline in the batch
+    :param int offset: Position of the first prompt of the pipeline in
+     prompt_specifications
+    :param int size: Number of prompts in the pipeline
+    :param float queued: Seconds spent waiting for a free pipeline slot
+    :param float elapsed: Seconds spent acquiring a connection, running the
+     pipeline and reading its responses
+    """
+
+    index: int
+    offset: int
+    size: int
+    queued: float
+    elapsed: float
+
+
+class AsyncProfile(BaseProfile, AsyncBatchUpdateMixin):
     """AsyncProfile defines methods to interact with the underlying AI Provider
     asynchronously.
     """
@@ -75,14 +134,14 @@ class AsyncProfile(BaseProfile):
         if self.profile_name:
             profile_exists = False
             try:
-                saved_description = await self._get_profile_description(
+                saved_description, saved_attributes = await self._get_metadata(
                     profile_name=self.profile_name
                 )
                 profile_exists = True
-                saved_attributes = await self._get_attributes(
-                    profile_name=self.profile_name,
-                    raise_on_empty=True,
-                )
+                if saved_attributes is None:
+                    raise ProfileAttributesEmptyError(
+                        profile_name=self.profile_name
+                    )
                 self._raise_error_if_profile_exists()
             except ProfileAttributesEmptyError:
                 if self.raise_error_on_empty_attributes:
@@ -99,6 +158,29 @@ class AsyncProfile(BaseProfile):
                 raise ValueError("'profile_name' cannot be empty or None")
         return self
 
+    @classmethod
+    async def _get_metadata(
+        cls, profile_name: str
+    ) -> Tuple[Optional[str], Optional[ProfileAttributes]]:
+        """Asynchronously gets description and attributes of a saved
+        profile. These are served from the metadata cache when it is enabled
+
+        :param str profile_name: Name of the profile
+        :return: Tuple of description and attributes
+        :raises: ProfileNotFoundError
+        """
+        metadata = cls._cached_metadata(profile_name)
+        if metadata is None:
+            description = await cls._get_profile_description(
+                profile_name=profile_name
+            )
+            attributes = await cls._get_attributes(
+                profile_name=profile_name, raise_on_empty=False
+            )
+            metadata = (description, attributes)
+            cls._cache_metadata(profile_name, description, attributes)
+        return metadata
+
     @staticmethod
     async def _get_profile_description(profile_name) -> Union[str, None]:
         """Get description of profile from USER_CLOUD_AI_PROFILES
@@ -189,12 +271,20 @@ class AsyncProfile(BaseProfile):
         :return: None
 
         """
+        batch = async_pending_batch(self)
+        if batch is not None:
+            batch.add(self, {attribute_name: attribute_value})
+            return
+        await self.load()
         self.attributes.set_attribute(attribute_name, attribute_value)
-        if isinstance(attribute_value, Provider):
-            for k, v in attribute_value.dict().items():
-                await self._set_attribute(k, v)
-        else:
-            await self._set_attribute(attribute_name, attribute_value)
+        try:
+            if isinstance(attribute_value, Provider):
+                for k, v in attribute_value.dict().items():
+                    await self._set_attribute(k, v)
+            else:
+                await self._set_attribute(attribute_name, attribute_value)
+        finally:
+            self.invalidate_metadata_cache(self.profile_name)
 
     async def set_attributes(self, attributes: ProfileAttributes):
         """Updates AI profile attributes on the Python object and also
@@ -209,6 +299,10 @@ class AsyncProfile(BaseProfile):
                 "'attributes' must be an object of type "
                 "select_ai.ProfileAttributes"
             )
+        batch = async_pending_batch(self)
+        if batch is not None:
+            batch.add(self, attributes)
+            return
         parameters = {
             "profile_name": self.profile_name,
             "attributes": attributes.json(),
@@ -217,6 +311,7 @@ class AsyncProfile(BaseProfile):
             await cr.callproc(
                 "DBMS_CLOUD_AI.SET_ATTRIBUTES", keyword_parameters=parameters
             )
+        self.invalidate_metadata_cache(self.profile_name)
         self.attributes = await self.get_attributes()
 
     async def create(self, replace: Optional[int] = False) -> None:
@@ -226,6 +321,7 @@ class AsyncProfile(BaseProfile):
         :return: None
         :raises: oracledb.DatabaseError
         """
+        await self.load()
         if self.attributes is None:
             raise AttributeError("Profile attributes cannot be None")
         parameters = {
@@ -251,6 +347,7 @@ class AsyncProfile(BaseProfile):
                     )
                 else:
                     raise
+        self.invalidate_metadata_cache(self.profile_name)
 
     @staticmethod
     async def _delete(profile_name: str, force: bool = False):
@@ -265,6 +362,7 @@ class AsyncProfile(BaseProfile):
                     "force": force,
                 },
             )
+        BaseProfile.invalidate_metadata_cache(profile_name)
 
     async def delete(self, force=False) -> None:
         """Asynchronously deletes an AI profile from the database
@@ -297,6 +395,80 @@ class AsyncProfile(BaseProfile):
         """
         return await cls(profile_name, raise_error_if_exists=False)
 
+    @classmethod
+    def lazy(
+        cls,
+        profile_name: str,
+        prefetch: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        query_guard: Optional[QueryGuard] = None,
+    ) -> "AsyncProfile":
+        """Create a proxy AsyncProfile object for a profile saved in the
+        database without querying the database. The returned object is
+        not awaited. generate(), chat() and the other actions only pass the
+        profile name to the database; the description and attributes are
+        read by load(), and accessing them before raises
+        ProfileNotLoadedError
+
+        :param str profile_name: The name of the AI profile
+        :param bool prefetch: Start loading the description and attributes
+         in a background task right away. Requires a running event loop.
+         Default value is False
+        :param select_ai.cache.ResponseCache response_cache: Cache for
+         responses of generate()
+        :param select_ai.QueryGuard query_guard: Checks the optimizer plan
+         of generated SQL before it is executed locally
+        :return: select_ai.AsyncProfile
+        """
+        if not profile_name:
+            raise ValueError("'profile_name' cannot be empty or None")
+        profile = cls.__new__(cls)
+        profile._init_lazy(
+            profile_name,
+            response_cache=response_cache,
+            query_guard=query_guard,
+        )
+        profile._metadata_task = None
+        if prefetch:
+            profile._start_loading()
+        return profile
+
+    async def load(self) -> None:
+        """Asynchronously read the description and attributes of a lazy
+        profile. Does nothing if they were already read
+
+        :return: None
+        :raises: ProfileNotFoundError
+        """
+        if not self._unloaded:
+            return
+        task = self._metadata_task
+        if task is None:
+            task = self._start_loading()
+        try:
+            # shield() so that a cancelled caller leaves the load running
+            await asyncio.shield(task)
+        except BaseException:
+            if task.done() and self._metadata_task is task:
+                self._metadata_task = None
+            raise
+
+    def _start_loading(self) -> asyncio.Task:
+        async def load_metadata():
+            self._set_metadata(
+                *await self._get_metadata(profile_name=self.profile_name)
+            )
+
+        task = asyncio.get_running_loop().create_task(load_metadata())
+        # The error is raised by load(); a failed prefetch nobody waits for
+        # must not be reported as never retrieved
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._metadata_task = task
+        return task
+
+    def _load_metadata(self) -> None:
+        raise ProfileNotLoadedError(self.profile_name)
+
     async def _save_feedback(
         self,
         feedback_type: FeedbackType = None,
@@ -397,18 +569,15 @@ class AsyncProfile(BaseProfile):
         :return: Iterator[Profile]
         """
         async with async_cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
             await cr.execute(
-                LIST_USER_AI_PROFILES,
+                LIST_USER_AI_PROFILES_WITH_ATTRIBUTES,
                 profile_name_pattern=profile_name_pattern,
+                fetch_lobs=False,
             )
-            rows = await cr.fetchall()
-            for row in rows:
-                profile_name = row[0]
-                yield await cls(
-                    profile_name=profile_name,
-                    raise_error_if_exists=False,
-                    raise_error_on_empty_attributes=False,
-                )
+            async for profile_name, description, attributes in cr:
+                yield cls._from_row(profile_name, description, attributes)
 
     async def _generate_with_cursor(
         self,
@@ -426,16 +595,9 @@ class AsyncProfile(BaseProfile):
         :return: Union[pandas.DataFrame, str]
         """
         parameters = self._generate_parameters(prompt, action, params)
-
-        data = await cr.callfunc(
-            "DBMS_CLOUD_AI.GENERATE",
-            oracledb.DB_TYPE_CLOB,
-            keyword_parameters=parameters,
+        result = await async_callfunc_clob(
+            cr, "DBMS_CLOUD_AI.GENERATE", parameters
         )
-        if data is not None:
-            result = await data.read()
-        else:
-            result = None
         if action == Action.RUNSQL:
             return convert_json_rows_to_df(result)
         else:
@@ -466,6 +628,7 @@ class AsyncProfile(BaseProfile):
         action,
         params: Mapping = None,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> AsyncGenerator[str, None]:
         async with async_cursor() as cr:
             async for chunk in self._generate_stream_with_cursor(
@@ -474,6 +637,7 @@ class AsyncProfile(BaseProfile):
                 action=action,
                 params=params,
                 chunk_size=chunk_size,
+                read_ahead=read_ahead,
             ):
                 yield chunk
 
@@ -484,11 +648,14 @@ class AsyncProfile(BaseProfile):
         action,
         params: Mapping = None,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> AsyncGenerator[str, None]:
         if action == Action.RUNSQL:
             raise ValueError("stream=True is not supported for run_sql")
         if chunk_size <= 0:
             raise ValueError("chunk_size must be greater than 0")
+        if read_ahead < 0:
+            raise ValueError("read_ahead cannot be negative")
 
         parameters = self._generate_parameters(prompt, action, params)
         data = await cr.callfunc(
@@ -499,13 +666,12 @@ class AsyncProfile(BaseProfile):
         if data is None:
             return
 
-        offset = 1
-        while True:
-            chunk = await data.read(offset=offset, amount=chunk_size)
-            if not chunk:
-                break
+        if read_ahead:
+            chunks = async_read_lob_ahead(data, chunk_size, read_ahead)
+        else:
+            chunks = async_read_lob(data, chunk_size)
+        async for chunk in chunks:
             yield chunk
-            offset += len(chunk)
 
     async def generate(
         self,
@@ -514,6 +680,7 @@ class AsyncProfile(BaseProfile):
         params: Mapping = None,
         stream: bool = False,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> Union[pandas.DataFrame, str, AsyncGenerator[str, None], None]:
         """Asynchronously perform AI translation using this profile
 
@@ -523,14 +690,40 @@ class AsyncProfile(BaseProfile):
          conversation_id for context-aware chats
         :param bool stream: Return an async iterator of response chunks
         :param int chunk_size: Number of characters to read per stream chunk
+        :param int read_ahead: Number of stream chunks read ahead of the
+         consumer in the background. Chunks then start at chunk_size and
+         grow. Default value is 0 i.e. no read-ahead
         :return: Union[pandas.DataFrame, str]
         """
         if stream:
-            return self._generate_stream(prompt, action, params, chunk_size)
-        async with async_cursor() as cr:
-            return await self._generate_with_cursor(
-                cr, prompt=prompt, action=action, params=params
+            return self._generate_stream(
+                prompt, action, params, chunk_size, read_ahead
+            )
+        response_cache = self.response_cache
+        if response_cache is not None:
+            result = await response_cache.async_lookup(
+                self, prompt, action, params
             )
+            if result is not None:
+                return result
+
+        async def _generate():
+            async with async_cursor() as cr:
+                result = await self._generate_with_cursor(
+                    cr, prompt=prompt, action=action, params=params
+                )
+            if response_cache is not None:
+                await response_cache.async_store(
+                    self, prompt, action, params, result
+                )
+            return result
+
+        # Identical concurrent requests share one database call when
+        # coalescing is enabled
+        return await __async_single_flight__.do(
+            await async_request_key(self, prompt, action, params),
+            _generate,
+        )
 
     async def chat(
         self,
@@ -538,6 +731,7 @@ class AsyncProfile(BaseProfile):
         params: Mapping = None,
         stream: bool = False,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> Union[str, AsyncGenerator[str, None]]:
         """Asynchronously chat with the LLM
 
@@ -545,6 +739,9 @@ class AsyncProfile(BaseProfile):
         :param params: Parameters to include in the LLM request
         :param bool stream: Return an async iterator of response chunks
         :param int chunk_size: Number of characters to read per stream chunk
+        :param int read_ahead: Number of stream chunks read ahead of the
+         consumer in the background. Chunks then start at chunk_size and
+         grow. Default value is 0 i.e. no read-ahead
         :return: str
         """
         return await self.generate(
@@ -553,19 +750,32 @@ class AsyncProfile(BaseProfile):
             params=params,
             stream=stream,
             chunk_size=chunk_size,
+            read_ahead=read_ahead,
         )
 
     @asynccontextmanager
     async def chat_session(
-        self, conversation: AsyncConversation, delete: bool = False
+        self,
+        conversation: AsyncConversation,
+        delete: bool = False,
+        lease_per_turn: bool = False,
+        affinity: bool = False,
     ):
         """Starts a new chat session for context-aware conversations
 
         :param AsyncConversation conversation: Conversation object to use for this
          chat session
         :param bool delete: Delete conversation after session ends
+        :param bool lease_per_turn: Acquire a pooled connection for every
+         request and release it right after, instead of holding one
+         connection for the whole session
+        :param bool affinity: Not supported. Async connections always use
+         python-oracledb Thin mode, which ignores pool tags
+        :raises: ValueError if affinity is True
 
         """
+        if affinity:
+            raise ValueError(AFFINITY_NOT_SUPPORTED)
         try:
             if (
                 conversation.conversation_id is None
@@ -574,7 +784,9 @@ class AsyncProfile(BaseProfile):
                 await conversation.create()
             params = {"conversation_id": conversation.conversation_id}
             async with AsyncSession(
-                async_profile=self, params=params
+                async_profile=self,
+                params=params,
+                lease_per_turn=lease_per_turn,
             ) as async_session:
                 yield async_session
         finally:
@@ -587,6 +799,7 @@ class AsyncProfile(BaseProfile):
         params: Mapping = None,
         stream: bool = False,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> Union[str, AsyncGenerator[str, None]]:
         """Narrate the result of the SQL
 
@@ -594,6 +807,9 @@ class AsyncProfile(BaseProfile):
         :param params: Parameters to include in the LLM request
         :param bool stream: Return an async iterator of response chunks
         :param int chunk_size: Number of characters to read per stream chunk
+        :param int read_ahead: Number of stream chunks read ahead of the
+         consumer in the background. Chunks then start at chunk_size and
+         grow. Default value is 0 i.e. no read-ahead
         :return: str
         """
         return await self.generate(
@@ -602,6 +818,7 @@ class AsyncProfile(BaseProfile):
             params=params,
             stream=stream,
             chunk_size=chunk_size,
+            read_ahead=read_ahead,
         )
 
     async def explain_sql(
@@ -610,6 +827,7 @@ class AsyncProfile(BaseProfile):
         params: Mapping = None,
         stream: bool = False,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ):
         """Explain the generated SQL
 
@@ -617,6 +835,9 @@ class AsyncProfile(BaseProfile):
         :param params: Parameters to include in the LLM request
         :param bool stream: Return an async iterator of response chunks
         :param int chunk_size: Number of characters to read per stream chunk
+        :param int read_ahead: Number of stream chunks read ahead of the
+         consumer in the background. Chunks then start at chunk_size and
+         grow. Default value is 0 i.e. no read-ahead
         :return: str
         """
         return await self.generate(
@@ -625,25 +846,170 @@ class AsyncProfile(BaseProfile):
             params=params,
             stream=stream,
             chunk_size=chunk_size,
+            read_ahead=read_ahead,
         )
 
     async def run_sql(
-        self, prompt, params: Mapping = None
-    ) -> pandas.DataFrame:
+        self,
+        prompt,
+        params: Mapping = None,
+        execute_locally: bool = False,
+        output_type: str = "pandas",
+    ) -> Union[pandas.DataFrame, "pyarrow.Table"]:
         """Explain the generated SQL
 
+        With execute_locally, only the SQL is generated and it is then
+        executed on the same connection with python-oracledb's DataFrame
+        fetch, which keeps the column types. This requires pyarrow
+
         :param str prompt: Natural language prompt
         :param params: Parameters to include in the LLM request
-        :return: pandas.DataFrame
+        :param bool execute_locally: Execute the generated SQL from
+         python-oracledb
+        :param str output_type: "pandas" for a pandas.DataFrame or "arrow"
+         for a pyarrow.Table. Only used with execute_locally
+        :return: pandas.DataFrame, or pyarrow.Table with execute_locally and
+         output_type "arrow"
         """
+        if execute_locally or self.query_guard is not None:
+            validate_output_type(output_type)
+            result = await self.generate_and_run(prompt, params, output_type)
+            return result.data
         return await self.generate(prompt, action=Action.RUNSQL, params=params)
 
+    async def generate_and_run(
+        self,
+        prompt: str,
+        params: Mapping = None,
+        output_type: str = "pandas",
+    ) -> SQLResult:
+        """Generate the SQL for a prompt with a single LLM call and execute
+        it locally on the same connection. Returns both the SQL and its
+        result set, with the time spent in each phase. If the profile has a
+        response cache, the generated SQL is looked up and stored in it.
+        This requires pyarrow
+
+        :param str prompt: Natural language prompt
+        :param params: Parameters to include in the LLM request
+        :param str output_type: "pandas" for a pandas.DataFrame or "arrow"
+         for a pyarrow.Table
+        :return: select_ai.SQLResult
+        """
+        validate_output_type(output_type)
+        response_cache = self.response_cache
+        async with async_get_connection() as async_connection:
+            started_at = time.perf_counter()
+            sql = None
+            if response_cache is not None:
+                sql = await response_cache.async_lookup(
+                    self, prompt, Action.SHOWSQL, params
+                )
+            if sql is None:
+                cr = async_connection.cursor()
+                try:
+                    sql = await self._generate_with_cursor(
+                        cr, prompt=prompt, action=Action.SHOWSQL, params=params
+                    )
+                finally:
+                    cr.close()
+                if response_cache is not None:
+                    await response_cache.async_store(
+                        self, prompt, Action.SHOWSQL, params, sql
+                    )
+            generated_at = time.perf_counter()
+            query = validate_generated_query(sql)
+            query_guard = self.query_guard
+            plan = None
+            if query_guard is not None:
+                query, plan = await query_guard.async_check(
+                    async_connection, query
+                )
+            with call_timeout_for(query_guard, async_connection):
+                batches = async_connection.fetch_df_batches(
+                    query, size=DATAFRAME_ARRAYSIZE
+                )
+                odfs = []
+                async for odf in batches:
+                    odfs.append(odf)
+                    if len(odfs) == 1:
+                        executed_at = time.perf_counter()
+                if not odfs:
+                    executed_at = time.perf_counter()
+            data = convert_oracle_df_batches_to_output_type(odfs, output_type)
+        return SQLResult(
+            sql=sql,
+            data=data,
+            llm_time=generated_at - started_at,
+            execution_time=executed_at - generated_at,
+            fetch_time=time.perf_counter() - executed_at,
+            plan=plan,
+        )
+
+    async def run_sql_batches(
+        self,
+        prompt: str,
+        params: Mapping = None,
+        batch_size: int = DATAFRAME_ARRAYSIZE,
+        max_rows: Optional[int] = None,
+        output_type: str = "pandas",
+    ) -> AsyncGenerator[Any, None]:
+        """Generate the SQL for a prompt, execute it locally and yield the
+        result set in batches of batch_size rows, so that memory use does
+        not depend on the size of the result set. A connection is held
+        until the generator is exhausted or closed. This requires pyarrow
+
+        :param str prompt: Natural language prompt
+        :param params: Parameters to include in the LLM request
+        :param int batch_size: Number of rows fetched per round trip and
+         per yielded batch
+        :param int max_rows: Stop after this many rows. Defaults to no
+         limit
+        :param str output_type: "pandas" to yield pandas.DataFrame batches
+         or "arrow" to yield pyarrow.RecordBatch batches
+        :return: AsyncGenerator of batches
+        """
+        validate_output_type(output_type)
+        validate_batch_params(batch_size, max_rows)
+        rows_left = max_rows
+        async with async_get_connection() as async_connection:
+            cr = async_connection.cursor()
+            try:
+                sql = await self._generate_with_cursor(
+                    cr, prompt=prompt, action=Action.SHOWSQL, params=params
+                )
+            finally:
+                cr.close()
+            query = validate_generated_query(sql)
+            query_guard = self.query_guard
+            if query_guard is not None:
+                query, _ = await query_guard.async_check(
+                    async_connection, query
+                )
+            if rows_left == 0:
+                return
+            async for odf in async_guarded_batches(
+                query_guard,
+                async_connection,
+                async_connection.fetch_df_batches(query, size=batch_size),
+            ):
+                batch = convert_oracle_df_batch_to_output_type(
+                    odf, output_type, rows_left
+                )
+                if batch is None:
+                    continue
+                yield batch
+                if rows_left is not None:
+                    rows_left -= len(batch)
+                    if rows_left == 0:
+                        return
+
     async def show_sql(
         self,
         prompt,
         params: Mapping = None,
         stream: bool = False,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ):
         """Show the generated SQL
 
@@ -651,6 +1017,9 @@ class AsyncProfile(BaseProfile):
         :param params: Parameters to include in the LLM request
         :param bool stream: Return an async iterator of response chunks
         :param int chunk_size: Number of characters to read per stream chunk
+        :param int read_ahead: Number of stream chunks read ahead of the
+         consumer in the background. Chunks then start at chunk_size and
+         grow. Default value is 0 i.e. no read-ahead
         :return: str
         """
         return await self.generate(
@@ -659,6 +1028,7 @@ class AsyncProfile(BaseProfile):
             params=params,
             stream=stream,
             chunk_size=chunk_size,
+            read_ahead=read_ahead,
         )
 
     async def show_prompt(
@@ -667,6 +1037,7 @@ class AsyncProfile(BaseProfile):
         params: Mapping = None,
         stream: bool = False,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ):
         """Show the prompt sent to LLM
 
@@ -674,6 +1045,9 @@ class AsyncProfile(BaseProfile):
         :param params: Parameters to include in the LLM request
         :param bool stream: Return an async iterator of response chunks
         :param int chunk_size: Number of characters to read per stream chunk
+        :param int read_ahead: Number of stream chunks read ahead of the
+         consumer in the background. Chunks then start at chunk_size and
+         grow. Default value is 0 i.e. no read-ahead
         :return: str
         """
         return await self.generate(
@@ -682,6 +1056,7 @@ class AsyncProfile(BaseProfile):
             params=params,
             stream=stream,
             chunk_size=chunk_size,
+            read_ahead=read_ahead,
         )
 
     async def summarize(
@@ -713,12 +1088,9 @@ class AsyncProfile(BaseProfile):
         )
         parameters["profile_name"] = self.profile_name
         async with async_cursor() as cr:
-            data = await cr.callfunc(
-                "DBMS_CLOUD_AI.SUMMARIZE",
-                oracledb.DB_TYPE_CLOB,
-                keyword_parameters=parameters,
+            return await async_callfunc_clob(
+                cr, "DBMS_CLOUD_AI.SUMMARIZE", parameters
             )
-        return await data.read() if data else None
 
     async def generate_synthetic_data(
         self, synthetic_data_attributes: SyntheticDataAttributes
@@ -748,20 +1120,29 @@ class AsyncProfile(BaseProfile):
                 keyword_parameters=keyword_parameters,
             )
 
-    async def run_pipeline(
+    async def _run_pipeline_chunk(
         self,
         prompt_specifications: List[Tuple[str, Action]],
-        continue_on_error: bool = False,
+        continue_on_error: bool,
+        convert_runsql: bool = False,
     ) -> List[Union[str, pandas.DataFrame]]:
-        """Send Multiple prompts in a single roundtrip to the Database
+        """Runs one pipeline on one connection and reads its responses.
+        With convert_runsql, RUNSQL responses are returned as DataFrames
+        """
 
-        :param List[Tuple[str, Action]] prompt_specifications: List of
-         2-element tuples. First element is the prompt and second is the
-         corresponding action
+        async def read(result, action):
+            if result.error:
+                return result.error
+            data = result.return_value
+            if data is not None:
+                data = await data.read()
+            if convert_runsql and action == Action.RUNSQL:
+                try:
+                    return convert_json_rows_to_df(data)
+                except InvalidSQLError as e:
+                    return e
+            return data
 
-        :param bool continue_on_error: True to continue on error else False
-        :return: List[Union[str, pandas.DataFrame]]
-        """
         pipeline = oracledb.create_pipeline()
         for prompt, action in prompt_specifications:
             parameters = {
@@ -779,15 +1160,164 @@ class AsyncProfile(BaseProfile):
             pipeline_results = await async_connection.run_pipeline(
                 pipeline, continue_on_error=continue_on_error
             )
-        responses = []
-        for result in pipeline_results:
-            if not result.error:
-                lob_data = result.return_value
-                data = await lob_data.read()
-                responses.append(data)
-            else:
-                responses.append(result.error)
-        return responses
+            # LOBs are read before the connection goes back to the pool.
+            # Reads on one connection are serialized, so they are awaited
+            # in turn
+            return [
+                await read(result, action)
+                for result, (_, action) in zip(
+                    pipeline_results, prompt_specifications
+                )
+            ]
+
+    def _schedule_pipeline_chunks(
+        self,
+        prompt_specifications: List[Tuple[str, Action]],
+        continue_on_error: bool,
+        batch_size: Optional[int],
+        concurrency: Optional[int],
+        convert_runsql: bool = False,
+        timings: Optional[List[PipelineChunkTiming]] = None,
+    ) -> List[asyncio.Future]:
+        """Splits the prompts into pipelines of at most batch_size prompts
+        and starts a task per pipeline. At most concurrency pipelines run at
+        the same time. Each task returns the offset of its first prompt and
+        its responses. The timing of each pipeline is appended to timings
+        """
+        if batch_size is None:
+            batch_size = max(len(prompt_specifications), 1)
+        elif batch_size < 1:
+            raise ValueError("'batch_size' must be a positive integer")
+        if concurrency is None:
+            concurrency = AsyncConnectionManager().max_connections
+        elif concurrency < 1:
+            raise ValueError("'concurrency' must be a positive integer")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_chunk(index: int, offset: int):
+            chunk = prompt_specifications[offset : offset + batch_size]
+            queued_at = time.perf_counter()
+            async with semaphore:
+                started_at = time.perf_counter()
+                responses = await self._run_pipeline_chunk(
+                    chunk, continue_on_error, convert_runsql=convert_runsql
+                )
+            if timings is not None:
+                timings.append(
+                    PipelineChunkTiming(
+                        index=index,
+                        offset=offset,
+                        size=len(chunk),
+                        queued=started_at - queued_at,
+                        elapsed=time.perf_counter() - started_at,
+                    )
+                )
+            return offset, responses
+
+        offsets = range(0, len(prompt_specifications), batch_size)
+        return [
+            asyncio.ensure_future(run_chunk(index, offset))
+            for index, offset in enumerate(offsets)
+        ]
+
+    @staticmethod
+    async def _cancel_pipeline_chunks(tasks: List[asyncio.Future]):
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run_pipeline(
+        self,
+        prompt_specifications: List[Tuple[str, Action]],
+        continue_on_error: bool = False,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        timings: Optional[List[PipelineChunkTiming]] = None,
+    ) -> List[Union[str, pandas.DataFrame]]:
+        """Send Multiple prompts in a single roundtrip to the Database
+
+        With batch_size, the prompts are split into pipelines of at most
+        batch_size prompts which run concurrently, each on its own pooled
+        connection. Responses are returned in the order of
+        prompt_specifications
+
+        :param List[Tuple[str, Action]] prompt_specifications: List of
+         2-element tuples. First element is the prompt and second is the
+         corresponding action
+
+        :param bool continue_on_error: True to continue on error else False
+        :param int batch_size: Maximum number of prompts per pipeline.
+         Defaults to a single pipeline for all prompts
+        :param int concurrency: Maximum number of pipelines running at the
+         same time. Defaults to the maximum size of the connection pool, or
+         the max_connections passed to select_ai.async_connect()
+        :param list timings: List to which the PipelineChunkTiming of each
+         pipeline of this call is appended, in pipeline order
+        :return: List[Union[str, pandas.DataFrame]]
+        """
+        call_timings = [] if timings is not None else None
+        tasks = self._schedule_pipeline_chunks(
+            list(prompt_specifications),
+            continue_on_error,
+            batch_size,
+            concurrency,
+            timings=call_timings,
+        )
+        try:
+            chunk_responses = await asyncio.gather(*tasks)
+        except BaseException:
+            await self._cancel_pipeline_chunks(tasks)
+            raise
+        if timings is not None:
+            call_timings.sort(key=lambda timing: timing.index)
+            timings.extend(call_timings)
+        return [
+            response
+            for _, responses in chunk_responses
+            for response in responses
+        ]
+
+    async def run_pipeline_iter(
+        self,
+        prompt_specifications: List[Tuple[str, Action]],
+        continue_on_error: bool = False,
+        batch_size: int = 10,
+        concurrency: Optional[int] = None,
+        timings: Optional[List[PipelineChunkTiming]] = None,
+    ) -> AsyncGenerator[Tuple[int, Union[str, pandas.DataFrame]], None]:
+        """Send multiple prompts in pipelines of batch_size prompts and
+        yield the responses of each pipeline as soon as it completes, so a
+        slow prompt only holds back the prompts of its own pipeline. RUNSQL
+        responses are yielded as DataFrames
+
+        :param List[Tuple[str, Action]] prompt_specifications: List of
+         2-element tuples. First element is the prompt and second is the
+         corresponding action
+        :param bool continue_on_error: True to continue on error else False
+        :param int batch_size: Maximum number of prompts per pipeline
+        :param int concurrency: Maximum number of pipelines running at the
+         same time. Defaults to the maximum size of the connection pool, or
+         the max_connections passed to select_ai.async_connect()
+        :param list timings: List to which the PipelineChunkTiming of each
+         pipeline of this call is appended as it completes
+        :return: AsyncGenerator of (index, response) tuples, where index is
+         the position of the prompt in prompt_specifications
+        """
+        tasks = self._schedule_pipeline_chunks(
+            list(prompt_specifications),
+            continue_on_error,
+            batch_size,
+            concurrency,
+            convert_runsql=True,
+            timings=timings,
+        )
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                offset, responses = await next_completed
+                for position, response in enumerate(responses):
+                    yield offset + position, response
+        finally:
+            await self._cancel_pipeline_chunks(tasks)
 
     async def translate(
         self, text: str, source_language: str, target_language: str
@@ -807,48 +1337,90 @@ class AsyncProfile(BaseProfile):
             "target_language": target_language,
         }
         async with async_cursor() as cr:
-            data = await cr.callfunc(
-                "DBMS_CLOUD_AI.TRANSLATE",
-                oracledb.DB_TYPE_CLOB,
-                keyword_parameters=parameters,
+            return await async_callfunc_clob(
+                cr, "DBMS_CLOUD_AI.TRANSLATE", parameters
             )
-        if data is not None:
-            result = await data.read()
-            return result
-        return None
 
 
 class AsyncSession:
     """AsyncSession lets you persist request parameters across DBMS_CLOUD_AI
     requests. This is useful in context-aware conversations
+
+    By default the session holds one connection from entry to exit. With
+    lease_per_turn=True it only holds its parameters, e.g. the
+    conversation_id, and every request acquires a pooled connection which
+    is released as soon as the response is read
     """
 
-    def __init__(self, async_profile: AsyncProfile, params: Mapping):
+    def __init__(
+        self,
+        async_profile: AsyncProfile,
+        params: Mapping,
+        lease_per_turn: bool = False,
+        tag: Optional[str] = None,
+    ):
         """
 
         :param async_profile: An AI Profile to use in this session
         :param params: Parameters to be persisted across requests
+        :param bool lease_per_turn: Acquire a connection per request instead
+         of holding one for the whole session
+        :param str tag: Not supported. Async connections always use
+         python-oracledb Thin mode, which ignores pool tags
+        :raises: ValueError if tag is not None
         """
+        if tag is not None:
+            raise ValueError(AFFINITY_NOT_SUPPORTED)
         self.params = params
         self.async_profile = async_profile
+        self.lease_per_turn = lease_per_turn
+        self.tag = tag
         self._conn = None
         self._conn_cm = None
         self._cursor = None
 
+    @asynccontextmanager
+    async def _turn_cursor(self):
+        """Yields the cursor of the session's connection, or a cursor of a
+        connection leased for the current request only
+        """
+        if not self.lease_per_turn:
+            yield self._cursor
+            return
+        async with AsyncConnectionManager().get_connection(
+            tag=self.tag
+        ) as conn:
+            cr = conn.cursor()
+            try:
+                yield cr
+            finally:
+                cr.close()
+
+    async def _generate(self, prompt: str, action: Action):
+        async with self._turn_cursor() as cr:
+            return await self.async_profile._generate_with_cursor(
+                cr, prompt=prompt, action=action, params=self.params
+            )
+
+    async def _generate_stream(
+        self, prompt: str, action: Action, chunk_size: int
+    ) -> AsyncGenerator[str, None]:
+        async with self._turn_cursor() as cr:
+            async for chunk in self.async_profile._generate_stream_with_cursor(
+                cr,
+                prompt=prompt,
+                action=action,
+                params=self.params,
+                chunk_size=chunk_size,
+            ):
+                yield chunk
+
     async def chat(
         self, prompt: str, stream: bool = False, chunk_size: int = 8192
     ) -> Union[str, AsyncGenerator[str, None]]:
         if stream:
-            return self.async_profile._generate_stream_with_cursor(
-                self._cursor,
-                prompt=prompt,
-                action=Action.CHAT,
-                params=self.params,
-                chunk_size=chunk_size,
-            )
-        return await self.async_profile._generate_with_cursor(
-            self._cursor, prompt=prompt, action=Action.CHAT, params=self.params
-        )
+            return self._generate_stream(prompt, Action.CHAT, chunk_size)
+        return await self._generate(prompt, Action.CHAT)
 
     async def narrate(
         self, prompt, stream: bool = False, chunk_size: int = 8192
@@ -861,16 +1433,8 @@ class AsyncSession:
         :return: str
         """
         if stream:
-            return self.async_profile._generate_stream_with_cursor(
-                self._cursor,
-                prompt=prompt,
-                action=Action.NARRATE,
-                params=self.params,
-                chunk_size=chunk_size,
-            )
-        return await self.async_profile._generate_with_cursor(
-            self._cursor, prompt, action=Action.NARRATE, params=self.params
-        )
+            return self._generate_stream(prompt, Action.NARRATE, chunk_size)
+        return await self._generate(prompt, Action.NARRATE)
 
     async def explain_sql(
         self, prompt: str, stream: bool = False, chunk_size: int = 8192
@@ -883,16 +1447,8 @@ class AsyncSession:
         :return: str
         """
         if stream:
-            return self.async_profile._generate_stream_with_cursor(
-                self._cursor,
-                prompt=prompt,
-                action=Action.EXPLAINSQL,
-                params=self.params,
-                chunk_size=chunk_size,
-            )
-        return await self.async_profile._generate_with_cursor(
-            self._cursor, prompt, action=Action.EXPLAINSQL, params=self.params
-        )
+            return self._generate_stream(prompt, Action.EXPLAINSQL, chunk_size)
+        return await self._generate(prompt, Action.EXPLAINSQL)
 
     async def run_sql(self, prompt: str) -> pandas.DataFrame:
         """Explain the generated SQL
@@ -900,9 +1456,7 @@ class AsyncSession:
         :param str prompt: Natural language prompt
         :return: pandas.DataFrame
         """
-        return await self.async_profile._generate_with_cursor(
-            self._cursor, prompt, action=Action.RUNSQL, params=self.params
-        )
+        return await self._generate(prompt, Action.RUNSQL)
 
     async def show_sql(
         self, prompt, stream: bool = False, chunk_size: int = 8192
@@ -915,16 +1469,8 @@ class AsyncSession:
         :return: str
         """
         if stream:
-            return self.async_profile._generate_stream_with_cursor(
-                self._cursor,
-                prompt=prompt,
-                action=Action.SHOWSQL,
-                params=self.params,
-                chunk_size=chunk_size,
-            )
-        return await self.async_profile._generate_with_cursor(
-            self._cursor, prompt, action=Action.SHOWSQL, params=self.params
-        )
+            return self._generate_stream(prompt, Action.SHOWSQL, chunk_size)
+        return await self._generate(prompt, Action.SHOWSQL)
 
     async def show_prompt(
         self, prompt: str, stream: bool = False, chunk_size: int = 8192
@@ -937,21 +1483,14 @@ class AsyncSession:
         :return: str
         """
         if stream:
-            return self.async_profile._generate_stream_with_cursor(
-                self._cursor,
-                prompt=prompt,
-                action=Action.SHOWPROMPT,
-                params=self.params,
-                chunk_size=chunk_size,
-            )
-        return await self.async_profile._generate_with_cursor(
-            self._cursor, prompt, action=Action.SHOWPROMPT, params=self.params
-        )
+            return self._generate_stream(prompt, Action.SHOWPROMPT, chunk_size)
+        return await self._generate(prompt, Action.SHOWPROMPT)
 
     async def __aenter__(self):
-        self._conn_cm = AsyncConnectionManager().get_connection()
-        self._conn = await self._conn_cm.__aenter__()
-        self._cursor = self._conn.cursor()
+        if not self.lease_per_turn:
+            self._conn_cm = AsyncConnectionManager().get_connection()
+            self._conn = await self._conn_cm.__aenter__()
+            self._cursor = self._conn.cursor()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -5,23 +5,27 @@
 # http://oss.oracle.com/licenses/upl.
 # -----------------------------------------------------------------------------
 
+import copy
 import json
-from abc import ABC
+import re
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from dataclasses import replace as dataclass_replace
-from typing import List, Mapping, Optional, Tuple
+from typing import Any, List, Mapping, Optional, Tuple
 
 import oracledb
 import pandas
 
 from select_ai._abc import SelectAIDataClass
 from select_ai.action import Action
+from select_ai.cache import CacheStats, LRUCache, ResponseCache
 from select_ai.errors import InvalidSQLError, ProfileExistsError
 from select_ai.feedback import (
     FeedbackOperation,
     FeedbackType,
 )
 from select_ai.provider import Provider
+from select_ai.query_guard import PlanMetrics, QueryGuard
 from select_ai.summary import SummaryParams
 
 
@@ -168,8 +172,23 @@ class BaseProfile(ABC):
      ProfileEmptyAttributesError, if profile attributes are empty
      in database. Default value is False.
 
+    :param select_ai.cache.ResponseCache response_cache: Cache for
+     responses of generate(). Default value is None i.e. no caching
+
+    :param select_ai.QueryGuard query_guard: Checks the optimizer plan of
+     generated SQL before it is executed locally. Setting it makes run_sql()
+     execute the SQL locally. Default value is None i.e. no check
+
     """
 
+    # Process-wide cache of saved profile descriptions and attributes shared
+    # by Profile and AsyncProfile. Disabled until enable_metadata_cache()
+    _metadata_cache: Optional[LRUCache] = None
+
+    # Metadata fields, "attributes" and "description", of a lazy profile
+    # which were not read from the database yet
+    _unloaded: frozenset = frozenset()
+
     def __init__(
         self,
         profile_name: Optional[str] = None,
@@ -179,6 +198,8 @@ class BaseProfile(ABC):
         replace: Optional[bool] = False,
         raise_error_if_exists: Optional[bool] = True,
         raise_error_on_empty_attributes: Optional[bool] = False,
+        response_cache: Optional[ResponseCache] = None,
+        query_guard: Optional[QueryGuard] = None,
     ):
         """Initialize a base profile"""
         self.profile_name = profile_name
@@ -193,6 +214,100 @@ class BaseProfile(ABC):
         self.replace = replace
         self.raise_error_if_exists = raise_error_if_exists
         self.raise_error_on_empty_attributes = raise_error_on_empty_attributes
+        if response_cache is not None and not isinstance(
+            response_cache, ResponseCache
+        ):
+            raise TypeError(
+                "'response_cache' must be an object of type "
+                "select_ai.cache.ResponseCache"
+            )
+        self.response_cache = response_cache
+        if query_guard is not None and not isinstance(query_guard, QueryGuard):
+            raise TypeError(
+                "'query_guard' must be an object of type select_ai.QueryGuard"
+            )
+        self.query_guard = query_guard
+
+    @property
+    def attributes(self) -> Optional[ProfileAttributes]:
+        if "attributes" in self._unloaded:
+            self._load_metadata()
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, attributes: Optional[ProfileAttributes]):
+        self._attributes = attributes
+        self._unloaded = self._unloaded - {"attributes"}
+
+    @property
+    def description(self) -> Optional[str]:
+        if "description" in self._unloaded:
+            self._load_metadata()
+        return self._description
+
+    @description.setter
+    def description(self, description: Optional[str]):
+        self._description = description
+        self._unloaded = self._unloaded - {"description"}
+
+    @property
+    def is_loaded(self) -> bool:
+        """False for a lazy profile whose description or attributes were
+        not read from the database yet
+        """
+        return not self._unloaded
+
+    @abstractmethod
+    def _load_metadata(self) -> None:
+        """Reads the unloaded metadata of a lazy profile"""
+
+    def _set_metadata(
+        self,
+        description: Optional[str],
+        attributes: Optional[ProfileAttributes],
+    ) -> None:
+        """Sets the metadata read for a lazy profile. Fields assigned since
+        the profile was created are kept
+        """
+        if "description" in self._unloaded:
+            self._description = description
+        if "attributes" in self._unloaded:
+            self._attributes = attributes
+        self._unloaded = frozenset()
+
+    def _loaded_attributes(self) -> Optional[ProfileAttributes]:
+        """Returns the attributes without reading those of a lazy profile,
+        which are None until they are loaded
+        """
+        return self._attributes
+
+    def _init_lazy(self, profile_name: str, **kwargs) -> None:
+        BaseProfile.__init__(
+            self,
+            profile_name=profile_name,
+            raise_error_if_exists=False,
+            **kwargs,
+        )
+        self._unloaded = frozenset(("attributes", "description"))
+
+    def _batch_procedure(self) -> Tuple[str, Mapping]:
+        """Returns the procedure which saves the attribute changes collected
+        by a batch, and its parameters other than the attributes
+        """
+        return "DBMS_CLOUD_AI.SET_ATTRIBUTES", {
+            "profile_name": self.profile_name
+        }
+
+    def _apply_attributes(self, attributes: Mapping) -> None:
+        """Applies attribute changes saved by a batch. A lazy profile whose
+        attributes are not loaded yet reads them, changes included, on
+        first access
+        """
+        self.invalidate_metadata_cache(self.profile_name)
+        profile_attributes = self._loaded_attributes()
+        if profile_attributes is not None:
+            for name, value in attributes.items():
+                profile_attributes.set_attribute(name, value)
 
     def _raise_error_if_profile_exists(self):
         """
@@ -221,7 +336,121 @@ class BaseProfile(ABC):
                     **self.attributes.dict(exclude_null=True),
                 )
 
+    @staticmethod
+    def enable_metadata_cache(
+        max_size: int = 128, ttl: Optional[float] = 300
+    ) -> None:
+        """Cache the description and attributes of saved profiles in this
+        process, so that instantiating a profile by name does not query
+        the database. Entries are invalidated when the profile is
+        created, updated or deleted through this process; changes made
+        elsewhere are picked up once the entry expires
+
+        :param int max_size: Maximum number of profiles to cache. Least
+         recently used profiles are evicted first
+        :param float ttl: Number of seconds an entry stays valid. None
+         means entries never expire
+        """
+        BaseProfile._metadata_cache = LRUCache(max_size=max_size, ttl=ttl)
+
+    @staticmethod
+    def disable_metadata_cache() -> None:
+        """Disable and drop the profile metadata cache"""
+        BaseProfile._metadata_cache = None
+
+    @staticmethod
+    def invalidate_metadata_cache(profile_name: Optional[str] = None) -> None:
+        """Remove a profile from the metadata cache
+
+        :param str profile_name: Name of the profile. If None, all profiles
+         are removed
+        """
+        cache = BaseProfile._metadata_cache
+        if cache is None:
+            return
+        if profile_name is None:
+            cache.clear()
+        else:
+            cache.invalidate(profile_name.upper())
+
+    @staticmethod
+    def metadata_cache_stats(reset: bool = False) -> Optional[CacheStats]:
+        """Returns the hit and miss counters of the metadata cache, or None
+        if the cache is disabled
+
+        :param bool reset: Reset the counters after taking the snapshot
+        :return: select_ai.cache.CacheStats
+        """
+        cache = BaseProfile._metadata_cache
+        if cache is None:
+            return None
+        return cache.stats(reset=reset)
+
+    @staticmethod
+    def _cached_metadata(
+        profile_name: str,
+    ) -> Optional[Tuple[Optional[str], Optional[ProfileAttributes]]]:
+        """Returns a copy of the cached (description, attributes) of a
+        profile, or None on a cache miss
+        """
+        cache = BaseProfile._metadata_cache
+        if cache is None:
+            return None
+        metadata = cache.get(profile_name.upper())
+        return copy.deepcopy(metadata)
+
+    @staticmethod
+    def _cache_metadata(
+        profile_name: str,
+        description: Optional[str],
+        attributes: Optional[ProfileAttributes],
+    ) -> None:
+        cache = BaseProfile._metadata_cache
+        if cache is not None:
+            cache.put(
+                profile_name.upper(),
+                copy.deepcopy((description, attributes)),
+            )
+
+    @classmethod
+    def _from_row(
+        cls,
+        profile_name: str,
+        description: Optional[str],
+        attributes: Optional[str],
+    ):
+        """Builds a profile object from a row of
+        LIST_USER_AI_PROFILES_WITH_ATTRIBUTES without querying the database
+        again
+
+        :param str profile_name: Name of the profile
+        :param str description: Description of the profile
+        :param str attributes: Profile attributes aggregated as a JSON object
+        """
+        profile = cls.__new__(cls)
+        BaseProfile.__init__(
+            profile,
+            profile_name=profile_name,
+            attributes=(
+                ProfileAttributes.create(**json.loads(attributes))
+                if attributes
+                else None
+            ),
+            description=description,
+            raise_error_if_exists=False,
+        )
+        cls._cache_metadata(
+            profile_name, profile.description, profile.attributes
+        )
+        return profile
+
     def __repr__(self):
+        if self._unloaded:
+            # repr() of a lazy profile must not query the database
+            return (
+                f"{self.__class__.__name__}(profile_name={self.profile_name}, "
+                f"loaded=False)"
+            )
         return (
             f"{self.__class__.__name__}(profile_name={self.profile_name}, "
             f"attributes={self.attributes}, description={self.description})"
@@ -312,3 +541,112 @@ def convert_json_rows_to_df(result):
         raise InvalidSQLError(result)
     else:
         return pandas.DataFrame(rows)
+
+
+@dataclass
+class SQLResult:
+    """SQL generated for a prompt together with its result set, returned by
+    generate_and_run()
+
+    :param str sql: SQL generated for the prompt
+    :param data: Result set of the SQL, a pandas.DataFrame or a
+     pyarrow.Table
+    :param float llm_time: Seconds spent generating the SQL
+    :param float execution_time: Seconds spent executing the SQL until the
+     first batch of rows was fetched
+    :param float fetch_time: Seconds spent fetching the remaining rows and
+     building data
+    :param select_ai.PlanMetrics plan: Plan metrics recorded by the
+     profile's query guard, if any
+    """
+
+    sql: str
+    data: Any
+    llm_time: float
+    execution_time: float
+    fetch_time: float
+    plan: Optional[PlanMetrics] = None
+
+    @property
+    def total_time(self) -> float:
+        return self.llm_time + self.execution_time + self.fetch_time
+
+
+_QUERY_PATTERN = re.compile(r"^[\s(]*(SELECT|WITH)\b", re.IGNORECASE)
+
+OUTPUT_TYPES = ("pandas", "arrow")
+
+
+def validate_output_type(output_type: str) -> None:
+    if output_type not in OUTPUT_TYPES:
+        raise ValueError(
+            f"'output_type' must be one of {', '.join(OUTPUT_TYPES)}"
+        )
+
+
+def validate_generated_query(sql: Optional[str]) -> str:
+    """Returns the SQL generated for a prompt without its trailing
+    semicolon. Only queries are executed locally, anything else raises
+    InvalidSQLError
+    """
+    query = (sql or "").strip().rstrip(";").rstrip()
+    if not _QUERY_PATTERN.match(query):
+        raise InvalidSQLError(sql or "No SQL generated for the prompt")
+    return query
+
+
+def import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Executing the generated SQL locally requires pyarrow. "
+            "Install it with: pip install 'select_ai[arrow]'"
+        ) from None
+    return pyarrow
+
+
+def convert_oracle_df_batches_to_output_type(
+    odfs: List[Any], output_type: str = "pandas"
+) -> Any:
+    """Concatenates the batches fetched by fetch_df_batches() into a
+    pyarrow.Table or, by default, into a pandas.DataFrame. The column types
+    fetched from the database are kept
+    """
+    pyarrow = import_pyarrow()
+    tables = [pyarrow.table(odf) for odf in odfs]
+    table = pyarrow.concat_tables(tables) if tables else pyarrow.table({})
+    if output_type == "arrow":
+        return table
+    return table.to_pandas()
+
+
+def convert_oracle_df_batch_to_output_type(
+    odf, output_type: str = "pandas", max_rows: Optional[int] = None
+) -> Any:
+    """Converts a batch fetched by fetch_df_batches() to a
+    pyarrow.RecordBatch or, by default, to a pandas.DataFrame holding at
+    most max_rows rows. Returns None for an empty batch
+    """
+    table = import_pyarrow().table(odf)
+    if max_rows is not None and table.num_rows > max_rows:
+        table = table.slice(0, max_rows)
+    if table.num_rows == 0:
+        return None
+    if output_type == "arrow":
+        return table.combine_chunks().to_batches()[0]
+    return table.to_pandas()
+
+
+def validate_batch_params(batch_size: int, max_rows: Optional[int]) -> None:
+    if batch_size < 1:
+        raise ValueError("'batch_size' must be a positive integer")
+    if max_rows is not None and max_rows < 0:
+        raise ValueError("'max_rows' cannot be negative")
+
+
+def conversation_tag(conversation_id: str) -> str:
+    """Returns the pool tag of connections used by a conversation, in the
+    name=value format expected by python-oracledb
+    """
+    return f"select_ai_conversation_id={conversation_id}"
@@ -0,0 +1,288 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+import contextlib
+import contextvars
+import json
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Generator,
+    Mapping,
+    Tuple,
+    Union,
+)
+
+from select_ai._abc import SelectAIDataClass
+from select_ai.db import async_cursor, cursor
+from select_ai.provider import Provider
+
+__all__ = [
+    "AsyncBatchUpdateMixin",
+    "AttributeBatch",
+    "BatchUpdateMixin",
+    "async_batch_update",
+    "async_pending_batch",
+    "batch_update",
+    "pending_batch",
+]
+
+# Batch collecting the attribute changes of sync objects made by the
+# current thread or task
+__attribute_batch__: contextvars.ContextVar = contextvars.ContextVar(
+    "select_ai_attribute_batch", default=None
+)
+
+# Batch collecting the attribute changes of async objects made by the
+# current task
+__async_attribute_batch__: contextvars.ContextVar = contextvars.ContextVar(
+    "select_ai_async_attribute_batch", default=None
+)
+
+
+def _attributes_json(attributes: Mapping[str, Any]) -> str:
+    """Serializes the pending attribute changes of one object the way the
+    SET_ATTRIBUTES procedures expect them. Provider values are flattened
+    into the provider attributes, like ProfileAttributes.json() does
+    """
+    values = {}
+    for name, value in attributes.items():
+        if isinstance(value, Provider):
+            for provider_k, provider_v in value.dict().items():
+                values[Provider.key_alias(provider_k)] = provider_v
+        elif isinstance(value, SelectAIDataClass):
+            values[name] = value.dict()
+        else:
+            values[name] = value
+    return json.dumps(values)
+
+
+class _PendingUpdate:
+    """Attribute changes of one object waiting for the batch to flush"""
+
+    __slots__ = ("obj", "attributes")
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.attributes: Dict[str, Any] = {}
+
+
+class AttributeBatch:
+    """Attribute changes collected by batch_update() or
+    async_batch_update(). Changes are keyed by object, so setting an
+    attribute twice only saves the last value
+
+    :param objects: Objects whose changes are collected. When empty, the
+     changes of every object are collected
+    """
+
+    def __init__(self, *objects):
+        self._objects = {id(obj) for obj in objects} or None
+        self._pending: Dict[int, _PendingUpdate] = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(objects={len(self)})"
+
+    def accepts(self, obj) -> bool:
+        return self._objects is None or id(obj) in self._objects
+
+    def add(
+        self,
+        obj,
+        attributes: Union[Mapping[str, Any], SelectAIDataClass],
+    ):
+        """Records attribute changes of obj, to be saved when the batch is
+        flushed
+
+        :param obj: Profile, vector index or agent object
+        :param attributes: Attribute names and their new values, or an
+         attributes object whose non-null fields are the changes
+        """
+        if isinstance(attributes, SelectAIDataClass):
+            # vars() keeps nested objects such as Provider and ToolParams,
+            # which dict() may already have converted
+            attributes = {
+                k: v for k, v in vars(attributes).items() if v is not None
+            }
+        pending = self._pending.get(id(obj))
+        if pending is None:
+            # The update holds a reference to obj, so its id() cannot be
+            # reused by another object while the batch is open
+            pending = self._pending[id(obj)] = _PendingUpdate(obj)
+        pending.attributes.update(attributes)
+
+    def _statement(self) -> Tuple[str, Dict[str, Any]]:
+        """Returns an anonymous PL/SQL block which calls the SET_ATTRIBUTES
+        procedure of every pending object, and its bind values
+        """
+        calls = []
+        parameters = {}
+        for index, pending in enumerate(self._pending.values()):
+            procedure, keyword_parameters = pending.obj._batch_procedure()
+            keyword_parameters = dict(
+                keyword_parameters,
+                attributes=_attributes_json(pending.attributes),
+            )
+            arguments = []
+            for key, value in keyword_parameters.items():
+                bind_name = f"p{index}_{key}"
+                arguments.append(f"{key} => :{bind_name}")
+                parameters[bind_name] = value
+            calls.append(f"    {procedure}({', '.join(arguments)});")
+        return "BEGIN\n" + "\n".join(calls) + "\nEND;", parameters
+
+    def _apply(self):
+        """Applies the saved changes to the objects without reading their
+        attributes back from the database
+        """
+        for pending in self._pending.values():
+            pending.obj._apply_attributes(pending.attributes)
+        self._pending.clear()
+
+    def flush(self):
+        """Saves all pending changes in a single round trip"""
+        if not self._pending:
+            return
+        statement, parameters = self._statement()
+        with cursor() as cr:
+            cr.execute(statement, parameters)
+        self._apply()
+
+    async def async_flush(self):
+        """Async counterpart of flush()"""
+        if not self._pending:
+            return
+        statement, parameters = self._statement()
+        async with async_cursor() as cr:
+            await cr.execute(statement, parameters)
+        self._apply()
+
+
+def pending_batch(obj):
+    """Returns the open batch collecting the changes of the sync object obj,
+    or None if its changes must be saved right away
+    """
+    batch = __attribute_batch__.get()
+    if batch is not None and batch.accepts(obj):
+        return batch
+    return None
+
+
+def async_pending_batch(obj):
+    """Returns the open batch collecting the changes of the async object
+    obj, or None if its changes must be saved right away
+    """
+    batch = __async_attribute_batch__.get()
+    if batch is not None and batch.accepts(obj):
+        return batch
+    return None
+
+
+@contextlib.contextmanager
+def batch_update(*objects) -> Generator[AttributeBatch, None, None]:
+    """
+    Collects the set_attribute() and set_attributes() calls made in the
+    block and saves them in a single round trip when the block exits. The
+    objects are updated locally, without reading their attributes back.
+    Nothing is saved if the block raises an exception
+
+    Typical usage:
+
+        with select_ai.batch_update():
+            profile.set_attribute("temperature", 0.2)
+            agent.set_attribute("role", "...")
+
+    :param objects: Profile, VectorIndex, Agent, Task, Tool or Team objects
+     whose changes are batched. By default, the changes of every object
+     are batched
+    """
+    batch = AttributeBatch(*objects)
+    token = __attribute_batch__.set(batch)
+    try:
+        yield batch
+    finally:
+        __attribute_batch__.reset(token)
+    batch.flush()
+
+
+@contextlib.asynccontextmanager
+async def async_batch_update(*objects) -> AsyncGenerator[AttributeBatch, None]:
+    """
+    Async counterpart of batch_update() for AsyncProfile, AsyncVectorIndex
+    and the async agent objects
+
+    Typical usage:
+
+        async with select_ai.async_batch_update():
+            await profile.set_attribute("temperature", 0.2)
+            await agent.set_attribute("role", "...")
+
+    :param objects: Async objects whose changes are batched. By default,
+     the changes of every async object are batched
+    """
+    batch = AttributeBatch(*objects)
+    token = __async_attribute_batch__.set(batch)
+    try:
+        yield batch
+    finally:
+        __async_attribute_batch__.reset(token)
+    await batch.async_flush()
+
+
+class BatchUpdateMixin:
+    """Mixin of the objects whose set_attribute() and set_attributes()
+    calls can be collected by batch_update(). Subclasses implement
+    _batch_procedure()
+    """
+
+    def _batch_procedure(self) -> Tuple[str, Dict[str, Any]]:
+        """Returns the procedure which saves the attribute changes collected
+        by a batch, and its parameters other than the attributes
+        """
+        raise NotImplementedError
+
+    def _apply_attributes(self, attributes: Mapping[str, Any]) -> None:
+        """Applies attribute changes saved by a batch"""
+        if self.attributes is not None:
+            for name, value in attributes.items():
+                setattr(self.attributes, name, value)
+
+    def batch_update(self):
+        """Collects the set_attribute() and set_attributes() calls made on
+        this object within the block and saves them in a single round trip
+        when the block exits. The attributes are updated locally instead of
+        being read back from the database. Nothing is saved if the block
+        raises an exception
+
+        Typical usage:
+
+            with profile.batch_update():
+                profile.set_attribute("temperature", 0.2)
+                profile.set_attribute("max_tokens", 2048)
+
+        """
+        return batch_update(self)
+
+
+class AsyncBatchUpdateMixin(BatchUpdateMixin):
+    """BatchUpdateMixin of the async objects"""
+
+    def batch_update(self):
+        """Async counterpart of BatchUpdateMixin.batch_update()
+
+        Typical usage:
+
+            async with profile.batch_update():
+                await profile.set_attribute("temperature", 0.2)
+                await profile.set_attribute("max_tokens", 2048)
+
+        """
+        return async_batch_update(self)
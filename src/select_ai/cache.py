@@ -0,0 +1,1144 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+import asyncio
+import hashlib
+import inspect
+import io
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import numpy
+import pandas
+
+from select_ai.action import Action
+from select_ai.db import async_cursor, cursor
+from select_ai.sql import (
+    GET_EMBEDDING_FROM_MODEL,
+    GET_EMBEDDING_FROM_PROVIDER,
+)
+
+__all__ = [
+    "CacheBackend",
+    "CacheStats",
+    "DatabaseEmbedder",
+    "LRUCache",
+    "ResponseCache",
+    "SemanticCache",
+    "SQLiteCache",
+]
+
+
+@dataclass
+class CacheStats:
+    """Cache usage counters
+
+    :param int hits: Number of lookups served from the cache
+    :param int misses: Number of lookups not found in the cache
+    :param int evictions: Number of entries evicted to honor the size bound
+    :param int expirations: Number of entries dropped because their
+     time-to-live elapsed
+    :param int size: Number of entries currently in the cache
+    :param int nbytes: Estimated memory used by the cached values
+    :param int semantic_hits: Number of lookups served from the response
+     of a similar, but not identical, prompt
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+    nbytes: int = 0
+    semantic_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        hits = self.hits + self.semantic_hits
+        lookups = hits + self.misses
+        return hits / lookups if lookups else 0.0
+
+
+def _sizeof(value: Any) -> int:
+    """Estimates the memory used by a cached value"""
+    if hasattr(value, "memory_usage"):  # pandas.DataFrame
+        return int(value.memory_usage(deep=True).sum())
+    return sys.getsizeof(value)
+
+
+class CacheBackend(ABC):
+    """Interface of the storage used by select_ai caches. Implement this
+    class to plug in a different storage for ResponseCache
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value cached for key, or default on a miss"""
+
+    @abstractmethod
+    def put(self, key: Hashable, value: Any) -> None:
+        """Caches value for key"""
+
+    @abstractmethod
+    def invalidate(self, key: Hashable) -> None:
+        """Removes the entry for key, if any"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all entries"""
+
+    @abstractmethod
+    def stats(self, reset: bool = False) -> CacheStats:
+        """Returns a snapshot of the cache counters"""
+
+
+class LRUCache(CacheBackend):
+    """Thread-safe in-memory cache bounded by number of entries and,
+    optionally, by estimated memory usage. The least recently used entry
+    is evicted first. Entries optionally expire after a time-to-live
+
+    :param int max_size: Maximum number of entries
+    :param float ttl: Number of seconds an entry stays valid. None means
+     entries never expire
+    :param int max_bytes: Maximum estimated memory used by the cached
+     values. None means the cache is only bounded by max_size
+    :param Callable sizeof: Function estimating the memory used by a value
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = _sizeof,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than 0")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value cached for key, or default if the key is
+        absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, nbytes, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return value
+                del self._entries[key]
+                self._nbytes -= nbytes
+                self._stats.expirations += 1
+            self._stats.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Caches value for key, evicting least recently used entries
+        if the cache is full. A value larger than max_bytes is not cached
+        """
+        expires_at = None
+        if self.ttl is not None:
+            expires_at = time.monotonic() + self.ttl
+        nbytes = self.sizeof(value) if self.max_bytes is not None else 0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous[1]
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                return
+            self._entries[key] = (expires_at, nbytes, value)
+            self._nbytes += nbytes
+            while len(self._entries) > self.max_size or (
+                self.max_bytes is not None and self._nbytes > self.max_bytes
+            ):
+                _, (_, evicted_nbytes, _) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+                self._stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Removes the entry for key, if any"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._nbytes -= entry[1]
+
+    def clear(self) -> None:
+        """Removes all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def stats(self, reset: bool = False) -> CacheStats:
+        """Returns a snapshot of the cache counters
+
+        :param bool reset: Reset the counters after taking the snapshot
+        :return: select_ai.cache.CacheStats
+        """
+        with self._lock:
+            stats = CacheStats(**self._stats.__dict__)
+            stats.size = len(self._entries)
+            stats.nbytes = self._nbytes
+            if reset:
+                self._stats = CacheStats()
+        return stats
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class _SQLiteConnection:
+    """SQLite connection of one thread. It is closed when the thread ends,
+    or by SQLiteCache.close(), but never by a forked child process since
+    the connection belongs to its parent
+    """
+
+    __slots__ = ("conn", "pid", "closed", "__weakref__")
+
+    def __init__(self, path: str, timeout: float):
+        self.conn = sqlite3.connect(
+            path,
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self.pid = os.getpid()
+        self.closed = False
+
+    def close(self):
+        if not self.closed and self.pid == os.getpid():
+            self.closed = True
+            self.conn.close()
+
+    def __del__(self):
+        self.close()
+
+
+class SQLiteCache(CacheBackend):
+    """Cache stored in a SQLite database file, shared by all processes on
+    a host which open the same file, e.g. the workers of a pre-forking
+    web server. The database runs in WAL mode and lookups only read it,
+    so that readers do not block each other or the writer. Entries are
+    looked up through the SHA-256 hash of the key and evicted least
+    recently used first. Access times are kept in memory and written by
+    the next put() of the process, so the eviction order is approximate
+
+    Values must be str, pandas.DataFrame or JSON serializable objects.
+    SQLite errors, e.g. a database locked for longer than timeout, are
+    treated as cache misses and do not fail the request. invalidate() and
+    clear() then leave the entries in place
+
+    :param str path: Path of the SQLite database file
+    :param int max_size: Maximum number of entries
+    :param float ttl: Number of seconds an entry stays valid. None means
+     entries never expire
+    :param int max_bytes: Maximum size of the serialized values. None means
+     the cache is only bounded by max_size
+    :param float timeout: Number of seconds to wait for a lock held by
+     another process
+    """
+
+    _TABLE = "select_ai_cache"
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 10000,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        timeout: float = 5.0,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than 0")
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections = weakref.WeakSet()
+        # Access times of the entries read since the last put(), by key
+        # hash
+        self._accessed: Dict[str, float] = {}
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        with self._connection() as conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._TABLE} ("
+                "key_hash TEXT PRIMARY KEY, "
+                "kind TEXT NOT NULL, "
+                "value TEXT NOT NULL, "
+                "nbytes INTEGER NOT NULL, "
+                "expires_at REAL, "
+                "last_access REAL NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._TABLE}_last_access "
+                f"ON {self._TABLE} (last_access)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns the SQLite connection of the current thread. Connections
+        are not shared across threads nor inherited by forked processes
+        """
+        connection = getattr(self._local, "connection", None)
+        if (
+            connection is None
+            or connection.closed
+            or connection.pid != os.getpid()
+        ):
+            connection = _SQLiteConnection(self.path, self.timeout)
+            connection.conn.execute("PRAGMA journal_mode=WAL")
+            connection.conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.add(connection)
+        return connection.conn
+
+    def close(self) -> None:
+        """Closes the SQLite connections opened by this process. The cache
+        opens a new connection when it is used again
+        """
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            connection.close()
+
+    @staticmethod
+    def _hash(key: Hashable) -> str:
+        return hashlib.sha256(str(key).encode()).hexdigest()
+
+    @staticmethod
+    def _serialize(value: Any):
+        if isinstance(value, str):
+            return "str", value
+        if isinstance(value, pandas.DataFrame):
+            return "dataframe", value.to_json(orient="table")
+        return "json", json.dumps(value)
+
+    @staticmethod
+    def _deserialize(kind: str, value: str) -> Any:
+        if kind == "str":
+            return value
+        if kind == "dataframe":
+            return pandas.read_json(io.StringIO(value), orient="table")
+        return json.loads(value)
+
+    def _count(self, **counters):
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self._stats, name, getattr(self._stats, name) + value)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value cached for key, or default if the key is
+        absent or expired
+        """
+        key_hash = self._hash(key)
+        now = time.time()
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    f"SELECT kind, value, expires_at FROM {self._TABLE} "
+                    "WHERE key_hash = ?",
+                    (key_hash,),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            row = None
+        # Expired entries are deleted by the next put()
+        if row is None or (row[2] is not None and row[2] <= now):
+            self._count(misses=1)
+            return default
+        kind, value, _ = row
+        with self._lock:
+            self._stats.hits += 1
+            self._accessed[key_hash] = now
+        return self._deserialize(kind, value)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Caches value for key, evicting least recently used entries
+        if the cache is full. A value larger than max_bytes is not cached
+        """
+        kind, serialized = self._serialize(value)
+        nbytes = len(serialized.encode())
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        with self._lock:
+            accessed, self._accessed = self._accessed, {}
+        try:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    f"UPDATE {self._TABLE} SET last_access = ? "
+                    "WHERE key_hash = ? AND last_access < ?",
+                    [(t, key_hash, t) for key_hash, t in accessed.items()],
+                )
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self._TABLE} "
+                    "(key_hash, kind, value, nbytes, expires_at, "
+                    "last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        self._hash(key),
+                        kind,
+                        serialized,
+                        nbytes,
+                        expires_at,
+                        now,
+                    ),
+                )
+                expirations = conn.execute(
+                    f"DELETE FROM {self._TABLE} WHERE expires_at <= ?",
+                    (now,),
+                ).rowcount
+                evictions = self._evict(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            # The value is simply not cached
+            return
+        self._count(evictions=evictions, expirations=expirations)
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Deletes least recently used entries until the cache is within
+        its bounds and returns the number of deleted entries
+        """
+        size, total_nbytes = conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(nbytes), 0) FROM {self._TABLE}"
+        ).fetchone()
+        evicted = []
+        if size > self.max_size or (
+            self.max_bytes is not None and total_nbytes > self.max_bytes
+        ):
+            rows = conn.execute(
+                f"SELECT key_hash, nbytes FROM {self._TABLE} "
+                "ORDER BY last_access"
+            )
+            for key_hash, nbytes in rows:
+                if size <= self.max_size and (
+                    self.max_bytes is None or total_nbytes <= self.max_bytes
+                ):
+                    break
+                evicted.append((key_hash,))
+                size -= 1
+                total_nbytes -= nbytes
+            conn.executemany(
+                f"DELETE FROM {self._TABLE} WHERE key_hash = ?", evicted
+            )
+        return len(evicted)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Removes the entry for key, if any"""
+        try:
+            self._connection().execute(
+                f"DELETE FROM {self._TABLE} WHERE key_hash = ?",
+                (self._hash(key),),
+            )
+        except sqlite3.Error:
+            # The entry stays cached until it expires or is evicted
+            pass
+
+    def clear(self) -> None:
+        """Removes all entries"""
+        try:
+            self._connection().execute(f"DELETE FROM {self._TABLE}")
+        except sqlite3.Error:
+            pass
+
+    def stats(self, reset: bool = False) -> CacheStats:
+        """Returns a snapshot of the cache counters. Hits, misses,
+        evictions and expirations are counted for the current process,
+        size and nbytes describe the shared cache, and are 0 if it cannot
+        be read
+
+        :param bool reset: Reset the counters after taking the snapshot
+        :return: select_ai.cache.CacheStats
+        """
+        try:
+            size, nbytes = (
+                self._connection()
+                .execute(
+                    f"SELECT COUNT(*), COALESCE(SUM(nbytes), 0) "
+                    f"FROM {self._TABLE}"
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            size, nbytes = 0, 0
+        with self._lock:
+            stats = CacheStats(**self._stats.__dict__)
+            if reset:
+                self._stats = CacheStats()
+        stats.size = size
+        stats.nbytes = nbytes
+        return stats
+
+    def __len__(self):
+        return self.stats().size
+
+
+class ResponseCache:
+    """Caches the responses of Profile.generate() and
+    AsyncProfile.generate() for actions whose answer only depends on the
+    prompt and the profile, e.g. SHOWSQL and EXPLAINSQL. The cache key
+    combines the profile name, a fingerprint of the profile attributes,
+    the action, the whitespace-normalized prompt and the request params.
+    Requests that are part of a conversation are never cached
+
+    AsyncProfile calls backends other than LRUCache in a worker thread, so
+    that waiting for their storage does not block the event loop
+
+    :param CacheBackend backend: Storage for the cached responses. Defaults
+     to an LRUCache bounded by max_size, max_bytes and ttl
+    :param Iterable[Action] actions: Actions whose responses are cached
+    :param int max_size: Maximum number of responses kept by the default
+     backend
+    :param int max_bytes: Maximum estimated memory used by the default
+     backend
+    :param float ttl: Number of seconds a response stays valid in the
+     default backend
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        actions: Iterable[Action] = (Action.SHOWSQL, Action.EXPLAINSQL),
+        max_size: int = 1024,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+    ):
+        if backend is None:
+            backend = LRUCache(max_size=max_size, ttl=ttl, max_bytes=max_bytes)
+        if not isinstance(backend, CacheBackend):
+            raise TypeError(
+                "'backend' must be an object of type "
+                "select_ai.cache.CacheBackend"
+            )
+        self.backend = backend
+        self.actions = frozenset(Action(action) for action in actions)
+
+    def is_cacheable(self, action: Action, params: Mapping = None) -> bool:
+        """Returns True if responses for this action and params are cached"""
+        if params and "conversation_id" in params:
+            return False
+        try:
+            return Action(action) in self.actions
+        except ValueError:
+            return False
+
+    @staticmethod
+    def key(
+        profile_name: str,
+        attributes_json: str,
+        action: Action,
+        prompt: str,
+        params: Mapping = None,
+    ) -> str:
+        """Builds the cache key of a generate request"""
+        key = json.dumps(
+            [
+                profile_name.upper(),
+                attributes_json,
+                str(action),
+                re.sub(r"\s+", " ", prompt).strip(),
+                params or {},
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def request_key(
+        self, profile, prompt: str, action: Action, params: Mapping = None
+    ) -> Optional[str]:
+        """Returns the cache key of a generate request made with profile,
+        or None if its response must not be cached
+        """
+        if not prompt or not self.is_cacheable(action, params):
+            return None
+        attributes = profile.attributes
+        return self.key(
+            profile.profile_name or "",
+            attributes.json() if attributes else "",
+            action,
+            prompt,
+            params,
+        )
+
+    def lookup(
+        self, profile, prompt: str, action: Action, params: Mapping = None
+    ) -> Any:
+        """Returns the cached response of a generate request made with
+        profile, or None on a miss
+        """
+        key = self.request_key(profile, prompt, action, params)
+        if key is None:
+            return None
+        return self.get(key)
+
+    def store(
+        self,
+        profile,
+        prompt: str,
+        action: Action,
+        params: Mapping,
+        response: Any,
+    ) -> None:
+        """Caches the response of a generate request made with profile"""
+        key = self.request_key(profile, prompt, action, params)
+        if key is not None:
+            self.put(key, response)
+
+    async def _async_load(
+        self, profile, prompt: str, action: Action, params: Mapping = None
+    ) -> None:
+        """Keys depend on the attributes, which a lazy AsyncProfile only
+        reads in load()
+        """
+        if prompt and self.is_cacheable(action, params):
+            await profile.load()
+
+    async def _async_backend(self, fn: Callable, *args) -> Any:
+        """Calls fn, which reads or writes the backend, in a worker thread
+        unless the backend is in memory. A backend such as SQLiteCache may
+        wait for a lock held by another process
+        """
+        if isinstance(self.backend, LRUCache):
+            return fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
+    async def async_lookup(
+        self, profile, prompt: str, action: Action, params: Mapping = None
+    ) -> Any:
+        """Async counterpart of lookup(), used by AsyncProfile"""
+        await self._async_load(profile, prompt, action, params)
+        key = self.request_key(profile, prompt, action, params)
+        if key is None:
+            return None
+        return await self._async_backend(self.get, key)
+
+    async def async_store(
+        self,
+        profile,
+        prompt: str,
+        action: Action,
+        params: Mapping,
+        response: Any,
+    ) -> None:
+        """Async counterpart of store(), used by AsyncProfile"""
+        await self._async_load(profile, prompt, action, params)
+        key = self.request_key(profile, prompt, action, params)
+        if key is not None:
+            await self._async_backend(self.put, key, response)
+
+    def get(self, key: str) -> Any:
+        """Returns a copy of the cached response, or None on a miss"""
+        response = self.backend.get(key)
+        if hasattr(response, "copy"):  # pandas.DataFrame
+            response = response.copy()
+        return response
+
+    def put(self, key: str, response: Any) -> None:
+        """Caches a response. None responses are not cached"""
+        if response is None:
+            return
+        if hasattr(response, "copy"):
+            response = response.copy()
+        self.backend.put(key, response)
+
+    def clear(self) -> None:
+        """Removes all cached responses"""
+        self.backend.clear()
+
+    def stats(self, reset: bool = False) -> CacheStats:
+        """Returns hit, miss and eviction counters of the cache
+
+        :param bool reset: Reset the counters after taking the snapshot
+        :return: select_ai.cache.CacheStats
+        """
+        return self.backend.stats(reset=reset)
+
+
+_MODEL_NAME_PATTERN = re.compile(
+    r"^[A-Za-z][A-Za-z0-9_$#]*(\.[A-Za-z][A-Za-z0-9_$#]*)?$"
+)
+
+
+# DBMS_VECTOR.UTL_TO_EMBEDDING provider name and embedding endpoint of the
+# Select AI providers whose embedding model can be called from the database
+_EMBEDDING_PROVIDERS = {
+    "oci": (
+        "ocigenai",
+        "https://inference.generativeai.{region}.oci.oraclecloud.com"
+        "/20231130/actions/embedText",
+    ),
+    "openai": ("openai", "https://api.openai.com/v1/embeddings"),
+    "cohere": ("cohere", "https://api.cohere.ai/v1/embed"),
+}
+
+
+class DatabaseEmbedder:
+    """Computes prompt embeddings in the database, either with an ONNX
+    model loaded in the database (VECTOR_EMBEDDING) or with a third party
+    provider (DBMS_VECTOR.UTL_TO_EMBEDDING). Calling the embedder uses the
+    connection created by select_ai.connect(), async_embed() the one
+    created by select_ai.async_connect()
+
+    :param str model_name: Name of an embedding model loaded in the
+     database
+    :param Mapping params: Parameters of DBMS_VECTOR.UTL_TO_EMBEDDING, e.g.
+     provider, credential_name, url and model. Used when model_name is
+     not set
+    """
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        params: Optional[Mapping] = None,
+    ):
+        if model_name is None and params is None:
+            raise ValueError("Either 'model_name' or 'params' is required")
+        if model_name is not None:
+            if not _MODEL_NAME_PATTERN.match(model_name):
+                raise ValueError(f"Invalid model name '{model_name}'")
+            self._sql = GET_EMBEDDING_FROM_MODEL.format(model_name=model_name)
+            self._binds = {}
+        else:
+            self._sql = GET_EMBEDDING_FROM_PROVIDER
+            self._binds = {"params": json.dumps(dict(params), sort_keys=True)}
+        self.model_name = model_name
+        self.params = params
+
+    @classmethod
+    def from_profile(cls, attributes) -> "DatabaseEmbedder":
+        """Returns an embedder calling the embedding model of an AI profile
+        with the profile's credential. Supported for the OCI Generative AI,
+        OpenAI and Cohere providers
+
+        :param select_ai.ProfileAttributes attributes: Attributes of the
+         profile
+        :raises: ValueError if the profile has no embedding model, no
+         credential or an unsupported provider
+        """
+        provider = attributes.provider if attributes else None
+        if provider is None or not provider.embedding_model:
+            raise ValueError("The profile has no 'embedding_model'")
+        if not attributes.credential_name:
+            raise ValueError("The profile has no 'credential_name'")
+        if provider.provider_name not in _EMBEDDING_PROVIDERS:
+            raise ValueError(
+                f"Embedding with provider '{provider.provider_name}' is not "
+                "supported, pass an embedder"
+            )
+        name, url = _EMBEDDING_PROVIDERS[provider.provider_name]
+        if "{region}" in url:
+            if not provider.region:
+                raise ValueError("The profile has no 'region'")
+            url = url.format(region=provider.region)
+        return cls(
+            params={
+                "provider": name,
+                "credential_name": attributes.credential_name,
+                "url": url,
+                "model": provider.embedding_model,
+            }
+        )
+
+    def __call__(self, texts: List[str]) -> numpy.ndarray:
+        with cursor() as cr:
+            vectors = []
+            for text in texts:
+                cr.execute(self._sql, text=text, **self._binds)
+                (vector,) = cr.fetchone()
+                vectors.append(numpy.asarray(vector, dtype=numpy.float32))
+        return numpy.vstack(vectors)
+
+    async def async_embed(self, texts: List[str]) -> numpy.ndarray:
+        """Async counterpart of calling the embedder"""
+        async with async_cursor() as cr:
+            vectors = []
+            for text in texts:
+                await cr.execute(self._sql, text=text, **self._binds)
+                (vector,) = await cr.fetchone()
+                vectors.append(numpy.asarray(vector, dtype=numpy.float32))
+        return numpy.vstack(vectors)
+
+
+class _EmbeddingIndex:
+    """Prompt embeddings of one cache partition, kept as rows of a
+    contiguous float32 matrix so that a lookup is a single matrix-vector
+    product. Rows of discarded keys are reused first. Once max_entries rows
+    are used, the oldest row is overwritten
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._matrix: Optional[numpy.ndarray] = None
+        # Key of each row, None for a free row
+        self._keys: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._next = 0
+
+    def add(self, embedding: numpy.ndarray, key: str) -> None:
+        if self._matrix is None:
+            capacity = min(64, self.max_entries)
+            self._matrix = numpy.zeros(
+                (capacity, embedding.shape[0]), dtype=numpy.float32
+            )
+        row = self._rows.get(key)
+        if row is None:
+            if self._free:
+                row = self._free.pop()
+            elif len(self._keys) < self.max_entries:
+                if len(self._keys) == self._matrix.shape[0]:
+                    capacity = min(2 * len(self._keys), self.max_entries)
+                    matrix = numpy.zeros(
+                        (capacity, self._matrix.shape[1]),
+                        dtype=numpy.float32,
+                    )
+                    matrix[: len(self._keys)] = self._matrix
+                    self._matrix = matrix
+                row = len(self._keys)
+                self._keys.append(None)
+            else:
+                row = self._next
+                self._next = (self._next + 1) % self.max_entries
+                del self._rows[self._keys[row]]
+            self._keys[row] = key
+            self._rows[key] = row
+        self._matrix[row] = embedding
+
+    def nearest(self, embedding: numpy.ndarray) -> Tuple[Optional[str], float]:
+        if not self._rows:
+            return None, 0.0
+        similarities = self._matrix[: len(self._keys)] @ embedding
+        row = int(numpy.argmax(similarities))
+        return self._keys[row], float(similarities[row])
+
+    def discard(self, key: str) -> None:
+        row = self._rows.pop(key, None)
+        if row is not None:
+            self._keys[row] = None
+            self._matrix[row] = 0.0
+            self._free.append(row)
+
+
+def _is_async_embedder(embedder: Callable) -> bool:
+    """True if embedder is a coroutine function or an object whose
+    __call__ is one
+    """
+    return inspect.iscoroutinefunction(
+        embedder
+    ) or inspect.iscoroutinefunction(getattr(embedder, "__call__", None))
+
+
+class SemanticCache(ResponseCache):
+    """Response cache which also serves prompts that are worded
+    differently from a cached one, but mean the same thing. Prompts are
+    embedded with embedder and a lookup that misses the exact cache returns
+    the response of the most similar cached prompt, if the cosine
+    similarity reaches threshold. Only prompts sent with the same profile,
+    profile attributes, action and params are compared
+
+    AsyncProfile embeds prompts with embedder.async_embed() when it exists,
+    awaits embedder when it is a coroutine function and otherwise runs it
+    in a worker thread, so that the event loop is never blocked
+
+    :param Callable embedder: Callable taking a list of texts and returning
+     an array of shape (len(texts), dimensions), e.g. a
+     select_ai.cache.DatabaseEmbedder. Defaults to a DatabaseEmbedder
+     calling the embedding model of the profile, see
+     DatabaseEmbedder.from_profile()
+    :param float threshold: Minimum cosine similarity between two prompts
+     to share a response
+    :param int max_entries: Maximum number of prompt embeddings kept per
+     profile and action
+    :param CacheBackend backend: Storage for the cached responses
+    :param Iterable[Action] actions: Actions whose responses are cached.
+     RUNSQL serves the rows of a similar prompt, so caching it should be
+     paired with a ttl
+    :param int max_size: Maximum number of responses kept by the default
+     backend
+    :param int max_bytes: Maximum estimated memory used by the default
+     backend
+    :param float ttl: Number of seconds a response stays valid in the
+     default backend
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Callable[[List[str]], Any]] = None,
+        threshold: float = 0.92,
+        max_entries: int = 10000,
+        backend: Optional[CacheBackend] = None,
+        actions: Iterable[Action] = (Action.SHOWSQL,),
+        max_size: int = 1024,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+    ):
+        super().__init__(
+            backend=backend,
+            actions=actions,
+            max_size=max_size,
+            max_bytes=max_bytes,
+            ttl=ttl,
+        )
+        if embedder is not None and not callable(embedder):
+            raise TypeError("'embedder' must be a callable")
+        if not 0 < threshold <= 1:
+            raise ValueError("'threshold' must be in the range (0, 1]")
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._indexes: Dict[str, _EmbeddingIndex] = {}
+        # Embedders of the profiles' embedding models, by parameters
+        self._profile_embedders: Dict[str, DatabaseEmbedder] = {}
+        self._embeddings = LRUCache(max_size=1024)
+        self._lock = threading.Lock()
+        self._semantic_hits = 0
+        self._stale_lookups = 0
+
+    def _partition(
+        self, profile, prompt: str, action: Action, params: Mapping = None
+    ) -> Optional[str]:
+        """Key of the prompts which may share a response with prompt"""
+        if not prompt or not self.is_cacheable(action, params):
+            return None
+        attributes = profile.attributes
+        return self.key(
+            profile.profile_name or "",
+            attributes.json() if attributes else "",
+            action,
+            "",
+            params,
+        )
+
+    def _embedder(self, profile) -> Tuple[Callable, str]:
+        """Returns the embedder used for the prompts of profile and a key
+        identifying its model
+        """
+        if self.embedder is not None:
+            return self.embedder, ""
+        embedder = DatabaseEmbedder.from_profile(profile.attributes)
+        model_key = embedder._binds["params"]
+        with self._lock:
+            embedder = self._profile_embedders.setdefault(model_key, embedder)
+        return embedder, model_key
+
+    def _normalize(self, embedding: Any) -> numpy.ndarray:
+        embedding = numpy.asarray(embedding, dtype=numpy.float32).reshape(-1)
+        norm = numpy.linalg.norm(embedding)
+        if norm:
+            embedding = embedding / norm
+        return embedding
+
+    def _embed(self, profile, prompt: str) -> numpy.ndarray:
+        """Returns the normalized embedding of prompt"""
+        embedder, model_key = self._embedder(profile)
+        text = re.sub(r"\s+", " ", prompt).strip()
+        embedding = self._embeddings.get((model_key, text))
+        if embedding is None:
+            if _is_async_embedder(embedder):
+                raise TypeError(
+                    "A coroutine function embedder requires AsyncProfile"
+                )
+            embedding = self._normalize(embedder([text]))
+            self._embeddings.put((model_key, text), embedding)
+        return embedding
+
+    async def _async_embed(self, profile, prompt: str) -> numpy.ndarray:
+        """Async counterpart of _embed() which does not block the event
+        loop while the embedder runs
+        """
+        if self.embedder is None:
+            await profile.load()
+        embedder, model_key = self._embedder(profile)
+        text = re.sub(r"\s+", " ", prompt).strip()
+        embedding = self._embeddings.get((model_key, text))
+        if embedding is None:
+            if hasattr(embedder, "async_embed"):
+                embedding = await embedder.async_embed([text])
+            elif _is_async_embedder(embedder):
+                embedding = await embedder([text])
+            else:
+                embedding = await asyncio.to_thread(embedder, [text])
+            embedding = self._normalize(embedding)
+            self._embeddings.put((model_key, text), embedding)
+        return embedding
+
+    def _nearest_key(
+        self, partition: str, embedding: numpy.ndarray
+    ) -> Tuple[Optional[_EmbeddingIndex], Optional[str]]:
+        """Returns the index of partition and the key of its cached prompt
+        most similar to embedding, or None if none is similar enough
+        """
+        with self._lock:
+            index = self._indexes.get(partition)
+            if index is None:
+                return None, None
+            key, similarity = index.nearest(embedding)
+        if key is None or similarity < self.threshold:
+            return index, None
+        return index, key
+
+    def _nearest_response(
+        self, index: _EmbeddingIndex, key: str, response: Any
+    ) -> Any:
+        """Counts the lookup of the nearest key, whose response may have
+        been evicted from the backend
+        """
+        with self._lock:
+            if response is None:
+                index.discard(key)
+                self._stale_lookups += 1
+            else:
+                self._semantic_hits += 1
+        return response
+
+    def _nearest(self, partition: str, embedding: numpy.ndarray) -> Any:
+        """Returns the response of the cached prompt of partition most
+        similar to embedding, or None if none is similar enough
+        """
+        index, key = self._nearest_key(partition, embedding)
+        if key is None:
+            return None
+        return self._nearest_response(index, key, self.get(key))
+
+    async def _async_nearest(
+        self, partition: str, embedding: numpy.ndarray
+    ) -> Any:
+        """Async counterpart of _nearest()"""
+        index, key = self._nearest_key(partition, embedding)
+        if key is None:
+            return None
+        response = await self._async_backend(self.get, key)
+        return self._nearest_response(index, key, response)
+
+    def _add(self, partition: str, embedding: numpy.ndarray, key: str):
+        with self._lock:
+            index = self._indexes.get(partition)
+            if index is None:
+                index = self._indexes[partition] = _EmbeddingIndex(
+                    self.max_entries
+                )
+            index.add(embedding, key)
+
+    def lookup(
+        self, profile, prompt: str, action: Action, params: Mapping = None
+    ) -> Any:
+        response = super().lookup(profile, prompt, action, params)
+        if response is not None:
+            return response
+        partition = self._partition(profile, prompt, action, params)
+        if partition is None:
+            return None
+        return self._nearest(partition, self._embed(profile, prompt))
+
+    async def async_lookup(
+        self, profile, prompt: str, action: Action, params: Mapping = None
+    ) -> Any:
+        response = await super().async_lookup(profile, prompt, action, params)
+        if response is not None:
+            return response
+        partition = self._partition(profile, prompt, action, params)
+        if partition is None:
+            return None
+        embedding = await self._async_embed(profile, prompt)
+        return await self._async_nearest(partition, embedding)
+
+    def store(
+        self,
+        profile,
+        prompt: str,
+        action: Action,
+        params: Mapping,
+        response: Any,
+    ) -> None:
+        super().store(profile, prompt, action, params, response)
+        partition = self._partition(profile, prompt, action, params)
+        if partition is None or response is None:
+            return
+        key = self.request_key(profile, prompt, action, params)
+        self._add(partition, self._embed(profile, prompt), key)
+
+    async def async_store(
+        self,
+        profile,
+        prompt: str,
+        action: Action,
+        params: Mapping,
+        response: Any,
+    ) -> None:
+        await super().async_store(profile, prompt, action, params, response)
+        partition = self._partition(profile, prompt, action, params)
+        if partition is None or response is None:
+            return
+        key = self.request_key(profile, prompt, action, params)
+        embedding = await self._async_embed(profile, prompt)
+        self._add(partition, embedding, key)
+
+    def clear(self) -> None:
+        super().clear()
+        with self._lock:
+            self._indexes.clear()
+
+    def stats(self, reset: bool = False) -> CacheStats:
+        stats = super().stats(reset=reset)
+        with self._lock:
+            # A semantic hit misses the exact key, then reads the neighbor
+            stats.hits -= self._semantic_hits
+            stats.misses -= self._semantic_hits + self._stale_lookups
+            stats.semantic_hits = self._semantic_hits
+            if reset:
+                self._semantic_hits = 0
+                self._stale_lookups = 0
+        return stats
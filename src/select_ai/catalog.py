@@ -0,0 +1,409 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+import functools
+import hashlib
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import oracledb
+
+from select_ai._enums import StrEnum
+from select_ai.agent import (
+    Agent,
+    AsyncAgent,
+    AsyncTask,
+    AsyncTeam,
+    AsyncTool,
+    Task,
+    Team,
+    Tool,
+)
+from select_ai.agent.sql import (
+    LIST_USER_AI_AGENT_TASKS_WITH_ATTRIBUTES,
+    LIST_USER_AI_AGENT_TEAMS_WITH_ATTRIBUTES,
+    LIST_USER_AI_AGENT_TOOLS_WITH_ATTRIBUTES,
+    LIST_USER_AI_AGENTS_WITH_ATTRIBUTES,
+)
+from select_ai.async_profile import AsyncProfile
+from select_ai.conversation import AsyncConversation, Conversation
+from select_ai.db import LIST_ARRAYSIZE, async_get_connection, cursor
+from select_ai.profile import Profile
+from select_ai.sql import (
+    LIST_USER_AI_PROFILES_WITH_ATTRIBUTES,
+    LIST_USER_CONVERSATIONS,
+    LIST_USER_VECTOR_INDEXES_WITH_ATTRIBUTES,
+)
+from select_ai.vector_index import AsyncVectorIndex, VectorIndex
+
+__all__ = [
+    "AsyncCatalog",
+    "Catalog",
+    "CatalogChanges",
+    "CatalogObjectType",
+]
+
+
+class CatalogObjectType(StrEnum):
+    PROFILE = "profile"
+    VECTOR_INDEX = "vector_index"
+    AGENT = "agent"
+    TOOL = "tool"
+    TASK = "task"
+    TEAM = "team"
+    CONVERSATION = "conversation"
+
+
+@dataclass
+class _Query:
+    """Bulk query loading every object of one type. json_columns are the
+    positions of the columns holding attributes aggregated as JSON objects
+    """
+
+    statement: str
+    parameters: Mapping
+    json_columns: Tuple[int, ...]
+
+
+_QUERIES = {
+    CatalogObjectType.PROFILE: _Query(
+        LIST_USER_AI_PROFILES_WITH_ATTRIBUTES,
+        {"profile_name_pattern": ".*"},
+        (2,),
+    ),
+    CatalogObjectType.VECTOR_INDEX: _Query(
+        LIST_USER_VECTOR_INDEXES_WITH_ATTRIBUTES,
+        {"index_name_pattern": ".*"},
+        (2, 5),
+    ),
+    CatalogObjectType.AGENT: _Query(
+        LIST_USER_AI_AGENTS_WITH_ATTRIBUTES,
+        {"agent_name_pattern": ".*"},
+        (2,),
+    ),
+    CatalogObjectType.TOOL: _Query(
+        LIST_USER_AI_AGENT_TOOLS_WITH_ATTRIBUTES,
+        {"tool_name_pattern": ".*"},
+        (2,),
+    ),
+    CatalogObjectType.TASK: _Query(
+        LIST_USER_AI_AGENT_TASKS_WITH_ATTRIBUTES,
+        {"task_name_pattern": ".*"},
+        (2,),
+    ),
+    CatalogObjectType.TEAM: _Query(
+        LIST_USER_AI_AGENT_TEAMS_WITH_ATTRIBUTES,
+        {"team_name_pattern": ".*"},
+        (2,),
+    ),
+    CatalogObjectType.CONVERSATION: _Query(LIST_USER_CONVERSATIONS, {}, ()),
+}
+
+
+@dataclass
+class CatalogChanges:
+    """Objects added, updated or removed by a catalog refresh. Each object
+    is identified by an (object_type, name) tuple
+
+    :param list added: Objects which were not in the catalog
+    :param list updated: Objects whose description or attributes changed
+    :param list removed: Objects which no longer exist in the database
+    """
+
+    added: List[Tuple[CatalogObjectType, str]] = field(default_factory=list)
+    updated: List[Tuple[CatalogObjectType, str]] = field(default_factory=list)
+    removed: List[Tuple[CatalogObjectType, str]] = field(default_factory=list)
+
+
+def _digest(row: Tuple, json_columns: Tuple[int, ...]) -> str:
+    """Hash of a row. JSON_OBJECTAGG() does not order the keys, so the
+    aggregated attributes are normalized first
+    """
+    values = [
+        (
+            json.dumps(json.loads(value), sort_keys=True)
+            if index in json_columns and value
+            else value
+        )
+        for index, value in enumerate(row)
+    ]
+    return hashlib.sha256(repr(values).encode()).hexdigest()
+
+
+class _Entry:
+    """A row of a bulk query and the object built from it on first use"""
+
+    __slots__ = ("row", "digest", "obj")
+
+    def __init__(self, row: Tuple, digest: str):
+        self.row = row
+        self.digest = digest
+        self.obj = None
+
+
+class _BaseCatalog:
+
+    # Builds an object from a row of the bulk query of its type
+    _builders: Mapping[CatalogObjectType, Callable[..., Any]] = {}
+
+    def __init__(self, object_types: Optional[Iterable[str]] = None):
+        if object_types is None:
+            object_types = CatalogObjectType
+        self.object_types = [
+            CatalogObjectType(object_type) for object_type in object_types
+        ]
+        self.refreshed_at: Optional[float] = None
+        self._entries: Dict[CatalogObjectType, Dict[str, _Entry]] = {
+            object_type: {} for object_type in self.object_types
+        }
+        # Names of each type by their upper case form, for lookups which
+        # ignore case
+        self._folded: Dict[CatalogObjectType, Dict[str, List[str]]] = {
+            object_type: {} for object_type in self.object_types
+        }
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    def __repr__(self):
+        counts = ", ".join(
+            f"{object_type}={len(entries)}"
+            for object_type, entries in self._entries.items()
+        )
+        return f"{self.__class__.__name__}({counts})"
+
+    def _object_types(
+        self, object_types: Optional[Iterable[str]]
+    ) -> List[CatalogObjectType]:
+        if object_types is None:
+            return list(self.object_types)
+        object_types = [
+            CatalogObjectType(object_type) for object_type in object_types
+        ]
+        for object_type in object_types:
+            if object_type not in self._entries:
+                raise ValueError(
+                    f"'{object_type}' objects are not kept by this catalog"
+                )
+        return object_types
+
+    def _apply(
+        self, rows: Mapping[CatalogObjectType, List[Tuple]]
+    ) -> CatalogChanges:
+        """Replaces the entries of each object type with the fetched rows.
+        Entries whose digest did not change are kept with the object built
+        from them
+        """
+        changes = CatalogChanges()
+        with self._lock:
+            for object_type, object_rows in rows.items():
+                json_columns = _QUERIES[object_type].json_columns
+                previous = self._entries[object_type]
+                entries = {}
+                folded = {}
+                for row in object_rows:
+                    # Quoted names may differ only in case, so entries are
+                    # keyed by the exact name
+                    key = row[0]
+                    folded.setdefault(key.upper(), []).append(key)
+                    digest = _digest(row, json_columns)
+                    entry = previous.get(key)
+                    if entry is None:
+                        changes.added.append((object_type, row[0]))
+                        entry = _Entry(row, digest)
+                    elif entry.digest != digest:
+                        changes.updated.append((object_type, row[0]))
+                        entry = _Entry(row, digest)
+                    entries[key] = entry
+                for key, entry in previous.items():
+                    if key not in entries:
+                        changes.removed.append((object_type, entry.row[0]))
+                # readers keep using the previous dicts until they are
+                # replaced
+                self._entries[object_type] = entries
+                self._folded[object_type] = folded
+            self.refreshed_at = time.time()
+        return changes
+
+    def _object(self, object_type: CatalogObjectType, entry: _Entry) -> Any:
+        obj = entry.obj
+        if obj is None:
+            obj = entry.obj = self._builders[object_type](*entry.row)
+        return obj
+
+    def get(self, object_type: str, name: str) -> Optional[Any]:
+        """Returns the object named name, or None if the catalog does not
+        have it. The database is not queried. An exact match is preferred;
+        otherwise the name is matched ignoring case, as long as a single
+        object matches
+
+        :param str object_type: A select_ai.CatalogObjectType
+        :param str name: Name of the object. For conversations, the
+         conversation id
+        """
+        (object_type,) = self._object_types([object_type])
+        entries = self._entries[object_type]
+        entry = entries.get(name)
+        if entry is None:
+            matches = self._folded[object_type].get(name.upper(), ())
+            if len(matches) != 1:
+                return None
+            entry = entries.get(matches[0])
+            if entry is None:
+                return None
+        return self._object(object_type, entry)
+
+    def names(self, object_type: str) -> List[str]:
+        """Returns the names of the objects of a type
+
+        :param str object_type: A select_ai.CatalogObjectType
+        """
+        (object_type,) = self._object_types([object_type])
+        return [entry.row[0] for entry in self._entries[object_type].values()]
+
+    def filter(
+        self, object_type: str, name_pattern: str = ".*", **attributes
+    ) -> List[Any]:
+        """Returns the objects of a type whose name matches name_pattern
+        and whose attributes have the given values. The database is not
+        queried
+
+        :param str object_type: A select_ai.CatalogObjectType
+        :param str name_pattern: Regular expression searched in the names,
+         ignoring case like REGEXP_LIKE(name, name_pattern, 'i')
+        :param attributes: Attribute values the objects must have, for
+         example profile_name="MY_PROFILE" for vector indexes or agents
+        """
+        (object_type,) = self._object_types([object_type])
+        pattern = re.compile(name_pattern, re.IGNORECASE)
+        objects = []
+        for entry in self._entries[object_type].values():
+            if not pattern.search(entry.row[0]):
+                continue
+            obj = self._object(object_type, entry)
+            if attributes:
+                obj_attributes = obj.attributes
+                if obj_attributes is None or any(
+                    getattr(obj_attributes, key, None) != value
+                    for key, value in attributes.items()
+                ):
+                    continue
+            objects.append(obj)
+        return objects
+
+
+class Catalog(_BaseCatalog):
+    """In-memory snapshot of the Select AI objects of the current user.
+    refresh() loads every object type with one bulk query per type; the
+    Profile, VectorIndex, Agent, Tool, Task, Team and Conversation objects
+    are built when they are first looked up. Lookups never query the
+    database. The objects are shared by all lookups until a refresh finds
+    that they changed
+
+    :param object_types: select_ai.CatalogObjectType values to keep in the
+     catalog. Default is all the object types
+    """
+
+    _builders = {
+        CatalogObjectType.PROFILE: Profile._from_row,
+        CatalogObjectType.VECTOR_INDEX: functools.partial(
+            VectorIndex._from_row, Profile
+        ),
+        CatalogObjectType.AGENT: Agent._from_row,
+        CatalogObjectType.TOOL: Tool._from_row,
+        CatalogObjectType.TASK: Task._from_row,
+        CatalogObjectType.TEAM: Team._from_row,
+        CatalogObjectType.CONVERSATION: Conversation._from_row,
+    }
+
+    def refresh(
+        self, object_types: Optional[Iterable[str]] = None
+    ) -> CatalogChanges:
+        """Reloads the objects of the given types and returns what changed
+        since the previous refresh. Objects which did not change keep the
+        object already built for them
+
+        :param object_types: select_ai.CatalogObjectType values to reload.
+         Default is all the object types of the catalog
+        :return: select_ai.CatalogChanges
+        """
+        object_types = self._object_types(object_types)
+        rows = {}
+        with cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
+            for object_type in object_types:
+                query = _QUERIES[object_type]
+                cr.execute(query.statement, query.parameters, fetch_lobs=False)
+                rows[object_type] = cr.fetchall()
+        return self._apply(rows)
+
+
+class AsyncCatalog(_BaseCatalog):
+    """Async counterpart of select_ai.Catalog, holding AsyncProfile,
+    AsyncVectorIndex, AsyncAgent, AsyncTool, AsyncTask, AsyncTeam and
+    AsyncConversation objects. refresh() sends the bulk queries of all
+    the object types in a single pipeline
+
+    :param object_types: select_ai.CatalogObjectType values to keep in the
+     catalog. Default is all the object types
+    """
+
+    _builders = {
+        CatalogObjectType.PROFILE: AsyncProfile._from_row,
+        CatalogObjectType.VECTOR_INDEX: functools.partial(
+            AsyncVectorIndex._from_row, AsyncProfile
+        ),
+        CatalogObjectType.AGENT: AsyncAgent._from_row,
+        CatalogObjectType.TOOL: AsyncTool._from_row,
+        CatalogObjectType.TASK: AsyncTask._from_row,
+        CatalogObjectType.TEAM: AsyncTeam._from_row,
+        CatalogObjectType.CONVERSATION: AsyncConversation._from_row,
+    }
+
+    async def refresh(
+        self, object_types: Optional[Iterable[str]] = None
+    ) -> CatalogChanges:
+        """Reloads the objects of the given types and returns what changed
+        since the previous refresh
+
+        :param object_types: select_ai.CatalogObjectType values to reload.
+         Default is all the object types of the catalog
+        :return: select_ai.CatalogChanges
+        """
+        object_types = self._object_types(object_types)
+        pipeline = oracledb.create_pipeline()
+        for object_type in object_types:
+            query = _QUERIES[object_type]
+            pipeline.add_fetchall(
+                query.statement,
+                query.parameters,
+                arraysize=LIST_ARRAYSIZE,
+                fetch_lobs=False,
+            )
+        async with async_get_connection() as async_connection:
+            results = await async_connection.run_pipeline(pipeline)
+        return self._apply(
+            {
+                object_type: result.rows
+                for object_type, result in zip(object_types, results)
+            }
+        )
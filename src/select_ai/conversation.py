@@ -13,7 +13,7 @@ from typing import AsyncGenerator, Iterator, Optional
 import oracledb
 
 from select_ai._abc import SelectAIDataClass
-from select_ai.db import async_cursor, cursor
+from select_ai.db import LIST_ARRAYSIZE, async_cursor, cursor
 from select_ai.errors import ConversationNotFoundError
 from select_ai.sql import (
     GET_USER_CONVERSATION_ATTRIBUTES,
@@ -69,6 +69,30 @@ class _BaseConversation:
             f"attributes={self.attributes})"
         )
 
+    @classmethod
+    def _from_row(
+        cls,
+        conversation_id: str,
+        conversation_title: Optional[str],
+        description: Optional[str],
+        retention_days: Optional[datetime.timedelta],
+    ):
+        """Builds a conversation object from a row of LIST_USER_CONVERSATIONS
+        fetched with fetch_lobs=False
+
+        :param str conversation_id: Id of the conversation
+        :param str conversation_title: Title of the conversation
+        :param str description: Description of the conversation
+        :param datetime.timedelta retention_days: Retention of the
+         conversation
+        """
+        attributes = ConversationAttributes(
+            title=conversation_title,
+            description=description,
+            retention_days=retention_days,
+        )
+        return cls(attributes=attributes, conversation_id=conversation_id)
+
 
 class Conversation(_BaseConversation):
     """Conversation class can be used to create, update and delete
@@ -164,25 +188,11 @@ class Conversation(_BaseConversation):
         :return: Iterator[Conversation]
         """
         with cursor() as cr:
-            cr.execute(
-                LIST_USER_CONVERSATIONS,
-            )
-            for row in cr.fetchall():
-                conversation_id = row[0]
-                conversation_title = row[1]
-                if row[2]:
-                    description = row[2].read()  # Oracle.LOB
-                else:
-                    description = None
-                retention_days = row[3]
-                attributes = ConversationAttributes(
-                    title=conversation_title,
-                    description=description,
-                    retention_days=retention_days,
-                )
-                yield cls(
-                    attributes=attributes, conversation_id=conversation_id
-                )
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
+            cr.execute(LIST_USER_CONVERSATIONS, fetch_lobs=False)
+            for row in cr:
+                yield cls._from_row(*row)
 
 
 class AsyncConversation(_BaseConversation):
@@ -273,23 +283,8 @@ class AsyncConversation(_BaseConversation):
         :return: AsyncGenerator[AsyncConversation, None]
         """
         async with async_cursor() as cr:
-            await cr.execute(
-                LIST_USER_CONVERSATIONS,
-            )
-            rows = await cr.fetchall()
-            for row in rows:
-                conversation_id = row[0]
-                conversation_title = row[1]
-                if row[2]:
-                    description = await row[2].read()  # Oracle.AsyncLOB
-                else:
-                    description = None
-                retention_days = row[3]
-                attributes = ConversationAttributes(
-                    title=conversation_title,
-                    description=description,
-                    retention_days=retention_days,
-                )
-                yield cls(
-                    attributes=attributes, conversation_id=conversation_id
-                )
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
+            await cr.execute(LIST_USER_CONVERSATIONS, fetch_lobs=False)
+            async for row in cr:
+                yield cls._from_row(*row)
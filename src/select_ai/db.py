@@ -5,21 +5,165 @@
 # http://oss.oracle.com/licenses/upl.
 # -----------------------------------------------------------------------------
 
+import asyncio
 import contextlib
+import contextvars
 import os
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import MutableMapping
+from dataclasses import dataclass
 from threading import get_ident
-from typing import Any, AsyncGenerator, Dict, Generator, Hashable, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Generator,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 import oracledb
 from oracledb import Connection
 
 from select_ai.errors import DatabaseNotConnectedError
 
-__conn__: Dict[Hashable, oracledb.Connection] = {}
-__async_conn__: Dict[Hashable, oracledb.AsyncConnection] = {}
 
-__pool__: Dict[Hashable, oracledb.ConnectionPool] = {}
-__async_pool__: Dict[Hashable, oracledb.AsyncConnectionPool] = {}
+class _Registry(MutableMapping):
+    """Mapping of connections, pools or their parameters shared by all
+    threads, safe without the GIL. Lookups read an immutable snapshot
+    without locking; writers replace the snapshot under a lock. Entries
+    change far less often than they are looked up, once per connect or
+    disconnect against once per operation
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Any] = {}
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self._entries[key]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self._entries.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __setitem__(self, key: Hashable, value: Any):
+        with self._lock:
+            entries = dict(self._entries)
+            entries[key] = value
+            self._entries = entries
+
+    def __delitem__(self, key: Hashable):
+        with self._lock:
+            entries = dict(self._entries)
+            del entries[key]
+            self._entries = entries
+
+    def pop(self, key: Hashable, *default: Any) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                if default:
+                    return default[0]
+                raise KeyError(key)
+            entries = dict(self._entries)
+            value = entries.pop(key)
+            self._entries = entries
+        return value
+
+    def keys(self) -> List[Hashable]:
+        return list(self._entries)
+
+    def values(self) -> List[Any]:
+        return list(self._entries.values())
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        return list(self._entries.items())
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+
+    def drain(self) -> List[Any]:
+        """Removes all entries and returns their values"""
+        with self._lock:
+            values = list(self._entries.values())
+            self._entries = {}
+        return values
+
+    def reset_after_fork(self):
+        # Another thread may have held the lock when the process forked
+        self._lock = threading.Lock()
+
+
+__conn__: _Registry = _Registry()
+__async_conn__: _Registry = _Registry()
+
+__pool__: _Registry = _Registry()
+__async_pool__: _Registry = _Registry()
+
+# Connect parameters of standalone connections, used to reconnect when a
+# connection is found dead
+__conn_params__: _Registry = _Registry()
+__async_conn_params__: _Registry = _Registry()
+
+# Parameters of the pools created by create_pool() and create_pool_async(),
+# used to recreate the pools in a forked child process
+__pool_params__: _Registry = _Registry()
+
+# os.getpid() is a system call; the process id only changes on fork
+_pid = os.getpid()
+
+# Implementations of the connections and pools inherited from the parent
+# process. They share their sockets with the parent and are kept
+# referenced so that they are never closed, which would end the parent's
+# database sessions
+__inherited__: list = []
+
+_pool_lock = threading.Lock()
+
+# Holds a sentinel per thread which owns standalone connections. The
+# sentinel is dropped when the thread exits and its finalizer discards
+# the thread's connections
+_thread_state = threading.local()
+
+# Standalone async connections leased to operations when async_connect() was
+# called with max_connections > 1
+__async_leases__: _Registry = _Registry()
+
+# Connection leased by the connection scope the current task entered.
+# Tasks inherit the variable from their creator, so a lease is only valid
+# in the task which holds it
+__async_lease__: contextvars.ContextVar = contextvars.ContextVar(
+    "select_ai_async_lease", default=None
+)
+
+# Seconds since the last successful round trip within which a standalone
+# connection is assumed to be alive and is not pinged. Same semantics as
+# python-oracledb's pool ping_interval: 0 always pings, a negative value
+# never pings
+DEFAULT_PING_INTERVAL = 60
+
+# Number of rows fetched per round trip by the bulk listing queries
+LIST_ARRAYSIZE = 256
+
+# Number of rows fetched per round trip when the SQL generated for a prompt
+# is executed locally into a DataFrame
+DATAFRAME_ARRAYSIZE = 10000
 
 __all__ = [
     "connect",
@@ -30,13 +174,121 @@ __all__ = [
     "async_is_connected",
     "get_connection",
     "async_get_connection",
+    "async_connection_scope",
     "cursor",
     "async_cursor",
     "disconnect",
     "async_disconnect",
+    "get_ping_interval",
+    "set_ping_interval",
+    "liveness_stats",
+    "LivenessStats",
 ]
 
 
+@dataclass
+class LivenessStats:
+    """Counters describing how standalone connections were health checked
+
+    :param int pings: Number of pings sent to the database
+    :param int pings_skipped: Number of pings skipped because the
+     connection had a successful round trip within the ping interval
+    :param int reconnects: Number of standalone connections re-established
+     after a dead connection was detected
+    """
+
+    pings: int = 0
+    pings_skipped: int = 0
+    reconnects: int = 0
+
+
+class _LivenessTracker:
+    """Records the last successful round trip of each standalone connection
+    so that the ping before every operation can be skipped while the
+    connection is known to be fresh
+    """
+
+    def __init__(self, ping_interval: float = DEFAULT_PING_INTERVAL):
+        self.ping_interval = ping_interval
+        self.stats = LivenessStats()
+        self._last_round_trip = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def needs_ping(self, conn, force: bool = False) -> bool:
+        with self._lock:
+            if force:
+                needs_ping = True
+            elif self.ping_interval < 0:
+                needs_ping = False
+            elif self.ping_interval == 0:
+                needs_ping = True
+            else:
+                last_round_trip = self._last_round_trip.get(conn)
+                needs_ping = last_round_trip is None or (
+                    time.monotonic() - last_round_trip >= self.ping_interval
+                )
+            if needs_ping:
+                self.stats.pings += 1
+            else:
+                self.stats.pings_skipped += 1
+            return needs_ping
+
+    def mark_alive(self, conn):
+        with self._lock:
+            self._last_round_trip[conn] = time.monotonic()
+
+    def forget(self, conn):
+        with self._lock:
+            self._last_round_trip.pop(conn, None)
+
+    def record_reconnect(self):
+        with self._lock:
+            self.stats.reconnects += 1
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = LivenessStats()
+
+    def reset_after_fork(self):
+        # Another thread may have held the lock when the process forked
+        self._lock = threading.Lock()
+        self._last_round_trip = weakref.WeakKeyDictionary()
+
+
+__liveness__ = _LivenessTracker()
+
+
+def get_ping_interval() -> float:
+    """Returns the ping interval, in seconds, of standalone connections"""
+    return __liveness__.ping_interval
+
+
+def set_ping_interval(ping_interval: float):
+    """Sets the ping interval, in seconds, of standalone connections
+
+    A standalone connection which had a successful round trip within
+    this interval is not pinged before being handed out. Value 0 pings
+    before every operation and a negative value disables pinging;
+    dead connections are then detected when the actual call fails.
+
+    :param float ping_interval: Number of seconds
+    """
+    __liveness__.ping_interval = ping_interval
+
+
+def liveness_stats(reset: bool = False) -> LivenessStats:
+    """Returns a snapshot of the standalone connection ping counters
+
+    :param bool reset: Reset the counters after taking the snapshot
+    :return: select_ai.db.LivenessStats
+    """
+    with __liveness__._lock:
+        stats = LivenessStats(**__liveness__.stats.__dict__)
+    if reset:
+        __liveness__.reset_stats()
+    return stats
+
+
 def connect(user: str, password: str, dsn: str, *args, **kwargs):
     """Creates an oracledb.Connection object
     and saves it global dictionary __conn__
@@ -54,6 +306,9 @@ def connect(user: str, password: str, dsn: str, *args, **kwargs):
         **kwargs,
     )
     _set_connection(conn=conn)
+    __conn_params__[(_pid, get_ident())] = dict(
+        user=user, password=password, dsn=dsn, args=args, kwargs=kwargs
+    )
 
 
 def create_pool(
@@ -82,6 +337,18 @@ def create_pool(
         **kwargs,
     )
     _set_connection_pool(pool=pool)
+    __pool_params__["pool"] = dict(
+        user=user,
+        password=password,
+        dsn=dsn,
+        min_size=min_size,
+        max_size=max_size,
+        increment=increment,
+        getmode=getmode,
+        wait_timeout=wait_timeout,
+        args=args,
+        kwargs=kwargs,
+    )
 
 
 def create_pool_async(
@@ -110,16 +377,42 @@ def create_pool_async(
         **kwargs,
     )
     _set_connection_pool(async_pool=async_pool)
+    __pool_params__["async_pool"] = dict(
+        user=user,
+        password=password,
+        dsn=dsn,
+        min_size=min_size,
+        max_size=max_size,
+        increment=increment,
+        getmode=getmode,
+        wait_timeout=wait_timeout,
+        args=args,
+        kwargs=kwargs,
+    )
 
 
-async def async_connect(user: str, password: str, dsn: str, *args, **kwargs):
+async def async_connect(
+    user: str,
+    password: str,
+    dsn: str,
+    *args,
+    max_connections: int = 1,
+    **kwargs,
+):
     """Creates an oracledb.AsyncConnection object
     and saves it global dictionary __async_conn__
     The connection object is thread local meaning
     in a multithreaded application, individual
     threads cannot see each other's connection
     object
+
+    With max_connections > 1, each operation leases a connection, opened
+    on demand up to max_connections, and releases it when it completes.
+    Concurrent tasks then no longer share one connection. Use
+    async_connection_scope() to keep one connection for several operations
     """
+    if max_connections < 1:
+        raise ValueError("'max_connections' must be a positive integer")
     async_conn = await oracledb.connect_async(
         user=user,
         password=password,
@@ -129,12 +422,23 @@ async def async_connect(user: str, password: str, dsn: str, *args, **kwargs):
         **kwargs,
     )
     _set_connection(async_conn=async_conn)
+    key = (_pid, get_ident())
+    params = dict(
+        user=user, password=password, dsn=dsn, args=args, kwargs=kwargs
+    )
+    __async_conn_params__[key] = params
+    if max_connections > 1:
+        __async_leases__[key] = _AsyncConnectionLeases(
+            async_conn, params, max_connections
+        )
+    else:
+        __async_leases__.pop(key, None)
 
 
 def is_connected() -> bool:
     """Checks if database connection is open and healthy"""
     try:
-        with ConnectionManager().get_connection() as conn:
+        with ConnectionManager().get_connection(force_ping=True) as conn:
             pass
         return True
     except DatabaseNotConnectedError:
@@ -144,13 +448,36 @@ def is_connected() -> bool:
 async def async_is_connected() -> bool:
     """Asynchronously checks if database connection is open and healthy"""
     try:
-        async with AsyncConnectionManager().get_connection() as conn:
+        async with AsyncConnectionManager().get_connection(
+            force_ping=True
+        ) as conn:
             pass
         return True
     except DatabaseNotConnectedError:
         return False
 
 
+def connection_identity(
+    asynchronous: bool = False,
+) -> Optional[Tuple[str, str]]:
+    """Returns the user and DSN of the connection, or pool, the calling
+    thread would use, without a round trip. None if there is none
+
+    :param bool asynchronous: Look up the async connection or pool
+    """
+    try:
+        if asynchronous:
+            manager = AsyncConnectionManager()
+        else:
+            manager = ConnectionManager()
+    except ValueError:
+        return None
+    source = manager.pool if manager.is_pool else manager.conn
+    if source is None:
+        return None
+    return (source.username or "").upper(), source.dsn or ""
+
+
 def _set_connection(
     conn: oracledb.Connection = None,
     async_conn: oracledb.AsyncConnection = None,
@@ -161,13 +488,128 @@ def _set_connection(
     :param async_conn: python-oracledb
     :return:
     """
-    key = (os.getpid(), get_ident())
+    key = (_pid, get_ident())
     if conn:
         global __conn__
         __conn__[key] = conn
     if async_conn:
         global __async_conn__
         __async_conn__[key] = async_conn
+    _track_thread(key)
+
+
+class _ThreadSentinel:
+    __slots__ = ("__weakref__",)
+
+
+def _track_thread(key: Hashable):
+    """Discards the standalone connections saved under key when the
+    current thread exits
+    """
+    if getattr(_thread_state, "key", None) == key:
+        return
+    sentinel = _ThreadSentinel()
+    _thread_state.sentinel = sentinel
+    _thread_state.key = key
+    finalizer = weakref.finalize(sentinel, _discard_thread_connections, key)
+    finalizer.atexit = False
+
+
+def _discard_thread_connections(key: Hashable):
+    """Forgets the standalone connections of an exited thread. Sync
+    connections are closed; async connections cannot be awaited here and
+    are released by python-oracledb once unreferenced
+    """
+    conn = __conn__.pop(key, None)
+    __conn_params__.pop(key, None)
+    __async_conn__.pop(key, None)
+    __async_conn_params__.pop(key, None)
+    __async_leases__.pop(key, None)
+    if conn is not None and key[0] == _pid:
+        __liveness__.forget(conn)
+        try:
+            conn.close()
+        except oracledb.Error:
+            pass
+
+
+def _pool_for_process(pools: _Registry, kind: str):
+    """Returns the pool of the current process. A pool created by
+    create_pool() or create_pool_async() in a parent process is recreated
+    from the same parameters on first use in a forked child
+    """
+    key = _pid
+    pool = pools.get(key)
+    if pool is not None or kind not in __pool_params__:
+        return pool
+    with _pool_lock:
+        pool = pools.get(key)
+        params = __pool_params__.get(kind)
+        if pool is None and params is not None:
+            create = create_pool if kind == "pool" else create_pool_async
+            create(
+                params["user"],
+                params["password"],
+                params["dsn"],
+                params["min_size"],
+                params["max_size"],
+                params["increment"],
+                params["getmode"],
+                params["wait_timeout"],
+                *params["args"],
+                **params["kwargs"],
+            )
+            pool = pools.get(key)
+    return pool
+
+
+def _before_fork():
+    # No pool is being recreated while the process forks
+    _pool_lock.acquire()
+
+
+def _after_fork_in_parent():
+    _pool_lock.release()
+
+
+def _detach(inherited: Any):
+    """Detaches a connection or pool inherited from the parent from its
+    implementation. Its finalizer, and any close() call made in the child,
+    then no longer sends a logoff over the socket shared with the parent,
+    e.g. when the interpreter shuts down after sys.exit()
+    """
+    impl = getattr(inherited, "_impl", None)
+    if impl is None:
+        return
+    __inherited__.append(impl)
+    inherited._impl = None
+
+
+def _after_fork_in_child():
+    """Forgets the connections and pools inherited from the parent so that
+    the child lazily creates its own
+    """
+    global _pid, _pool_lock
+    _pid = os.getpid()
+    _pool_lock = threading.Lock()
+    for registry in (
+        __conn__,
+        __async_conn__,
+        __pool__,
+        __async_pool__,
+        __conn_params__,
+        __async_conn_params__,
+        __pool_params__,
+        __async_leases__,
+    ):
+        registry.reset_after_fork()
+    for registry in (__conn__, __async_conn__, __pool__, __async_pool__):
+        for inherited in registry.drain():
+            _detach(inherited)
+    __conn_params__.clear()
+    __async_conn_params__.clear()
+    __async_leases__.clear()
+    __liveness__.reset_after_fork()
 
 
 def _set_connection_pool(
@@ -181,7 +623,7 @@ def _set_connection_pool(
 
     :return: None
     """
-    key = os.getpid()
+    key = _pid
     if pool:
         global __pool__
         __pool__[key] = pool
@@ -204,6 +646,46 @@ async def async_get_connection() -> AsyncGenerator[Any, Any]:
         yield conn
 
 
+@contextlib.asynccontextmanager
+async def async_connection_scope() -> AsyncGenerator[Any, Any]:
+    """Leases one async connection for the duration of the block, e.g. an
+    HTTP request. Calls made by the current task within the block use this
+    connection, which is released when the block exits. Tasks created in
+    the block lease their own connections
+
+    Typical usage:
+
+        async with select_ai.async_connection_scope():
+            await profile.chat(<PROMPT>)
+
+    A standalone connection without max_connections > 1 is shared and is
+    simply yielded
+    """
+    manager = AsyncConnectionManager()
+    if manager.is_pool:
+        async with manager.connection_from_pool() as conn:
+            token = __async_lease__.set(
+                _AsyncLease(asyncio.current_task(), conn)
+            )
+            try:
+                yield conn
+            finally:
+                __async_lease__.reset(token)
+        return
+    leases = __async_leases__.get(manager.conn_key)
+    if leases is None:
+        async with manager.get_connection() as conn:
+            yield conn
+        return
+    conn = await leases.acquire()
+    token = __async_lease__.set(_AsyncLease(asyncio.current_task(), conn))
+    try:
+        yield conn
+    finally:
+        __async_lease__.reset(token)
+        await leases.release(conn)
+
+
 @contextlib.contextmanager
 def cursor():
     """
@@ -255,17 +737,145 @@ async def async_disconnect():
     await connection_manager.disconnect()
 
 
+class _AsyncLease:
+    """Connection leased by a task for a connection scope"""
+
+    __slots__ = ("task", "conn")
+
+    def __init__(self, task: asyncio.Task, conn: oracledb.AsyncConnection):
+        self.task = task
+        self.conn = conn
+
+
+def _current_async_lease() -> Optional[_AsyncLease]:
+    lease = __async_lease__.get()
+    if lease is None or lease.task is not asyncio.current_task():
+        return None
+    return lease
+
+
+class _AsyncConnectionLeases:
+    """Standalone async connections of one thread, opened on demand up to
+    max_connections and leased to one operation or connection scope at a
+    time. The connection created by async_connect() is the first one
+    """
+
+    def __init__(
+        self,
+        async_conn: oracledb.AsyncConnection,
+        params: Mapping,
+        max_connections: int,
+    ):
+        self.params = params
+        self.max_connections = max_connections
+        self._connections = {async_conn}
+        self._idle = [async_conn]
+        self._size = 1
+        self._waiters = deque()
+        self._closed = False
+
+    def _notify(self):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _open(self) -> oracledb.AsyncConnection:
+        self._size += 1
+        try:
+            async_conn = await oracledb.connect_async(
+                user=self.params["user"],
+                password=self.params["password"],
+                dsn=self.params["dsn"],
+                connection_id_prefix="async-python-select-ai",
+                *self.params["args"],
+                **self.params["kwargs"],
+            )
+        except BaseException:
+            self._size -= 1
+            self._notify()
+            raise
+        self._connections.add(async_conn)
+        return async_conn
+
+    async def acquire(self) -> oracledb.AsyncConnection:
+        while True:
+            if self._closed:
+                raise DatabaseNotConnectedError()
+            if self._idle:
+                return self._idle.pop()
+            if self._size < self.max_connections:
+                return await self._open()
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass the wake-up on to the next waiter
+                if waiter.done() and not waiter.cancelled():
+                    self._notify()
+                raise
+
+    async def release(self, async_conn: oracledb.AsyncConnection):
+        """Returns a leased connection, which is closed if close() was
+        called while it was leased
+        """
+        if async_conn not in self._connections:
+            return
+        if self._closed:
+            self.discard(async_conn)
+            __liveness__.forget(async_conn)
+            try:
+                await async_conn.close()
+            except oracledb.Error:
+                pass
+            return
+        self._idle.append(async_conn)
+        self._notify()
+
+    def discard(self, async_conn: oracledb.AsyncConnection):
+        """Forgets a dead connection so that a new one can be opened"""
+        if async_conn not in self._connections:
+            return
+        self._connections.discard(async_conn)
+        if async_conn in self._idle:
+            self._idle.remove(async_conn)
+        self._size -= 1
+        self._notify()
+
+    async def close(self):
+        """Closes the idle connections. Leased connections are closed when
+        they are released
+        """
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for async_conn in idle:
+            self._connections.discard(async_conn)
+            __liveness__.forget(async_conn)
+            try:
+                await async_conn.close()
+            except oracledb.Error:
+                pass
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+
 class ConnectionManager:
     """
     Manages standalone connections and connection pools
     """
 
     def __init__(self):
-        global __conn__, __pool__
-        self.conn_key = (os.getpid(), get_ident())
-        self.pool_key = os.getpid()
+        self.pool_key = _pid
+        self.conn_key = (_pid, get_ident())
         self.conn = __conn__.get(self.conn_key)
-        self.pool = __pool__.get(self.pool_key)
+        if self.conn is None:
+            self.pool = _pool_for_process(__pool__, "pool")
+        else:
+            self.pool = __pool__.get(self.pool_key)
         if self.conn and self.pool:
             raise ValueError(
                 "Use either a standalone connection " "or a connection pool"
@@ -280,19 +890,34 @@ class ConnectionManager:
         return self.pool is not None
 
     @contextlib.contextmanager
-    def get_connection(self) -> Generator[Connection, Any, None]:
+    def get_connection(
+        self, force_ping: bool = False, tag: Optional[str] = None
+    ) -> Generator[Connection, Any, None]:
+        """Yields the standalone connection or a connection acquired from
+        the pool
+
+        :param bool force_ping: Ping the standalone connection even if it
+         was used within the ping interval
+        :param str tag: Pool tag of the connection to prefer. The connection
+         is released back to the pool with this tag. Ignored for
+         standalone connections
+        """
         if self.is_pool:
-            with self.connection_from_pool() as conn:
+            with self.connection_from_pool(tag=tag) as conn:
                 yield conn
         else:
-            with self.standalone_connection() as conn:
+            with self.standalone_connection(force_ping=force_ping) as conn:
                 yield conn
 
     @contextlib.contextmanager
-    def connection_from_pool(self) -> Generator[Connection, Any, None]:
+    def connection_from_pool(
+        self, tag: Optional[str] = None
+    ) -> Generator[Connection, Any, None]:
         if self.is_pool:
             try:
-                conn = self.pool.acquire()
+                # matchanytag so that a tagged connection is preferred but
+                # any idle connection is used when it is busy
+                conn = self.pool.acquire(tag=tag, matchanytag=True)
             except (oracledb.DatabaseError, oracledb.InterfaceError):
                 raise DatabaseNotConnectedError()
         else:
@@ -300,27 +925,73 @@ class ConnectionManager:
         try:
             yield conn
         finally:
-            self.pool.release(conn)
+            self.pool.release(conn, tag=tag)
 
     @contextlib.contextmanager
-    def standalone_connection(self) -> Generator[Connection, Any, None]:
-        if self.is_standalone:
+    def standalone_connection(
+        self, force_ping: bool = False
+    ) -> Generator[Connection, Any, None]:
+        if not self.is_standalone:
+            raise DatabaseNotConnectedError()
+        conn = self.conn
+        if __liveness__.needs_ping(conn, force=force_ping):
             try:
-                self.conn.ping()
+                conn.ping()
             except (oracledb.DatabaseError, oracledb.InterfaceError):
+                __liveness__.forget(conn)
                 raise DatabaseNotConnectedError()
-            yield self.conn
+        try:
+            yield conn
+        except (oracledb.DatabaseError, oracledb.InterfaceError):
+            # The ping may have been skipped, so a failed call is the
+            # first sign of a dead connection
+            if conn.is_healthy():
+                __liveness__.mark_alive(conn)
+            else:
+                __liveness__.forget(conn)
+                self._reconnect()
+            raise
         else:
-            raise DatabaseNotConnectedError()
+            __liveness__.mark_alive(conn)
+
+    def _reconnect(self):
+        """Replaces a dead standalone connection using the parameters
+        passed to select_ai.connect(). If the connection was not created
+        by select_ai.connect() or cannot be re-established, it is
+        discarded and later calls raise DatabaseNotConnectedError
+        """
+        global __conn__
+        __conn__.pop(self.conn_key, None)
+        try:
+            self.conn.close()
+        except oracledb.Error:
+            pass
+        params = __conn_params__.pop(self.conn_key, None)
+        if params is None:
+            return
+        try:
+            connect(
+                params["user"],
+                params["password"],
+                params["dsn"],
+                *params["args"],
+                **params["kwargs"],
+            )
+        except oracledb.Error:
+            return
+        __liveness__.record_reconnect()
 
     def disconnect(self, force=True):
         global __pool__, __conn__
         if self.is_pool:
             self.pool.close(force=force)
             __pool__.pop(self.pool_key, None)
+            __pool_params__.pop("pool", None)
         elif self.is_standalone:
+            __liveness__.forget(self.conn)
             self.conn.close()
             __conn__.pop(self.conn_key, None)
+            __conn_params__.pop(self.conn_key, None)
 
 
 class AsyncConnectionManager:
@@ -329,11 +1000,13 @@ class AsyncConnectionManager:
     """
 
     def __init__(self):
-        global __async_conn__, __async_pool__
-        self.conn_key = (os.getpid(), get_ident())
-        self.pool_key = os.getpid()
+        self.pool_key = _pid
+        self.conn_key = (_pid, get_ident())
         self.conn = __async_conn__.get(self.conn_key)
-        self.pool = __async_pool__.get(self.pool_key)
+        if self.conn is None:
+            self.pool = _pool_for_process(__async_pool__, "async_pool")
+        else:
+            self.pool = __async_pool__.get(self.pool_key)
         if self.conn and self.pool:
             raise ValueError(
                 "Use either a standalone connection " "or a connection pool"
@@ -348,19 +1021,60 @@ class AsyncConnectionManager:
         return self.pool is not None
 
     @contextlib.asynccontextmanager
-    async def get_connection(self):
+    async def get_connection(
+        self, force_ping: bool = False, tag: Optional[str] = None
+    ):
+        """Yields the standalone async connection or a connection acquired
+        from the async pool
+
+        :param bool force_ping: Ping the standalone connection even if it
+         was used within the ping interval
+        :param str tag: Pool tag of the connection to prefer. The connection
+         is released back to the pool with this tag. Ignored for
+         standalone connections
+        """
         if self.is_pool:
-            async with self.connection_from_pool() as conn:
+            lease = _current_async_lease()
+            if lease is not None:
+                yield lease.conn
+                return
+            async with self.connection_from_pool(tag=tag) as conn:
                 yield conn
         else:
-            async with self.standalone_connection() as conn:
+            leases = __async_leases__.get(self.conn_key)
+            lease = _current_async_lease() if leases is not None else None
+            if leases is not None and lease is None:
+                # Outside async_connection_scope() the connection is leased
+                # for this operation only
+                self.conn = await leases.acquire()
+                try:
+                    async with self.standalone_connection(
+                        force_ping=force_ping
+                    ) as conn:
+                        yield conn
+                finally:
+                    await leases.release(self.conn)
+                return
+            if lease is not None:
+                self.conn = lease.conn
+            async with self.standalone_connection(
+                force_ping=force_ping
+            ) as conn:
                 yield conn
 
+    @property
+    def max_connections(self) -> int:
+        """Number of connections operations can use at the same time"""
+        if self.is_pool:
+            return self.pool.max
+        leases = __async_leases__.get(self.conn_key)
+        return leases.max_connections if leases is not None else 1
+
     @contextlib.asynccontextmanager
-    async def connection_from_pool(self):
+    async def connection_from_pool(self, tag: Optional[str] = None):
         if self.is_pool:
             try:
-                conn = await self.pool.acquire()
+                conn = await self.pool.acquire(tag=tag, matchanytag=True)
             except (oracledb.DatabaseError, oracledb.InterfaceError):
                 raise DatabaseNotConnectedError()
         else:
@@ -368,24 +1082,104 @@ class AsyncConnectionManager:
         try:
             yield conn
         finally:
-            await self.pool.release(conn)
+            await self.pool.release(conn, tag=tag)
 
     @contextlib.asynccontextmanager
-    async def standalone_connection(self):
-        if self.is_standalone:
+    async def standalone_connection(self, force_ping: bool = False):
+        if not self.is_standalone:
+            raise DatabaseNotConnectedError()
+        conn = self.conn
+        if __liveness__.needs_ping(conn, force=force_ping):
             try:
-                await self.conn.ping()
+                await conn.ping()
             except (oracledb.DatabaseError, oracledb.InterfaceError):
+                __liveness__.forget(conn)
+                self._discard_lease()
                 raise DatabaseNotConnectedError()
-            yield self.conn
+        try:
+            yield conn
+        except (oracledb.DatabaseError, oracledb.InterfaceError):
+            # The ping may have been skipped, so a failed call is the
+            # first sign of a dead connection
+            if conn.is_healthy():
+                __liveness__.mark_alive(conn)
+            else:
+                __liveness__.forget(conn)
+                await self._reconnect()
+            raise
         else:
-            raise DatabaseNotConnectedError()
+            __liveness__.mark_alive(conn)
+
+    async def _reconnect(self):
+        """Replaces a dead standalone connection using the parameters
+        passed to select_ai.async_connect(). If the connection was not
+        created by select_ai.async_connect() or cannot be re-established,
+        it is discarded and later calls raise DatabaseNotConnectedError
+        """
+        global __async_conn__
+        if self._discard_lease():
+            # A new connection is opened by the next lease
+            try:
+                await self.conn.close()
+            except oracledb.Error:
+                pass
+            return
+        __async_conn__.pop(self.conn_key, None)
+        try:
+            await self.conn.close()
+        except oracledb.Error:
+            pass
+        params = __async_conn_params__.pop(self.conn_key, None)
+        if params is None:
+            return
+        try:
+            await async_connect(
+                params["user"],
+                params["password"],
+                params["dsn"],
+                *params["args"],
+                **params["kwargs"],
+            )
+        except oracledb.Error:
+            return
+        __liveness__.record_reconnect()
+
+    def _discard_lease(self) -> bool:
+        """Removes the dead connection of the current lease from the leased
+        connections. Returns False if connections are not leased
+        """
+        leases = __async_leases__.get(self.conn_key)
+        if leases is None:
+            return False
+        leases.discard(self.conn)
+        if _current_async_lease() is not None:
+            __async_lease__.set(None)
+        return True
 
     async def disconnect(self, force=False):
         global __async_conn__, __async_pool__
         if self.is_pool:
             await self.pool.close(force=force)
             __async_pool__.pop(self.pool_key, None)
+            __pool_params__.pop("async_pool", None)
         elif self.is_standalone:
-            await self.conn.close()
+            leases = __async_leases__.pop(self.conn_key, None)
+            if leases is not None:
+                lease = _current_async_lease()
+                if lease is not None:
+                    __async_lease__.set(None)
+                    await leases.release(lease.conn)
+                await leases.close()
+            else:
+                __liveness__.forget(self.conn)
+                await self.conn.close()
             __async_conn__.pop(self.conn_key, None)
+            __async_conn_params__.pop(self.conn_key, None)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_in_parent,
+        after_in_child=_after_fork_in_child,
+    )
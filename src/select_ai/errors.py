@@ -43,6 +43,22 @@ class ProfileNotFoundError(SelectAIError):
         return f"Profile {self.profile_name} not found"
 
 
+class ProfileNotLoadedError(SelectAIError):
+    """Description or attributes of a lazy AsyncProfile were accessed
+    before they were loaded
+    """
+
+    def __init__(self, profile_name: str):
+        self.profile_name = profile_name
+
+    def __str__(self):
+        return (
+            f"Profile {self.profile_name} is not loaded. "
+            "Use 'await profile.load()' before accessing its description "
+            "or attributes"
+        )
+
+
 class ProfileExistsError(SelectAIError):
     """Profile already exists in the database"""
 
@@ -173,3 +189,29 @@ class InvalidSQLError(SelectAIError):
 
     def __str__(self):
         return self.message
+
+
+class GenerateError(SelectAIError):
+    """DBMS_CLOUD_AI.GENERATE failed for one prompt of a batch"""
+
+    def __init__(self, prompt: str, error_message: str):
+        self.prompt = prompt
+        self.message = error_message
+
+    def __str__(self):
+        return self.message
+
+
+class QueryRejectedError(SelectAIError):
+    """Generated SQL rejected by the query guard before execution"""
+
+    def __init__(self, plan_metrics):
+        self.plan_metrics = plan_metrics
+
+    def __str__(self):
+        return (
+            f"Generated SQL rejected by the query guard "
+            f"(cost={self.plan_metrics.cost}, "
+            f"cardinality={self.plan_metrics.cardinality}): "
+            f"{self.plan_metrics.sql}"
+        )
@@ -5,9 +5,23 @@
 # http://oss.oracle.com/licenses/upl.
 # -----------------------------------------------------------------------------
 
+import itertools
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Generator, Mapping, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import oracledb
 import pandas
@@ -17,27 +31,78 @@ from select_ai.action import Action
 from select_ai.base_profile import (
     BaseProfile,
     ProfileAttributes,
+    SQLResult,
     convert_json_rows_to_df,
+    convert_oracle_df_batch_to_output_type,
+    convert_oracle_df_batches_to_output_type,
+    conversation_tag,
+    validate_batch_params,
+    validate_generated_query,
+    validate_output_type,
     validate_params_for_feedback,
     validate_params_for_summary,
 )
-from select_ai.db import ConnectionManager, cursor
+from select_ai.batch import BatchUpdateMixin, pending_batch
+from select_ai.cache import ResponseCache
+from select_ai.db import (
+    DATAFRAME_ARRAYSIZE,
+    LIST_ARRAYSIZE,
+    ConnectionManager,
+    cursor,
+    get_connection,
+)
 from select_ai.errors import (
+    GenerateError,
+    InvalidSQLError,
     ProfileAttributesEmptyError,
     ProfileNotFoundError,
 )
 from select_ai.feedback import FeedbackOperation, FeedbackType
 from select_ai.provider import Provider
+from select_ai.query_guard import (
+    QueryGuard,
+    call_timeout_for,
+    guarded_batches,
+)
+from select_ai.single_flight import __single_flight__, request_key
 from select_ai.sql import (
+    GENERATE_MANY,
     GET_USER_AI_PROFILE,
     GET_USER_AI_PROFILE_ATTRIBUTES,
-    LIST_USER_AI_PROFILES,
+    LIST_USER_AI_PROFILES_WITH_ATTRIBUTES,
 )
+from select_ai.streaming import callfunc_clob, read_lob, read_lob_ahead
 from select_ai.summary import SummaryParams
 from select_ai.synthetic_data import SyntheticDataAttributes
 
+if TYPE_CHECKING:
+    import pyarrow
+
+# Number of threads reading the metadata of lazy profiles created with
+# prefetch=True
+PREFETCH_WORKERS = 4
+
+# Process id and executor shared by all prefetching profiles. A forked
+# child has none of the parent's threads and creates its own executor
+_prefetch_executor: Optional[Tuple[int, ThreadPoolExecutor]] = None
+_prefetch_lock = threading.Lock()
+
+
+def _prefetch(profile: "Profile") -> None:
+    """Queues the read of the metadata of a lazy profile"""
+    global _prefetch_executor
+    pid = os.getpid()
+    with _prefetch_lock:
+        if _prefetch_executor is None or _prefetch_executor[0] != pid:
+            _prefetch_executor = pid, ThreadPoolExecutor(
+                max_workers=PREFETCH_WORKERS,
+                thread_name_prefix="select_ai_prefetch",
+            )
+        executor = _prefetch_executor[1]
+    executor.submit(profile._prefetch_metadata)
+
 
-class Profile(BaseProfile):
+class Profile(BaseProfile, BatchUpdateMixin):
     """Profile class represents an AI Profile. It defines
     attributes and methods to interact with the underlying
     AI Provider. All methods in this class are synchronous
@@ -57,14 +122,14 @@ class Profile(BaseProfile):
         if self.profile_name:
             profile_exists = False
             try:
-                saved_description = self._get_profile_description(
+                saved_description, saved_attributes = self._get_metadata(
                     profile_name=self.profile_name
                 )
                 profile_exists = True
-                saved_attributes = self._get_attributes(
-                    profile_name=self.profile_name,
-                    raise_on_empty=True,
-                )
+                if saved_attributes is None:
+                    raise ProfileAttributesEmptyError(
+                        profile_name=self.profile_name
+                    )
                 self._raise_error_if_profile_exists()
             except ProfileAttributesEmptyError:
                 if self.raise_error_on_empty_attributes:
@@ -82,6 +147,27 @@ class Profile(BaseProfile):
                     "Attribute 'profile_name' cannot be empty or None"
                 )
 
+    @classmethod
+    def _get_metadata(
+        cls, profile_name: str
+    ) -> Tuple[Optional[str], Optional[ProfileAttributes]]:
+        """Get description and attributes of a saved profile. These are
+        served from the metadata cache when it is enabled
+
+        :param str profile_name: Name of the profile
+        :return: Tuple of description and attributes
+        :raises: ProfileNotFoundError
+        """
+        metadata = cls._cached_metadata(profile_name)
+        if metadata is None:
+            description = cls._get_profile_description(
+                profile_name=profile_name
+            )
+            attributes = cls._get_attributes(profile_name=profile_name)
+            metadata = (description, attributes)
+            cls._cache_metadata(profile_name, description, attributes)
+        return metadata
+
     @staticmethod
     def _get_profile_description(profile_name) -> Union[str, None]:
         """Get description of profile from USER_CLOUD_AI_PROFILES
@@ -163,12 +249,19 @@ class Profile(BaseProfile):
         :return: None
 
         """
+        batch = pending_batch(self)
+        if batch is not None:
+            batch.add(self, {attribute_name: attribute_value})
+            return
         self.attributes.set_attribute(attribute_name, attribute_value)
-        if isinstance(attribute_value, Provider):
-            for k, v in attribute_value.dict().items():
-                self._set_attribute(k, v)
-        else:
-            self._set_attribute(attribute_name, attribute_value)
+        try:
+            if isinstance(attribute_value, Provider):
+                for k, v in attribute_value.dict().items():
+                    self._set_attribute(k, v)
+            else:
+                self._set_attribute(attribute_name, attribute_value)
+        finally:
+            self.invalidate_metadata_cache(self.profile_name)
 
     def set_attributes(self, attributes: ProfileAttributes):
         """Updates AI profile attributes on the Python object and also
@@ -183,6 +276,10 @@ class Profile(BaseProfile):
                 "'attributes' must be an object of type"
                 " select_ai.ProfileAttributes"
             )
+        batch = pending_batch(self)
+        if batch is not None:
+            batch.add(self, attributes)
+            return
         parameters = {
             "profile_name": self.profile_name,
             "attributes": attributes.json(),
@@ -191,6 +288,7 @@ class Profile(BaseProfile):
             cr.callproc(
                 "DBMS_CLOUD_AI.SET_ATTRIBUTES", keyword_parameters=parameters
             )
+        self.invalidate_metadata_cache(self.profile_name)
         self.attributes = self.get_attributes()
 
     def create(self, replace: Optional[int] = False) -> None:
@@ -226,6 +324,7 @@ class Profile(BaseProfile):
                     )
                 else:
                     raise
+        self.invalidate_metadata_cache(self.profile_name)
 
     @staticmethod
     def _delete(profile_name: str, force: bool = False):
@@ -237,6 +336,7 @@ class Profile(BaseProfile):
                     "force": force,
                 },
             )
+        BaseProfile.invalidate_metadata_cache(profile_name)
 
     def delete(self, force=False) -> None:
         """Deletes an AI profile from the database
@@ -269,6 +369,69 @@ class Profile(BaseProfile):
         """
         return cls(profile_name, raise_error_if_exists=False)
 
+    @classmethod
+    def lazy(
+        cls,
+        profile_name: str,
+        prefetch: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        query_guard: Optional[QueryGuard] = None,
+    ) -> "Profile":
+        """Create a proxy Profile object for a profile saved in the database
+        without querying the database. The description and attributes are
+        read when one of them is first accessed. generate(), chat() and
+        the other actions only pass the profile name to the database and
+        do not read them
+
+        :param str profile_name: The name of the AI profile
+        :param bool prefetch: Read the description and attributes in the
+         background right away, on a small pool of threads shared by all
+         profiles. Only done with a connection pool: a standalone
+         connection belongs to the thread which created it. Default value
+         is False
+        :param select_ai.cache.ResponseCache response_cache: Cache for
+         responses of generate()
+        :param select_ai.QueryGuard query_guard: Checks the optimizer plan
+         of generated SQL before it is executed locally
+        :return: select_ai.Profile
+        """
+        if not profile_name:
+            raise ValueError("'profile_name' cannot be empty or None")
+        profile = cls.__new__(cls)
+        profile._init_lazy(
+            profile_name,
+            response_cache=response_cache,
+            query_guard=query_guard,
+        )
+        profile._metadata_lock = threading.Lock()
+        if prefetch and ConnectionManager().is_pool:
+            _prefetch(profile)
+        return profile
+
+    def load(self) -> None:
+        """Read the description and attributes of a lazy profile. Does
+        nothing if they were already read
+
+        :return: None
+        :raises: ProfileNotFoundError
+        """
+        if self._unloaded:
+            self._load_metadata()
+
+    def _load_metadata(self) -> None:
+        with self._metadata_lock:
+            if self._unloaded:
+                self._set_metadata(
+                    *self._get_metadata(profile_name=self.profile_name)
+                )
+
+    def _prefetch_metadata(self) -> None:
+        try:
+            self._load_metadata()
+        except Exception:
+            # Raised again when the metadata is accessed
+            pass
+
     def _save_feedback(
         self,
         feedback_type: FeedbackType = None,
@@ -367,17 +530,15 @@ class Profile(BaseProfile):
         :return: Iterator[Profile]
         """
         with cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
             cr.execute(
-                LIST_USER_AI_PROFILES,
+                LIST_USER_AI_PROFILES_WITH_ATTRIBUTES,
                 profile_name_pattern=profile_name_pattern,
+                fetch_lobs=False,
             )
-            for row in cr.fetchall():
-                profile_name = row[0]
-                yield cls(
-                    profile_name=profile_name,
-                    raise_error_if_exists=False,
-                    raise_error_on_empty_attributes=False,
-                )
+            for profile_name, description, attributes in cr:
+                yield cls._from_row(profile_name, description, attributes)
 
     def _generate_with_cursor(
         self,
@@ -395,15 +556,7 @@ class Profile(BaseProfile):
         :return: Union[pandas.DataFrame, str]
         """
         parameters = self._generate_parameters(prompt, action, params)
-        data = cr.callfunc(
-            "DBMS_CLOUD_AI.GENERATE",
-            oracledb.DB_TYPE_CLOB,
-            keyword_parameters=parameters,
-        )
-        if data is not None:
-            result = data.read()
-        else:
-            result = None
+        result = callfunc_clob(cr, "DBMS_CLOUD_AI.GENERATE", parameters)
         if action == Action.RUNSQL:
             return convert_json_rows_to_df(result)
         else:
@@ -433,6 +586,7 @@ class Profile(BaseProfile):
         action: Optional[Action],
         params: Mapping = None,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> Generator[str, None, None]:
         with cursor() as cr:
             yield from self._generate_stream_with_cursor(
@@ -441,6 +595,7 @@ class Profile(BaseProfile):
                 action=action,
                 params=params,
                 chunk_size=chunk_size,
+                read_ahead=read_ahead,
             )
 
     def _generate_stream_with_cursor(
@@ -450,11 +605,14 @@ class Profile(BaseProfile):
         action: Optional[Action],
         params: Mapping = None,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> Generator[str, None, None]:
         if action == Action.RUNSQL:
             raise ValueError("stream=True is not supported for run_sql")
         if chunk_size <= 0:
             raise ValueError("chunk_size must be greater than 0")
+        if read_ahead < 0:
+            raise ValueError("read_ahead cannot be negative")
 
         parameters = self._generate_parameters(prompt, action, params)
         data = cr.callfunc(
@@ -465,13 +623,10 @@ class Profile(BaseProfile):
         if data is None:
             return
 
-        offset = 1
-        while True:
-            chunk = data.read(offset=offset, amount=chunk_size)
-            if not chunk:
-                break
-            yield chunk
-            offset += len(chunk)
+        if read_ahead:
+            yield from read_lob_ahead(data, chunk_size, read_ahead)
+        else:
+            yield from read_lob(data, chunk_size)
 
     def generate(
         self,
@@ -480,6 +635,7 @@ class Profile(BaseProfile):
         params: Mapping = None,
         stream: bool = False,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> Union[pandas.DataFrame, str, Generator[str, None, None], None]:
         """Perform AI translation using this profile
 
@@ -489,14 +645,35 @@ class Profile(BaseProfile):
          conversation_id for context-aware chats
         :param bool stream: Return an iterator of response chunks
         :param int chunk_size: Number of characters to read per stream chunk
+        :param int read_ahead: Number of stream chunks read ahead of the
+         consumer in the background. Chunks then start at chunk_size and
+         grow. Default value is 0 i.e. no read-ahead
         :return: Union[pandas.DataFrame, str]
         """
         if stream:
-            return self._generate_stream(prompt, action, params, chunk_size)
-        with cursor() as cr:
-            return self._generate_with_cursor(
-                cr, prompt=prompt, action=action, params=params
+            return self._generate_stream(
+                prompt, action, params, chunk_size, read_ahead
             )
+        response_cache = self.response_cache
+        if response_cache is not None:
+            result = response_cache.lookup(self, prompt, action, params)
+            if result is not None:
+                return result
+
+        def _generate():
+            with cursor() as cr:
+                result = self._generate_with_cursor(
+                    cr, prompt=prompt, action=action, params=params
+                )
+            if response_cache is not None:
+                response_cache.store(self, prompt, action, params, result)
+            return result
+
+        # Identical concurrent requests share one database call when
+        # coalescing is enabled
+        return __single_flight__.do(
+            request_key(self, prompt, action, params), _generate
+        )
 
     def chat(
         self,
@@ -504,6 +681,7 @@ class Profile(BaseProfile):
         params: Mapping = None,
         stream: bool = False,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> Union[str, Generator[str, None, None]]:
         """Chat with the LLM
 
@@ -511,6 +689,9 @@ class Profile(BaseProfile):
         :param params: Parameters to include in the LLM request
         :param bool stream: Return an iterator of response chunks
         :param int chunk_size: Number of characters to read per stream chunk
+        :param int read_ahead: Number of stream chunks read ahead of the
+         consumer in the background. Chunks then start at chunk_size and
+         grow. Default value is 0 i.e. no read-ahead
         :return: str
         """
         return self.generate(
@@ -519,15 +700,29 @@ class Profile(BaseProfile):
             params=params,
             stream=stream,
             chunk_size=chunk_size,
+            read_ahead=read_ahead,
         )
 
     @contextmanager
-    def chat_session(self, conversation: Conversation, delete: bool = False):
+    def chat_session(
+        self,
+        conversation: Conversation,
+        delete: bool = False,
+        lease_per_turn: bool = False,
+        affinity: bool = False,
+    ):
         """Starts a new chat session for context-aware conversations
 
         :param Conversation conversation: Conversation object to use for this
          chat session
         :param bool delete: Delete conversation after session ends
+        :param bool lease_per_turn: Acquire a pooled connection for every
+         request and release it right after, instead of holding one
+         connection for the whole session
+        :param bool affinity: With lease_per_turn, tag the connection with
+         the conversation_id so that the next request of the conversation
+         prefers the same database session. Pool tags are only honoured in
+         python-oracledb Thick mode; in Thin mode this has no effect
 
         :return:
         """
@@ -538,7 +733,15 @@ class Profile(BaseProfile):
             ):
                 conversation.create()
             params = {"conversation_id": conversation.conversation_id}
-            with Session(profile=self, params=params) as session:
+            tag = None
+            if lease_per_turn and affinity:
+                tag = conversation_tag(conversation.conversation_id)
+            with Session(
+                profile=self,
+                params=params,
+                lease_per_turn=lease_per_turn,
+                tag=tag,
+            ) as session:
                 yield session
         finally:
             if delete:
@@ -550,6 +753,7 @@ class Profile(BaseProfile):
         params: Mapping = None,
         stream: bool = False,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> Union[str, Generator[str, None, None]]:
         """Narrate the result of the SQL
 
@@ -557,6 +761,9 @@ class Profile(BaseProfile):
         :param params: Parameters to include in the LLM request
         :param bool stream: Return an iterator of response chunks
         :param int chunk_size: Number of characters to read per stream chunk
+        :param int read_ahead: Number of stream chunks read ahead of the
+         consumer in the background. Chunks then start at chunk_size and
+         grow. Default value is 0 i.e. no read-ahead
         :return: str
         """
         return self.generate(
@@ -565,6 +772,7 @@ class Profile(BaseProfile):
             params=params,
             stream=stream,
             chunk_size=chunk_size,
+            read_ahead=read_ahead,
         )
 
     def explain_sql(
@@ -573,6 +781,7 @@ class Profile(BaseProfile):
         params: Mapping = None,
         stream: bool = False,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> Union[str, Generator[str, None, None]]:
         """Explain the generated SQL
 
@@ -580,6 +789,9 @@ class Profile(BaseProfile):
         :param params: Parameters to include in the LLM request
         :param bool stream: Return an iterator of response chunks
         :param int chunk_size: Number of characters to read per stream chunk
+        :param int read_ahead: Number of stream chunks read ahead of the
+         consumer in the background. Chunks then start at chunk_size and
+         grow. Default value is 0 i.e. no read-ahead
         :return: str
         """
         return self.generate(
@@ -588,24 +800,158 @@ class Profile(BaseProfile):
             params=params,
             stream=stream,
             chunk_size=chunk_size,
+            read_ahead=read_ahead,
         )
 
-    def run_sql(self, prompt: str, params: Mapping = None) -> pandas.DataFrame:
+    def run_sql(
+        self,
+        prompt: str,
+        params: Mapping = None,
+        execute_locally: bool = False,
+        output_type: str = "pandas",
+    ) -> Union[pandas.DataFrame, "pyarrow.Table"]:
         """Run the generate SQL statement and return a pandas Dataframe built
         using the result set
 
+        By default the database runs the SQL and returns the result set as
+        JSON. With execute_locally, only the SQL is generated and it is then
+        executed on the same connection with python-oracledb's DataFrame
+        fetch, which keeps the column types and avoids building the
+        DataFrame row by row. This requires pyarrow
+
         :param str prompt: Natural language prompt
         :param params: Parameters to include in the LLM request
-        :return: pandas.DataFrame
+        :param bool execute_locally: Execute the generated SQL from
+         python-oracledb
+        :param str output_type: "pandas" for a pandas.DataFrame or "arrow"
+         for a pyarrow.Table. Only used with execute_locally
+        :return: pandas.DataFrame, or pyarrow.Table with execute_locally and
+         output_type "arrow"
         """
+        if execute_locally or self.query_guard is not None:
+            validate_output_type(output_type)
+            return self.generate_and_run(prompt, params, output_type).data
         return self.generate(prompt, action=Action.RUNSQL, params=params)
 
+    def generate_and_run(
+        self,
+        prompt: str,
+        params: Mapping = None,
+        output_type: str = "pandas",
+    ) -> SQLResult:
+        """Generate the SQL for a prompt with a single LLM call and execute
+        it locally on the same connection. Returns both the SQL and its
+        result set, with the time spent in each phase. If the profile has a
+        response cache, the generated SQL is looked up and stored in it.
+        This requires pyarrow
+
+        :param str prompt: Natural language prompt
+        :param params: Parameters to include in the LLM request
+        :param str output_type: "pandas" for a pandas.DataFrame or "arrow"
+         for a pyarrow.Table
+        :return: select_ai.SQLResult
+        """
+        validate_output_type(output_type)
+        response_cache = self.response_cache
+        with get_connection() as conn:
+            started_at = time.perf_counter()
+            sql = None
+            if response_cache is not None:
+                sql = response_cache.lookup(
+                    self, prompt, Action.SHOWSQL, params
+                )
+            if sql is None:
+                with conn.cursor() as cr:
+                    sql = self._generate_with_cursor(
+                        cr, prompt=prompt, action=Action.SHOWSQL, params=params
+                    )
+                if response_cache is not None:
+                    response_cache.store(
+                        self, prompt, Action.SHOWSQL, params, sql
+                    )
+            generated_at = time.perf_counter()
+            query = validate_generated_query(sql)
+            query_guard = self.query_guard
+            plan = None
+            if query_guard is not None:
+                query, plan = query_guard.check(conn, query)
+            with call_timeout_for(query_guard, conn):
+                batches = conn.fetch_df_batches(
+                    query, size=DATAFRAME_ARRAYSIZE
+                )
+                odfs = list(itertools.islice(batches, 1))
+                executed_at = time.perf_counter()
+                odfs.extend(batches)
+            data = convert_oracle_df_batches_to_output_type(odfs, output_type)
+        return SQLResult(
+            sql=sql,
+            data=data,
+            llm_time=generated_at - started_at,
+            execution_time=executed_at - generated_at,
+            fetch_time=time.perf_counter() - executed_at,
+            plan=plan,
+        )
+
+    def run_sql_batches(
+        self,
+        prompt: str,
+        params: Mapping = None,
+        batch_size: int = DATAFRAME_ARRAYSIZE,
+        max_rows: Optional[int] = None,
+        output_type: str = "pandas",
+    ) -> Generator[Any, None, None]:
+        """Generate the SQL for a prompt, execute it locally and yield the
+        result set in batches of batch_size rows, so that memory use does
+        not depend on the size of the result set. A connection is held
+        until the generator is exhausted or closed. This requires pyarrow
+
+        :param str prompt: Natural language prompt
+        :param params: Parameters to include in the LLM request
+        :param int batch_size: Number of rows fetched per round trip and
+         per yielded batch
+        :param int max_rows: Stop after this many rows. Defaults to no
+         limit
+        :param str output_type: "pandas" to yield pandas.DataFrame batches
+         or "arrow" to yield pyarrow.RecordBatch batches
+        :return: Generator of batches
+        """
+        validate_output_type(output_type)
+        validate_batch_params(batch_size, max_rows)
+        rows_left = max_rows
+        with get_connection() as conn:
+            with conn.cursor() as cr:
+                sql = self._generate_with_cursor(
+                    cr, prompt=prompt, action=Action.SHOWSQL, params=params
+                )
+            query = validate_generated_query(sql)
+            query_guard = self.query_guard
+            if query_guard is not None:
+                query, _ = query_guard.check(conn, query)
+            if rows_left == 0:
+                return
+            for odf in guarded_batches(
+                query_guard,
+                conn,
+                conn.fetch_df_batches(query, size=batch_size),
+            ):
+                batch = convert_oracle_df_batch_to_output_type(
+                    odf, output_type, rows_left
+                )
+                if batch is None:
+                    continue
+                yield batch
+                if rows_left is not None:
+                    rows_left -= len(batch)
+                    if rows_left == 0:
+                        return
+
     def show_sql(
         self,
         prompt: str,
         params: Mapping = None,
         stream: bool = False,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> Union[str, Generator[str, None, None]]:
         """Show the generated SQL
 
@@ -613,6 +959,9 @@ class Profile(BaseProfile):
         :param params: Parameters to include in the LLM request
         :param bool stream: Return an iterator of response chunks
         :param int chunk_size: Number of characters to read per stream chunk
+        :param int read_ahead: Number of stream chunks read ahead of the
+         consumer in the background. Chunks then start at chunk_size and
+         grow. Default value is 0 i.e. no read-ahead
         :return: str
         """
         return self.generate(
@@ -621,6 +970,7 @@ class Profile(BaseProfile):
             params=params,
             stream=stream,
             chunk_size=chunk_size,
+            read_ahead=read_ahead,
         )
 
     def show_prompt(
@@ -629,6 +979,7 @@ class Profile(BaseProfile):
         params: Mapping = None,
         stream: bool = False,
         chunk_size: int = 8192,
+        read_ahead: int = 0,
     ) -> Union[str, Generator[str, None, None]]:
         """Show the prompt sent to LLM
 
@@ -636,6 +987,9 @@ class Profile(BaseProfile):
         :param params: Parameters to include in the LLM request
         :param bool stream: Return an iterator of response chunks
         :param int chunk_size: Number of characters to read per stream chunk
+        :param int read_ahead: Number of stream chunks read ahead of the
+         consumer in the background. Chunks then start at chunk_size and
+         grow. Default value is 0 i.e. no read-ahead
         :return: str
         """
         return self.generate(
@@ -644,6 +998,7 @@ class Profile(BaseProfile):
             params=params,
             stream=stream,
             chunk_size=chunk_size,
+            read_ahead=read_ahead,
         )
 
     def summarize(
@@ -675,12 +1030,7 @@ class Profile(BaseProfile):
         )
         parameters["profile_name"] = self.profile_name
         with cursor() as cr:
-            data = cr.callfunc(
-                "DBMS_CLOUD_AI.SUMMARIZE",
-                oracledb.DB_TYPE_CLOB,
-                keyword_parameters=parameters,
-            )
-        return data.read() if data else None
+            return callfunc_clob(cr, "DBMS_CLOUD_AI.SUMMARIZE", parameters)
 
     def generate_synthetic_data(
         self, synthetic_data_attributes: SyntheticDataAttributes
@@ -712,6 +1062,59 @@ class Profile(BaseProfile):
                 keyword_parameters=keyword_parameters,
             )
 
+    def generate_many(
+        self,
+        prompt_specifications: List[Tuple[str, Action]],
+        params: Mapping = None,
+    ) -> List[Union[str, pandas.DataFrame, GenerateError]]:
+        """Send multiple prompts in a single roundtrip to the Database. The
+        prompts are generated one after the other by a PL/SQL block and all
+        responses are returned in one CLOB. A prompt which fails does not
+        abort the batch, its error is returned in place of the response
+
+        :param List[Tuple[str, Action]] prompt_specifications: List of
+         2-element tuples. First element is the prompt and second is the
+         corresponding action
+        :param params: Parameters to include in every LLM request
+        :return: List[Union[str, pandas.DataFrame, GenerateError]] in the
+         order of prompt_specifications
+        """
+        requests = []
+        for prompt, action in prompt_specifications:
+            if not prompt:
+                raise ValueError("prompt cannot be empty or None")
+            request = {"prompt": prompt, "action": str(Action(action))}
+            if params:
+                request["params"] = json.dumps(params)
+            requests.append(request)
+        if not requests:
+            return []
+        with cursor() as cr:
+            responses_var = cr.var(oracledb.DB_TYPE_CLOB)
+            cr.execute(
+                GENERATE_MANY,
+                requests=json.dumps(requests),
+                profile_name=self.profile_name,
+                responses=responses_var,
+            )
+            responses = json.loads(responses_var.getvalue().read())
+        results = []
+        for (prompt, action), response in zip(
+            prompt_specifications, responses
+        ):
+            if "error" in response:
+                results.append(GenerateError(prompt, response["error"]))
+            elif Action(action) == Action.RUNSQL:
+                try:
+                    results.append(
+                        convert_json_rows_to_df(response.get("response"))
+                    )
+                except InvalidSQLError as e:
+                    results.append(GenerateError(prompt, e.message))
+            else:
+                results.append(response.get("response"))
+        return results
+
     def translate(
         self, text: str, source_language: str, target_language: str
     ) -> Union[str, None]:
@@ -730,48 +1133,83 @@ class Profile(BaseProfile):
             "target_language": target_language,
         }
         with cursor() as cr:
-            data = cr.callfunc(
-                "DBMS_CLOUD_AI.TRANSLATE",
-                oracledb.DB_TYPE_CLOB,
-                keyword_parameters=parameters,
-            )
-        if data is not None:
-            result = data.read()
-            return result
-        return None
+            return callfunc_clob(cr, "DBMS_CLOUD_AI.TRANSLATE", parameters)
 
 
 class Session:
     """Session lets you persist request parameters across DBMS_CLOUD_AI
     requests. This is useful in context-aware conversations
+
+    By default the session holds one connection from entry to exit. With
+    lease_per_turn=True it only holds its parameters, e.g. the
+    conversation_id, and every request acquires a pooled connection which
+    is released as soon as the response is read, so that many idle
+    sessions share a small pool
     """
 
-    def __init__(self, profile: Profile, params: Mapping):
+    def __init__(
+        self,
+        profile: Profile,
+        params: Mapping,
+        lease_per_turn: bool = False,
+        tag: Optional[str] = None,
+    ):
         """
 
         :param profile: An AI Profile to use in this session
         :param params: Parameters to be persisted across requests
+        :param bool lease_per_turn: Acquire a connection per request instead
+         of holding one for the whole session
+        :param str tag: Pool tag used to prefer the connection of the
+         previous request when lease_per_turn is True
         """
         self.params = params
         self.profile = profile
+        self.lease_per_turn = lease_per_turn
+        self.tag = tag
         self._conn = None
         self._conn_cm = None
         self._cursor = None
 
-    def chat(
-        self, prompt: str, stream: bool = False, chunk_size: int = 8192
-    ) -> Union[str, Generator[str, None, None]]:
-        if stream:
-            return self.profile._generate_stream_with_cursor(
-                self._cursor,
+    @contextmanager
+    def _turn_cursor(self):
+        """Yields the cursor of the session's connection, or a cursor of a
+        connection leased for the current request only
+        """
+        if not self.lease_per_turn:
+            yield self._cursor
+            return
+        with ConnectionManager().get_connection(tag=self.tag) as conn:
+            cr = conn.cursor()
+            try:
+                yield cr
+            finally:
+                cr.close()
+
+    def _generate(self, prompt: str, action: Action):
+        with self._turn_cursor() as cr:
+            return self.profile._generate_with_cursor(
+                cr, prompt=prompt, action=action, params=self.params
+            )
+
+    def _generate_stream(
+        self, prompt: str, action: Action, chunk_size: int
+    ) -> Generator[str, None, None]:
+        with self._turn_cursor() as cr:
+            yield from self.profile._generate_stream_with_cursor(
+                cr,
                 prompt=prompt,
-                action=Action.CHAT,
+                action=action,
                 params=self.params,
                 chunk_size=chunk_size,
             )
-        return self.profile._generate_with_cursor(
-            self._cursor, prompt=prompt, action=Action.CHAT, params=self.params
-        )
+
+    def chat(
+        self, prompt: str, stream: bool = False, chunk_size: int = 8192
+    ) -> Union[str, Generator[str, None, None]]:
+        if stream:
+            return self._generate_stream(prompt, Action.CHAT, chunk_size)
+        return self._generate(prompt, Action.CHAT)
 
     def narrate(
         self, prompt: str, stream: bool = False, chunk_size: int = 8192
@@ -784,16 +1222,8 @@ class Session:
         :return: str
         """
         if stream:
-            return self.profile._generate_stream_with_cursor(
-                self._cursor,
-                prompt=prompt,
-                action=Action.NARRATE,
-                params=self.params,
-                chunk_size=chunk_size,
-            )
-        return self.profile._generate_with_cursor(
-            self._cursor, prompt, action=Action.NARRATE, params=self.params
-        )
+            return self._generate_stream(prompt, Action.NARRATE, chunk_size)
+        return self._generate(prompt, Action.NARRATE)
 
     def explain_sql(
         self, prompt: str, stream: bool = False, chunk_size: int = 8192
@@ -806,16 +1236,8 @@ class Session:
         :return: str
         """
         if stream:
-            return self.profile._generate_stream_with_cursor(
-                self._cursor,
-                prompt=prompt,
-                action=Action.EXPLAINSQL,
-                params=self.params,
-                chunk_size=chunk_size,
-            )
-        return self.profile._generate_with_cursor(
-            self._cursor, prompt, action=Action.EXPLAINSQL, params=self.params
-        )
+            return self._generate_stream(prompt, Action.EXPLAINSQL, chunk_size)
+        return self._generate(prompt, Action.EXPLAINSQL)
 
     def run_sql(self, prompt: str) -> pandas.DataFrame:
         """Run the generate SQL statement and return a pandas Dataframe built
@@ -824,9 +1246,7 @@ class Session:
         :param str prompt: Natural language prompt
         :return: pandas.DataFrame
         """
-        return self.profile._generate_with_cursor(
-            self._cursor, prompt, action=Action.RUNSQL, params=self.params
-        )
+        return self._generate(prompt, Action.RUNSQL)
 
     def show_sql(
         self, prompt: str, stream: bool = False, chunk_size: int = 8192
@@ -840,16 +1260,8 @@ class Session:
         :return: str
         """
         if stream:
-            return self.profile._generate_stream_with_cursor(
-                self._cursor,
-                prompt=prompt,
-                action=Action.SHOWSQL,
-                params=self.params,
-                chunk_size=chunk_size,
-            )
-        return self.profile._generate_with_cursor(
-            self._cursor, prompt, action=Action.SHOWSQL, params=self.params
-        )
+            return self._generate_stream(prompt, Action.SHOWSQL, chunk_size)
+        return self._generate(prompt, Action.SHOWSQL)
 
     def show_prompt(
         self, prompt: str, stream: bool = False, chunk_size: int = 8192
@@ -863,21 +1275,14 @@ class Session:
         :return: str
         """
         if stream:
-            return self.profile._generate_stream_with_cursor(
-                self._cursor,
-                prompt=prompt,
-                action=Action.SHOWPROMPT,
-                params=self.params,
-                chunk_size=chunk_size,
-            )
-        return self.profile._generate_with_cursor(
-            self._cursor, prompt, action=Action.SHOWPROMPT, params=self.params
-        )
+            return self._generate_stream(prompt, Action.SHOWPROMPT, chunk_size)
+        return self._generate(prompt, Action.SHOWPROMPT)
 
     def __enter__(self):
-        self._conn_cm = ConnectionManager().get_connection()
-        self._conn = self._conn_cm.__enter__()
-        self._cursor = self._conn.cursor()
+        if not self.lease_per_turn:
+            self._conn_cm = ConnectionManager().get_connection()
+            self._conn = self._conn_cm.__enter__()
+            self._cursor = self._conn.cursor()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,247 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+import contextlib
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from select_ai.errors import QueryRejectedError
+from select_ai.sql import (
+    EXPLAIN_PLAN,
+    GET_PLAN_METRICS,
+    LIMIT_ROWS,
+    ROLLBACK_PLAN,
+    SAVEPOINT_PLAN,
+)
+
+__all__ = ["PlanMetrics", "QueryGuard"]
+
+ALLOWED = "allowed"
+CAPPED = "capped"
+REJECTED = "rejected"
+
+
+@dataclass
+class PlanMetrics:
+    """Optimizer estimates of a generated SQL statement, read from
+    PLAN_TABLE before the statement was executed
+
+    :param str sql: SQL statement which was explained
+    :param int cost: Optimizer cost of the statement
+    :param int cardinality: Estimated number of rows returned
+    :param int bytes: Estimated number of bytes returned
+    :param str decision: "allowed", "capped" or "rejected"
+    :param float explained_at: Time of the EXPLAIN PLAN, in seconds since
+     the epoch
+    :param float explain_time: Seconds spent explaining the statement
+    """
+
+    sql: str
+    cost: Optional[int]
+    cardinality: Optional[int]
+    bytes: Optional[int]
+    decision: str
+    explained_at: float
+    explain_time: float
+
+
+class QueryGuard:
+    """Checks the optimizer plan of SQL generated for a prompt before it is
+    executed locally by run_sql(), run_sql_batches() or generate_and_run().
+    Statements above max_cost are rejected. Statements returning more than
+    max_cardinality rows are limited to row_cap rows, or rejected if
+    row_cap is not set. The plan metrics of the last history_size
+    statements are kept for later analysis
+
+    :param int max_cost: Maximum optimizer cost of a statement
+    :param int max_cardinality: Maximum estimated number of rows returned
+     by a statement
+    :param int row_cap: Number of rows a statement above max_cardinality is
+     limited to instead of being rejected
+    :param int call_timeout: Milliseconds a single round trip of the
+     statement may take before it is interrupted
+    :param int history_size: Number of plan metrics kept in history
+    """
+
+    def __init__(
+        self,
+        max_cost: Optional[int] = None,
+        max_cardinality: Optional[int] = None,
+        row_cap: Optional[int] = None,
+        call_timeout: Optional[int] = None,
+        history_size: int = 1000,
+    ):
+        if row_cap is not None and row_cap < 1:
+            raise ValueError("'row_cap' must be a positive integer")
+        self.max_cost = max_cost
+        self.max_cardinality = max_cardinality
+        self.row_cap = row_cap
+        self.call_timeout = call_timeout
+        self._history = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+
+    def _decide(self, sql: str, row: Optional[Tuple], started_at: float):
+        cost, cardinality, nbytes = row if row else (None, None, None)
+        decision = ALLOWED
+        if (
+            self.max_cost is not None
+            and cost is not None
+            and cost > self.max_cost
+        ):
+            decision = REJECTED
+        elif (
+            self.max_cardinality is not None
+            and cardinality is not None
+            and cardinality > self.max_cardinality
+        ):
+            decision = CAPPED if self.row_cap is not None else REJECTED
+        metrics = PlanMetrics(
+            sql=sql,
+            cost=cost,
+            cardinality=cardinality,
+            bytes=nbytes,
+            decision=decision,
+            explained_at=time.time(),
+            explain_time=time.perf_counter() - started_at,
+        )
+        with self._lock:
+            self._history.append(metrics)
+        if decision == REJECTED:
+            raise QueryRejectedError(metrics)
+        if decision == CAPPED:
+            sql = LIMIT_ROWS.format(sql=sql, row_cap=int(self.row_cap))
+        return sql, metrics
+
+    def check(self, conn, sql: str) -> Tuple[str, PlanMetrics]:
+        """Explains sql on conn and returns the statement to execute, row
+        capped if needed, with its plan metrics
+
+        :param oracledb.Connection conn: Connection used to run sql
+        :param str sql: Generated query
+        :raises: select_ai.QueryRejectedError
+        """
+        started_at = time.perf_counter()
+        statement_id = uuid.uuid4().hex
+        # The plan rows are rolled back rather than deleted, so that no
+        # transaction is left open. Work of a transaction already in
+        # progress is kept
+        in_transaction = conn.transaction_in_progress
+        with conn.cursor() as cr:
+            cr.execute(SAVEPOINT_PLAN)
+            try:
+                cr.execute(
+                    EXPLAIN_PLAN.format(statement_id=statement_id, sql=sql)
+                )
+                cr.execute(GET_PLAN_METRICS, statement_id=statement_id)
+                row = cr.fetchone()
+            finally:
+                if in_transaction:
+                    cr.execute(ROLLBACK_PLAN)
+                else:
+                    conn.rollback()
+        return self._decide(sql, row, started_at)
+
+    async def async_check(
+        self, async_connection, sql: str
+    ) -> Tuple[str, PlanMetrics]:
+        """Explains sql on async_connection and returns the statement to
+        execute, row capped if needed, with its plan metrics
+
+        :param oracledb.AsyncConnection async_connection: Connection used
+         to run sql
+        :param str sql: Generated query
+        :raises: select_ai.QueryRejectedError
+        """
+        started_at = time.perf_counter()
+        statement_id = uuid.uuid4().hex
+        in_transaction = async_connection.transaction_in_progress
+        with async_connection.cursor() as cr:
+            await cr.execute(SAVEPOINT_PLAN)
+            try:
+                await cr.execute(
+                    EXPLAIN_PLAN.format(statement_id=statement_id, sql=sql)
+                )
+                await cr.execute(GET_PLAN_METRICS, statement_id=statement_id)
+                row = await cr.fetchone()
+            finally:
+                if in_transaction:
+                    await cr.execute(ROLLBACK_PLAN)
+                else:
+                    await async_connection.rollback()
+        return self._decide(sql, row, started_at)
+
+    def history(self) -> List[PlanMetrics]:
+        """Returns the plan metrics of the most recently checked statements,
+        oldest first
+        """
+        with self._lock:
+            return list(self._history)
+
+    def clear_history(self) -> None:
+        with self._lock:
+            self._history.clear()
+
+
+@contextlib.contextmanager
+def call_timeout_for(query_guard: Optional[QueryGuard], conn):
+    """Applies the call_timeout of query_guard to conn, sync or async, for
+    the duration of the block. Does nothing without a query guard or a
+    call_timeout
+    """
+    if query_guard is None or query_guard.call_timeout is None:
+        yield
+        return
+    call_timeout = conn.call_timeout
+    conn.call_timeout = query_guard.call_timeout
+    try:
+        yield
+    finally:
+        conn.call_timeout = call_timeout
+
+
+def guarded_batches(
+    query_guard: Optional[QueryGuard], conn, batches: Iterable[Any]
+) -> Generator[Any, None, None]:
+    """Yields the batches of a result set, applying the call_timeout of
+    query_guard to conn only while a batch is fetched. The connection keeps
+    its own call_timeout while the consumer holds the generator suspended
+    """
+    batches = iter(batches)
+    while True:
+        with call_timeout_for(query_guard, conn):
+            try:
+                batch = next(batches)
+            except StopIteration:
+                return
+        yield batch
+
+
+async def async_guarded_batches(
+    query_guard: Optional[QueryGuard], conn, batches: AsyncIterable[Any]
+) -> AsyncGenerator[Any, None]:
+    """Async counterpart of guarded_batches()"""
+    batches = batches.__aiter__()
+    while True:
+        with call_timeout_for(query_guard, conn):
+            try:
+                batch = await batches.__anext__()
+            except StopAsyncIteration:
+                return
+        yield batch
@@ -0,0 +1,305 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+)
+
+from select_ai.action import Action
+from select_ai.cache import ResponseCache
+from select_ai.db import connection_identity
+
+__all__ = [
+    "AsyncSingleFlight",
+    "CoalescingStats",
+    "SingleFlight",
+    "coalescing_stats",
+    "disable_coalescing",
+    "enable_coalescing",
+]
+
+# Actions whose identical concurrent requests are coalesced. Disabled until
+# enable_coalescing()
+_coalesced_actions: FrozenSet[Action] = frozenset()
+
+
+@dataclass
+class CoalescingStats:
+    """Counters describing how concurrent generate requests were coalesced
+
+    :param int calls: Number of requests which were sent to the database
+    :param int coalesced: Number of requests which waited for an identical
+     in-flight request instead of calling the database
+    """
+
+    calls: int = 0
+    coalesced: int = 0
+
+
+def _copy(result: Any) -> Any:
+    """Every caller gets its own pandas.DataFrame. The shared result is a
+    copy too, so no caller owns an object another caller copies from
+    """
+    if hasattr(result, "copy"):
+        return result.copy()
+    return result
+
+
+def enable_coalescing(
+    actions: Iterable[Action] = (
+        Action.SHOWSQL,
+        Action.EXPLAINSQL,
+        Action.RUNSQL,
+    )
+) -> None:
+    """Coalesce identical concurrent generate requests of Profile and
+    AsyncProfile in this process: the first request calls the database and
+    the others wait for its result. Requests are identical when they use
+    the same database user and DSN, profile, attributes, action, prompt
+    and parameters
+
+    :param actions: Actions whose requests are coalesced. CHAT, NARRATE
+     and the other free text actions may legitimately return a different
+     answer for every call, so they are not coalesced by default
+    """
+    global _coalesced_actions
+    _coalesced_actions = frozenset(Action(action) for action in actions)
+
+
+def disable_coalescing() -> None:
+    """Run every generate request against the database. This is the
+    default
+    """
+    global _coalesced_actions
+    _coalesced_actions = frozenset()
+
+
+def _is_coalesced(prompt: str, action: Action, params: Mapping) -> bool:
+    if not prompt or (params and "conversation_id" in params):
+        return False
+    try:
+        return Action(action) in _coalesced_actions
+    except ValueError:
+        return False
+
+
+def request_key(
+    profile,
+    prompt: str,
+    action: Action,
+    params: Mapping = None,
+    asynchronous: bool = False,
+) -> Optional[Hashable]:
+    """Returns the key identifying identical generate requests, or None if
+    the request must not be shared. Requests which are part of a
+    conversation change the conversation and are never shared
+
+    :param bool asynchronous: The request runs on the async connection
+    """
+    if not _is_coalesced(prompt, action, params):
+        return None
+    # Requests of different database users, or databases, may see
+    # different objects and data
+    identity = connection_identity(asynchronous=asynchronous)
+    if identity is None:
+        return None
+    attributes = profile.attributes
+    return identity, ResponseCache.key(
+        profile.profile_name or "",
+        attributes.json() if attributes else "",
+        action,
+        prompt,
+        params,
+    )
+
+
+async def async_request_key(
+    profile, prompt: str, action: Action, params: Mapping = None
+) -> Optional[Hashable]:
+    """Async counterpart of request_key(). The key depends on the
+    attributes, so a lazy AsyncProfile is loaded first
+    """
+    if not _is_coalesced(prompt, action, params):
+        return None
+    await profile.load()
+    return request_key(profile, prompt, action, params, asynchronous=True)
+
+
+class _LeaderCancelled(Exception):
+    """Outcome of a call whose leader task was cancelled. The waiters run
+    the call again, one of them as the new leader
+    """
+
+
+class _Call:
+    """An in-flight request and its outcome"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time. Threads calling do() with
+    the key of an in-flight call wait for it and get its result, or its
+    error, instead of running their own call
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.stats = CoalescingStats()
+
+    def do(self, key: Optional[Hashable], fn: Callable[[], Any]) -> Any:
+        """Runs fn, or waits for the in-flight call with the same key
+
+        :param key: Key of the call. None runs fn without coalescing
+        :param fn: Callable performing the call
+        """
+        if key is None:
+            return fn()
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.stats.calls += 1
+                leader = True
+            else:
+                self.stats.coalesced += 1
+                leader = False
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return _copy(call.result)
+        result = None
+        try:
+            result = fn()
+            # The waiters copy a result of their own, so the leader's caller
+            # may change its object in place
+            call.result = _copy(result)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return result
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = CoalescingStats()
+
+
+class AsyncSingleFlight:
+    """asyncio counterpart of SingleFlight. Tasks awaiting do() with the key
+    of an in-flight call on the same event loop await its outcome instead
+    of running their own call
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.stats = CoalescingStats()
+
+    async def do(
+        self,
+        key: Optional[Hashable],
+        fn: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Awaits fn(), or the in-flight call with the same key
+
+        :param key: Key of the call. None awaits fn() without coalescing
+        :param fn: Coroutine function performing the call
+        """
+        if key is None:
+            return await fn()
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                if future is None:
+                    future = self._calls[key] = loop.create_future()
+                    self.stats.calls += 1
+                    leader = True
+                else:
+                    self.stats.coalesced += 1
+                    leader = False
+            if leader:
+                return await self._lead(key, future, fn)
+            try:
+                # shield() so that cancelling a waiter leaves the call
+                # running
+                return _copy(await asyncio.shield(future))
+            except _LeaderCancelled:
+                continue
+
+    async def _lead(
+        self,
+        key: Hashable,
+        future: asyncio.Future,
+        fn: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # Only the leader was cancelled; the waiters retry the call
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # mark the exception as retrieved when nobody else waits for it
+            future.exception()
+            raise
+        else:
+            future.set_result(_copy(result))
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = CoalescingStats()
+
+
+__single_flight__ = SingleFlight()
+__async_single_flight__ = AsyncSingleFlight()
+
+
+def coalescing_stats(reset: bool = False) -> CoalescingStats:
+    """Returns a snapshot of the generate request coalescing counters of
+    Profile and AsyncProfile
+
+    :param bool reset: Reset the counters after taking the snapshot
+    :return: select_ai.single_flight.CoalescingStats
+    """
+    stats = CoalescingStats()
+    for single_flight in (__single_flight__, __async_single_flight__):
+        with single_flight._lock:
+            stats.calls += single_flight.stats.calls
+            stats.coalesced += single_flight.stats.coalesced
+        if reset:
+            single_flight.reset_stats()
+    return stats
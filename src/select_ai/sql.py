@@ -92,12 +92,53 @@ FROM USER_CLOUD_AI_PROFILES
 WHERE REGEXP_LIKE(profile_name, :profile_name_pattern, 'i')
 """
 
+LIST_USER_AI_PROFILES_WITH_ATTRIBUTES = """
+SELECT p.profile_name,
+       p.description,
+       (SELECT JSON_OBJECTAGG(
+                   KEY a.attribute_name VALUE a.attribute_value
+                   RETURNING CLOB
+               )
+        FROM USER_CLOUD_AI_PROFILE_ATTRIBUTES a
+        WHERE a.profile_name = p.profile_name) AS attributes
+FROM USER_CLOUD_AI_PROFILES p
+WHERE REGEXP_LIKE(p.profile_name, :profile_name_pattern, 'i')
+"""
+
 LIST_USER_VECTOR_INDEXES = """
 SELECT v.index_name, v.description
 FROM USER_CLOUD_VECTOR_INDEXES v
 WHERE REGEXP_LIKE(v.index_name, :index_name_pattern, 'i')
 """
 
+# Each vector index with its attributes and the profile named by its
+# profile_name attribute, so that listing indexes needs no query per index
+LIST_USER_VECTOR_INDEXES_WITH_ATTRIBUTES = """
+SELECT v.index_name,
+       v.description,
+       v.attributes,
+       p.profile_name,
+       p.description AS profile_description,
+       (SELECT JSON_OBJECTAGG(
+                   KEY pa.attribute_name VALUE pa.attribute_value
+                   RETURNING CLOB
+               )
+        FROM USER_CLOUD_AI_PROFILE_ATTRIBUTES pa
+        WHERE pa.profile_name = p.profile_name) AS profile_attributes
+FROM (SELECT i.index_name,
+             i.description,
+             (SELECT JSON_OBJECTAGG(
+                         KEY a.attribute_name VALUE a.attribute_value
+                         RETURNING CLOB
+                     )
+              FROM USER_CLOUD_VECTOR_INDEX_ATTRIBUTES a
+              WHERE a.index_name = i.index_name) AS attributes
+      FROM USER_CLOUD_VECTOR_INDEXES i
+      WHERE REGEXP_LIKE(i.index_name, :index_name_pattern, 'i')) v
+LEFT OUTER JOIN USER_CLOUD_AI_PROFILES p
+ON p.profile_name = UPPER(JSON_VALUE(v.attributes, '$.profile_name'))
+"""
+
 GET_USER_VECTOR_INDEX = """
 select index_name, description
 from USER_CLOUD_VECTOR_INDEXES v
@@ -132,3 +173,84 @@ SELECT CAST(last_execution AT TIME ZONE 'UTC' AS TIMESTAMP)
 FROM USER_CLOUD_PIPELINES
 WHERE pipeline_name = :pipeline_name
 """
+
+GET_EMBEDDING_FROM_MODEL = """
+SELECT VECTOR_EMBEDDING({model_name} USING :text AS data)
+FROM dual
+"""
+
+GET_EMBEDDING_FROM_PROVIDER = """
+SELECT DBMS_VECTOR.UTL_TO_EMBEDDING(:text, JSON(:params))
+FROM dual
+"""
+
+GENERATE_MANY = """
+DECLARE
+    l_requests JSON_ARRAY_T := JSON_ARRAY_T.parse(:requests);
+    l_responses JSON_ARRAY_T := JSON_ARRAY_T();
+    l_request JSON_OBJECT_T;
+    l_response JSON_OBJECT_T;
+BEGIN
+    FOR i IN 0 .. l_requests.get_size - 1 LOOP
+        l_request := TREAT(l_requests.get(i) AS JSON_OBJECT_T);
+        l_response := JSON_OBJECT_T();
+        BEGIN
+            l_response.put(
+                'response',
+                DBMS_CLOUD_AI.GENERATE(
+                    prompt => l_request.get_clob('prompt'),
+                    profile_name => :profile_name,
+                    action => l_request.get_string('action'),
+                    params => l_request.get_clob('params')
+                )
+            );
+        EXCEPTION
+            WHEN OTHERS THEN
+                l_response.put('error', SQLERRM);
+        END;
+        l_responses.append(l_response);
+    END LOOP;
+    :responses := l_responses.to_clob;
+END;
+"""
+
+EXPLAIN_PLAN = """
+EXPLAIN PLAN SET STATEMENT_ID = '{statement_id}' FOR
+{sql}
+"""
+
+GET_PLAN_METRICS = """
+SELECT cost, cardinality, bytes
+FROM plan_table
+WHERE statement_id = :statement_id
+AND id = 0
+"""
+
+SAVEPOINT_PLAN = "SAVEPOINT select_ai_explain_plan"
+
+ROLLBACK_PLAN = "ROLLBACK TO SAVEPOINT select_ai_explain_plan"
+
+LIMIT_ROWS = """
+SELECT *
+FROM (
+{sql}
+)
+FETCH FIRST {row_cap} ROWS ONLY
+"""
+
+# Returns the CLOB result of {function} inline in :response when it fits a
+# VARCHAR2 and as a LOB locator in :response_lob otherwise
+CALLFUNC_INLINE = """
+DECLARE
+    l_response CLOB;
+BEGIN
+    l_response := {function}({arguments});
+    :response_length := DBMS_LOB.GETLENGTH(l_response);
+    BEGIN
+        :response := l_response;
+    EXCEPTION
+        WHEN VALUE_ERROR THEN
+            :response_lob := l_response;
+    END;
+END;
+"""
@@ -0,0 +1,226 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+import asyncio
+import queue
+import threading
+from typing import AsyncGenerator, Generator, Mapping, Optional
+
+import oracledb
+
+from select_ai.sql import CALLFUNC_INLINE
+
+# Largest response, in bytes, returned inline instead of as a LOB. This is
+# the maximum size of a PL/SQL VARCHAR2
+INLINE_RESPONSE_SIZE = 32767
+
+# Read-ahead chunks grow up to this many times the requested chunk size
+MAX_CHUNK_GROWTH = 16
+
+_DONE = object()
+
+
+def _aligned(chunk_size: int, lob_chunk_size: int) -> int:
+    """Rounds chunk_size up to a multiple of the LOB chunk size"""
+    if lob_chunk_size <= 0:
+        return chunk_size
+    return -(-chunk_size // lob_chunk_size) * lob_chunk_size
+
+
+def _chunk_sizes(chunk_size: int, lob_chunk_size: int):
+    """Yields the amount to read for each successive chunk: chunk_size
+    aligned to the LOB chunk size, doubling after every read up to
+    MAX_CHUNK_GROWTH times the initial size
+    """
+    amount = _aligned(chunk_size, lob_chunk_size)
+    max_amount = amount * MAX_CHUNK_GROWTH
+    while True:
+        yield amount
+        amount = min(amount * 2, max_amount)
+
+
+def _callfunc_inline_statement(name: str, keyword_parameters: Mapping):
+    arguments = ", ".join(f"{key} => :{key}" for key in keyword_parameters)
+    return CALLFUNC_INLINE.format(function=name, arguments=arguments)
+
+
+def callfunc_clob(cr, name: str, keyword_parameters: Mapping) -> Optional[str]:
+    """Calls the PL/SQL function name returning a CLOB and returns its
+    value as a string, or None if the function returned NULL. Responses of
+    at most INLINE_RESPONSE_SIZE characters are returned in the same round
+    trip as the call; larger ones fall back to reading the LOB
+
+    :param oracledb.Cursor cr: Cursor used for the call
+    :param str name: Name of the PL/SQL function
+    :param Mapping keyword_parameters: Keyword parameters of the function
+    """
+    response = cr.var(oracledb.DB_TYPE_VARCHAR, INLINE_RESPONSE_SIZE)
+    response_lob = cr.var(oracledb.DB_TYPE_CLOB)
+    response_length = cr.var(oracledb.DB_TYPE_NUMBER)
+    cr.execute(
+        _callfunc_inline_statement(name, keyword_parameters),
+        dict(
+            keyword_parameters,
+            response=response,
+            response_lob=response_lob,
+            response_length=response_length,
+        ),
+    )
+    result = response.getvalue()
+    if result is not None:
+        return result
+    lob = response_lob.getvalue()
+    if lob is not None:
+        return lob.read()
+    # An empty CLOB comes back as a NULL VARCHAR2; only its length tells
+    # it apart from a NULL response
+    return "" if response_length.getvalue() == 0 else None
+
+
+async def async_callfunc_clob(
+    cr, name: str, keyword_parameters: Mapping
+) -> Optional[str]:
+    """Async counterpart of callfunc_clob()
+
+    :param oracledb.AsyncCursor cr: Cursor used for the call
+    :param str name: Name of the PL/SQL function
+    :param Mapping keyword_parameters: Keyword parameters of the function
+    """
+    response = cr.var(oracledb.DB_TYPE_VARCHAR, INLINE_RESPONSE_SIZE)
+    response_lob = cr.var(oracledb.DB_TYPE_CLOB)
+    response_length = cr.var(oracledb.DB_TYPE_NUMBER)
+    await cr.execute(
+        _callfunc_inline_statement(name, keyword_parameters),
+        dict(
+            keyword_parameters,
+            response=response,
+            response_lob=response_lob,
+            response_length=response_length,
+        ),
+    )
+    result = response.getvalue()
+    if result is not None:
+        return result
+    lob = response_lob.getvalue()
+    if lob is not None:
+        return await lob.read()
+    # An empty CLOB comes back as a NULL VARCHAR2; only its length tells
+    # it apart from a NULL response
+    return "" if response_length.getvalue() == 0 else None
+
+
+def read_lob(lob, chunk_size: int) -> Generator[str, None, None]:
+    """Reads a LOB chunk by chunk, one round trip per yielded chunk"""
+    offset = 1
+    while True:
+        chunk = lob.read(offset=offset, amount=chunk_size)
+        if not chunk:
+            break
+        yield chunk
+        offset += len(chunk)
+
+
+def read_lob_ahead(
+    lob, chunk_size: int, read_ahead: int
+) -> Generator[str, None, None]:
+    """Reads a LOB on a background thread which keeps up to read_ahead
+    chunks queued ahead of the consumer, so that the round trips overlap
+    with the processing of the previous chunks. Chunk sizes are aligned to
+    LOB.getchunksize() and grow with every read
+    """
+    chunks = queue.Queue(maxsize=read_ahead)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def reader():
+        try:
+            offset = 1
+            for amount in _chunk_sizes(chunk_size, lob.getchunksize()):
+                chunk = lob.read(offset=offset, amount=amount)
+                if not chunk:
+                    break
+                if not put(chunk):
+                    return
+                offset += len(chunk)
+        except BaseException as e:
+            put(e)
+            return
+        put(_DONE)
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # The connection must not be reused while the reader still uses it
+        stop.set()
+        thread.join()
+
+
+async def async_read_lob(lob, chunk_size: int) -> AsyncGenerator[str, None]:
+    """Reads an async LOB chunk by chunk, one round trip per yielded chunk"""
+    offset = 1
+    while True:
+        chunk = await lob.read(offset=offset, amount=chunk_size)
+        if not chunk:
+            break
+        yield chunk
+        offset += len(chunk)
+
+
+async def async_read_lob_ahead(
+    lob, chunk_size: int, read_ahead: int
+) -> AsyncGenerator[str, None]:
+    """Reads an async LOB in a background task which keeps up to read_ahead
+    chunks queued ahead of the consumer. Chunk sizes are aligned to
+    LOB.getchunksize() and grow with every read
+    """
+    chunks = asyncio.Queue(maxsize=read_ahead)
+
+    async def reader():
+        try:
+            offset = 1
+            lob_chunk_size = await lob.getchunksize()
+            for amount in _chunk_sizes(chunk_size, lob_chunk_size):
+                chunk = await lob.read(offset=offset, amount=amount)
+                if not chunk:
+                    break
+                await chunks.put(chunk)
+                offset += len(chunk)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await chunks.put(e)
+            return
+        await chunks.put(_DONE)
+
+    task = asyncio.ensure_future(reader())
+    try:
+        while True:
+            item = await chunks.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
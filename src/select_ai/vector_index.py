@@ -9,7 +9,14 @@ import json
 from abc import ABC
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import AsyncGenerator, Iterator, Optional, Union
+from typing import (
+    AsyncGenerator,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import oracledb
 
@@ -17,14 +24,20 @@ from select_ai import BaseProfile
 from select_ai._abc import SelectAIDataClass
 from select_ai._enums import StrEnum
 from select_ai.async_profile import AsyncProfile
-from select_ai.db import async_cursor, cursor
+from select_ai.batch import (
+    AsyncBatchUpdateMixin,
+    BatchUpdateMixin,
+    async_pending_batch,
+    pending_batch,
+)
+from select_ai.db import LIST_ARRAYSIZE, async_cursor, cursor
 from select_ai.errors import ProfileNotFoundError, VectorIndexNotFoundError
 from select_ai.profile import Profile
 from select_ai.sql import (
     GET_USER_VECTOR_INDEX,
     GET_USER_VECTOR_INDEX_ATTRIBUTES,
     GET_VECTOR_PIPELINE_LAST_EXECUTION,
-    LIST_USER_VECTOR_INDEXES,
+    LIST_USER_VECTOR_INDEXES_WITH_ATTRIBUTES,
 )
 
 
@@ -140,8 +153,60 @@ class _BaseVectorIndex(ABC):
             f"attributes={self.attributes}, description={self.description})"
         )
 
+    @classmethod
+    def _from_row(
+        cls,
+        profile_type: type,
+        index_name: str,
+        description: Optional[str],
+        attributes: Optional[str],
+        profile_name: Optional[str],
+        profile_description: Optional[str],
+        profile_attributes: Optional[str],
+    ):
+        """Builds a vector index object, and its profile, from a row of
+        LIST_USER_VECTOR_INDEXES_WITH_ATTRIBUTES without querying the
+        database again
+
+        :param type profile_type: select_ai.Profile or select_ai.AsyncProfile
+        :param str index_name: Name of the vector index
+        :param str description: Description of the vector index
+        :param str attributes: Index attributes aggregated as a JSON object
+        :param str profile_name: Name of the index's profile, None if the
+         profile does not exist
+        :param str profile_description: Description of the profile
+        :param str profile_attributes: Profile attributes aggregated as a
+         JSON object
+        """
+        if attributes:
+            attributes = VectorIndexAttributes.create(**json.loads(attributes))
+        else:
+            attributes = None
+        profile = None
+        if profile_name is not None:
+            # Keep the name as spelled in the index attributes, like fetch()
+            profile = profile_type._from_row(
+                attributes.profile_name,
+                profile_description,
+                profile_attributes,
+            )
+        return cls(
+            profile=profile,
+            index_name=index_name,
+            description=description,
+            attributes=attributes,
+        )
+
+    def _batch_procedure(self) -> Tuple[str, Mapping]:
+        """Returns the procedure which saves the attribute changes collected
+        by a batch, and its parameters other than the attributes
+        """
+        return "DBMS_CLOUD_AI.UPDATE_VECTOR_INDEX", {
+            "index_name": self.index_name
+        }
+
 
-class VectorIndex(_BaseVectorIndex):
+class VectorIndex(_BaseVectorIndex, BatchUpdateMixin):
     """
     VectorIndex objects let you manage vector indexes
 
@@ -368,6 +433,10 @@ class VectorIndex(_BaseVectorIndex):
         :param Union[str, int, float] attribute_value: Attribute Value
 
         """
+        batch = pending_batch(self)
+        if batch is not None:
+            batch.add(self, {attribute_name: attribute_value})
+            return
         setattr(self.attributes, attribute_name, attribute_value)
         parameters = {
             "index_name": self.index_name,
@@ -394,6 +463,10 @@ class VectorIndex(_BaseVectorIndex):
         :return: None
         :raises: oracledb.DatabaseError
         """
+        batch = pending_batch(self)
+        if batch is not None:
+            batch.add(self, attributes)
+            return
         parameters = {
             "index_name": self.index_name,
             "attributes": attributes.json(),
@@ -461,16 +534,18 @@ class VectorIndex(_BaseVectorIndex):
         :return: Iterator[VectorIndex]
         """
         with cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
             cr.execute(
-                LIST_USER_VECTOR_INDEXES,
+                LIST_USER_VECTOR_INDEXES_WITH_ATTRIBUTES,
                 index_name_pattern=index_name_pattern,
+                fetch_lobs=False,
             )
-            for row in cr.fetchall():
-                index_name = row[0]
-                yield cls.fetch(index_name=index_name)
+            for row in cr:
+                yield cls._from_row(Profile, *row)
 
 
-class AsyncVectorIndex(_BaseVectorIndex):
+class AsyncVectorIndex(_BaseVectorIndex, AsyncBatchUpdateMixin):
     """
     AsyncVectorIndex objects let you manage vector indexes
     using async APIs. Use this for non-blocking concurrent
@@ -697,6 +772,10 @@ class AsyncVectorIndex(_BaseVectorIndex):
         :param Union[str, int, float] attribute_value: Attribute Value
 
         """
+        batch = async_pending_batch(self)
+        if batch is not None:
+            batch.add(self, {attribute_name: attribute_value})
+            return
         parameters = {
             "index_name": self.index_name,
             "attribute_name": attribute_name,
@@ -720,6 +799,10 @@ class AsyncVectorIndex(_BaseVectorIndex):
         :return: None
         :raises: oracledb.DatabaseError
         """
+        batch = async_pending_batch(self)
+        if batch is not None:
+            batch.add(self, attributes)
+            return
         parameters = {
             "index_name": self.index_name,
             "attributes": attributes.json(),
@@ -788,12 +871,12 @@ class AsyncVectorIndex(_BaseVectorIndex):
 
         """
         async with async_cursor() as cr:
+            cr.arraysize = LIST_ARRAYSIZE
+            cr.prefetchrows = LIST_ARRAYSIZE
             await cr.execute(
-                LIST_USER_VECTOR_INDEXES,
+                LIST_USER_VECTOR_INDEXES_WITH_ATTRIBUTES,
                 index_name_pattern=index_name_pattern,
+                fetch_lobs=False,
             )
-            rows = await cr.fetchall()
-            for row in rows:
-                index_name = row[0]
-                index = await cls.fetch(index_name=index_name)
-                yield index
+            async for row in cr:
+                yield cls._from_row(AsyncProfile, *row)
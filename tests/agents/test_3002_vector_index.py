@@ -0,0 +1,58 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+"""
+3002 - Module for testing the vector indexes used by RAG tools
+"""
+
+import uuid
+
+import pytest
+import select_ai
+
+PYSAI_3002_RAG_PROFILE_NAME = f"PYSAI_3002_RAG_{uuid.uuid4().hex.upper()}"
+PYSAI_3002_RAG_VECTOR_INDEX_NAME = (
+    f"PYSAI_3002_RAG_VECTOR_{uuid.uuid4().hex.upper()}"
+)
+
+
+@pytest.fixture(scope="module")
+def python_gen_rag_ai_profile(rag_profile_attributes):
+    profile = select_ai.Profile(
+        profile_name=PYSAI_3002_RAG_PROFILE_NAME,
+        description="OCI GENAI Profile",
+        attributes=rag_profile_attributes,
+    )
+    yield profile
+    profile.delete(force=True)
+
+
+@pytest.fixture(scope="module")
+def vector_index(vector_index_attributes, python_gen_rag_ai_profile):
+    vector_index = select_ai.VectorIndex(
+        index_name=PYSAI_3002_RAG_VECTOR_INDEX_NAME,
+        attributes=vector_index_attributes,
+        description="Test vector index",
+        profile=python_gen_rag_ai_profile,
+    )
+    vector_index.create(replace=True)
+    yield vector_index
+    vector_index.delete(force=True)
+
+
+def test_3002(vector_index):
+    """list vector indexes with their profile"""
+    indexes = list(
+        select_ai.VectorIndex.list(
+            index_name_pattern=f"^{PYSAI_3002_RAG_VECTOR_INDEX_NAME}$"
+        )
+    )
+    assert len(indexes) == 1
+    fetched = select_ai.VectorIndex.fetch(PYSAI_3002_RAG_VECTOR_INDEX_NAME)
+    assert indexes[0].attributes == fetched.attributes
+    assert indexes[0].profile.profile_name == fetched.profile.profile_name
+    assert indexes[0].profile.attributes == fetched.profile.attributes
@@ -172,6 +172,15 @@ def test_3103_list_tasks_with_regex():
     assert TASK_B_NAME in names
 
 
+def test_3106_list_matches_fetch(task_a, task_b):
+    logger.info("Comparing listed tasks with fetched tasks")
+    tasks = {t.task_name: t for t in Task.list(f"{BASE}.*")}
+    for name in (TASK_A_NAME, TASK_B_NAME):
+        fetched = Task.fetch(name)
+        assert tasks[name].attributes == fetched.attributes
+        assert tasks[name].description == fetched.description
+
+
 def test_3104_disable_enable_task(task_b):
     logger.info("Disabling TASK_B: %s", task_b.task_name)
     task_b.disable()
@@ -321,3 +330,19 @@ def test_3120_double_delete_force_false_raises():
         task.delete(force=False)
     logger.info("Received expected Oracle error on second delete: %s", exc.value)
     expect_oracle_error("NOT_FOUND", lambda: Task.fetch(task_name))
+
+
+def test_3121_batch_update(task_a, task_b):
+    logger.info("Updating TASK_A and TASK_B in one batch")
+    instruction_a = task_a.attributes.instruction
+    instruction_b = task_b.attributes.instruction
+    try:
+        with select_ai.batch_update():
+            task_a.set_attribute("instruction", "Answer the movie question: {query}")
+            task_b.set_attribute("instruction", "Summarize the answer")
+        assert task_a.attributes.instruction == "Answer the movie question: {query}"
+        assert Task.fetch(TASK_A_NAME).attributes.instruction == task_a.attributes.instruction
+        assert Task.fetch(TASK_B_NAME).attributes.instruction == "Summarize the answer"
+    finally:
+        task_a.set_attribute("instruction", instruction_a)
+        task_b.set_attribute("instruction", instruction_b)
@@ -420,3 +420,11 @@ async def test_3224_list_all_non_empty():
     for name in names:
         logger.info("  - %s", name)
     assert len(names) > 0
+
+
+async def test_3225_list_matches_fetch(agent):
+    agents = [a async for a in AsyncAgent.list("^PYSAI_3200_AGENT_")]
+    listed = next(a for a in agents if a.agent_name == agent.agent_name)
+    fetched = await AsyncAgent.fetch(agent_name=agent.agent_name)
+    assert listed.attributes == fetched.attributes
+    assert listed.description == fetched.description
@@ -382,3 +382,97 @@ def test_1218(python_gen_ai_profile):
         text="Thank you", source_language="en", target_language="de"
     )
     assert response == "Danke"
+
+
+def test_1219(python_gen_ai_profile, profile_attributes):
+    """List profiles hydrates attributes and description"""
+    (profile,) = list(
+        Profile.list(profile_name_pattern=f"^{PYSAI_1200_PROFILE}$")
+    )
+    assert profile.attributes == profile_attributes
+    assert profile.description == "OCI GENAI Profile"
+
+
+def test_1220(python_gen_ai_profile, profile_attributes):
+    """Metadata cache serves repeated instantiations and is invalidated
+    on update"""
+    Profile.enable_metadata_cache(max_size=8, ttl=60)
+    try:
+        Profile(PYSAI_1200_PROFILE)
+        profile = Profile(PYSAI_1200_PROFILE)
+        stats = Profile.metadata_cache_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert profile.attributes == profile_attributes
+        profile.set_attribute("max_tokens", 2048)
+        profile = Profile(PYSAI_1200_PROFILE)
+        assert profile.attributes.max_tokens == 2048
+        assert Profile.metadata_cache_stats().misses == 2
+    finally:
+        python_gen_ai_profile.set_attribute("max_tokens", 1024)
+        Profile.disable_metadata_cache()
+
+
+def test_1221(python_gen_ai_profile, profile_attributes):
+    """Lazy profile reads its metadata on first access"""
+    profile = Profile.lazy(PYSAI_1200_PROFILE)
+    assert not profile.is_loaded
+    response = profile.chat(prompt="What is OCI ?")
+    assert isinstance(response, str)
+    assert not profile.is_loaded
+    assert profile.attributes == profile_attributes
+    assert profile.description == "OCI GENAI Profile"
+    assert profile.is_loaded
+
+
+def test_1222():
+    """Lazy profile which does not exist fails on first access"""
+    profile = Profile.lazy(f"PYSAI_1200_MISSING_{uuid.uuid4().hex.upper()}")
+    with pytest.raises(select_ai.errors.ProfileNotFoundError):
+        profile.attributes
+
+
+def test_1223(python_gen_ai_profile):
+    """batch_update() saves the changes in one call without re-reading"""
+    profile = Profile(PYSAI_1200_PROFILE)
+    try:
+        with profile.batch_update() as batch:
+            profile.set_attribute("max_tokens", 4096)
+            profile.set_attribute("max_tokens", 2048)
+            assert profile.attributes.max_tokens == 1024
+            assert len(batch) == 1
+        assert profile.attributes.max_tokens == 2048
+        saved_attributes = profile.get_attributes()
+        assert saved_attributes.max_tokens == 2048
+    finally:
+        python_gen_ai_profile.set_attribute("max_tokens", 1024)
+
+
+def test_1224(python_gen_ai_profile):
+    """batch_update() discards the changes when the block raises"""
+    profile = Profile(PYSAI_1200_PROFILE)
+    with pytest.raises(RuntimeError):
+        with profile.batch_update():
+            profile.set_attribute("max_tokens", 4096)
+            raise RuntimeError("discard")
+    assert profile.attributes.max_tokens == 1024
+    assert profile.get_attributes().max_tokens == 1024
+
+
+def test_1225(python_gen_ai_profile):
+    """Response cache keys do not depend on the load state of a profile"""
+    response_cache = select_ai.ResponseCache()
+    lazy_profile = Profile.lazy(PYSAI_1200_PROFILE)
+    key = response_cache.request_key(lazy_profile, "prompt", "showsql")
+    assert lazy_profile.is_loaded
+    assert key == response_cache.request_key(
+        Profile(PYSAI_1200_PROFILE), "prompt", "showsql"
+    )
+
+
+def test_1226(python_gen_ai_profile, profile_attributes):
+    """Lazy profile prefetches its metadata when a pool is used"""
+    profile = Profile.lazy(PYSAI_1200_PROFILE, prefetch=True)
+    profile.load()
+    assert profile.is_loaded
+    assert profile.attributes == profile_attributes
@@ -0,0 +1,98 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+"""
+1250 - Module for testing the in-memory catalog
+"""
+import logging
+import subprocess
+import sys
+import uuid
+
+import pytest
+import select_ai
+from select_ai import AsyncCatalog, Catalog, CatalogObjectType
+
+logger = logging.getLogger(__name__)
+
+PYSAI_1250_PROFILE = f"PYSAI_1250_{uuid.uuid4().hex.upper()}"
+
+
+@pytest.fixture(scope="module")
+def catalog_profile(profile_attributes):
+    profile = select_ai.Profile(
+        profile_name=PYSAI_1250_PROFILE,
+        description="Catalog profile",
+        attributes=profile_attributes,
+        replace=True,
+    )
+    yield profile
+    profile.delete(force=True)
+
+
+def test_1250(catalog_profile, profile_attributes):
+    """Objects are built from the catalog without querying the database"""
+    catalog = Catalog(object_types=[CatalogObjectType.PROFILE])
+    changes = catalog.refresh()
+    assert (CatalogObjectType.PROFILE, PYSAI_1250_PROFILE) in changes.added
+    profile = catalog.get("profile", PYSAI_1250_PROFILE)
+    assert profile.attributes == profile_attributes
+    assert profile.description == "Catalog profile"
+    assert catalog.get("profile", PYSAI_1250_PROFILE.lower()) is profile
+    assert catalog.filter("profile", f"^{PYSAI_1250_PROFILE}$") == [profile]
+
+
+def test_1251(catalog_profile):
+    """refresh() reports updated and removed objects only"""
+    catalog = Catalog(object_types=["profile"])
+    catalog.refresh()
+    profile = catalog.get("profile", PYSAI_1250_PROFILE)
+    changes = catalog.refresh()
+    assert changes.added == []
+    assert changes.updated == []
+    assert catalog.get("profile", PYSAI_1250_PROFILE) is profile
+    catalog_profile.set_attribute("max_tokens", 2048)
+    changes = catalog.refresh()
+    assert changes.updated == [(CatalogObjectType.PROFILE, PYSAI_1250_PROFILE)]
+    profile = catalog.get("profile", PYSAI_1250_PROFILE)
+    assert profile.attributes.max_tokens == 2048
+
+
+def test_1252():
+    """Object types not kept by the catalog are rejected"""
+    catalog = Catalog(object_types=["profile"])
+    with pytest.raises(ValueError):
+        catalog.get("agent", "AGENT")
+    with pytest.raises(ValueError):
+        Catalog(object_types=["no_such_type"])
+
+
+async def test_1253(catalog_profile):
+    """AsyncCatalog loads every object type in one pipeline"""
+    catalog = AsyncCatalog()
+    await catalog.refresh()
+    profile = catalog.get("profile", PYSAI_1250_PROFILE)
+    assert isinstance(profile, select_ai.AsyncProfile)
+    assert profile.description == "Catalog profile"
+    assert len(catalog) >= 1
+
+
+def test_1254():
+    """Importing select_ai does not import the catalog or the agents"""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, select_ai; "
+            "print('select_ai.catalog' in sys.modules, "
+            "'select_ai.agent' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.stdout.split() == ["False", "False"]
@@ -474,3 +474,82 @@ async def test_1318(python_gen_ai_profile):
         text="Thank you", source_language="en", target_language="de"
     )
     assert response == "Danke"
+
+
+async def test_1319(python_gen_ai_profile, profile_attributes):
+    """List profiles hydrates attributes and description"""
+    profile_list = [
+        profile
+        async for profile in AsyncProfile.list(
+            profile_name_pattern=f"^{PYSAI_ASYNC_1300_PROFILE}$"
+        )
+    ]
+    assert len(profile_list) == 1
+    assert profile_list[0].attributes == profile_attributes
+    assert profile_list[0].description == "OCI GENAI Profile"
+
+
+async def test_1320(python_gen_ai_profile, profile_attributes):
+    """Metadata cache serves repeated instantiations and is invalidated
+    on update"""
+    AsyncProfile.enable_metadata_cache(max_size=8, ttl=60)
+    try:
+        await AsyncProfile(PYSAI_ASYNC_1300_PROFILE)
+        profile = await AsyncProfile(PYSAI_ASYNC_1300_PROFILE)
+        stats = AsyncProfile.metadata_cache_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert profile.attributes == profile_attributes
+        await profile.set_attribute("max_tokens", 2048)
+        profile = await AsyncProfile(PYSAI_ASYNC_1300_PROFILE)
+        assert profile.attributes.max_tokens == 2048
+        assert AsyncProfile.metadata_cache_stats().misses == 2
+    finally:
+        await python_gen_ai_profile.set_attribute("max_tokens", 1024)
+        AsyncProfile.disable_metadata_cache()
+
+
+async def test_1321(python_gen_ai_profile, profile_attributes):
+    """Lazy profile is loaded by load()"""
+    profile = AsyncProfile.lazy(PYSAI_ASYNC_1300_PROFILE)
+    with pytest.raises(select_ai.errors.ProfileNotLoadedError):
+        profile.attributes
+    response = await profile.chat(prompt="What is OCI ?")
+    assert isinstance(response, str)
+    await profile.load()
+    assert profile.attributes == profile_attributes
+    assert profile.description == "OCI GENAI Profile"
+
+
+async def test_1322(python_gen_ai_profile, profile_attributes):
+    """Lazy profile prefetches its metadata in the background"""
+    profile = AsyncProfile.lazy(PYSAI_ASYNC_1300_PROFILE, prefetch=True)
+    await profile.load()
+    assert profile.is_loaded
+    assert profile.attributes == profile_attributes
+
+
+async def test_1323(python_gen_ai_profile):
+    """batch_update() saves the changes in one call without re-reading"""
+    profile = await AsyncProfile(PYSAI_ASYNC_1300_PROFILE)
+    try:
+        async with profile.batch_update():
+            await profile.set_attribute("max_tokens", 4096)
+            await profile.set_attribute("max_tokens", 2048)
+        assert profile.attributes.max_tokens == 2048
+        saved_attributes = await profile.get_attributes()
+        assert saved_attributes.max_tokens == 2048
+    finally:
+        await python_gen_ai_profile.set_attribute("max_tokens", 1024)
+
+
+async def test_1324(python_gen_ai_profile):
+    """Response cache keys do not depend on the load state of a profile"""
+    response_cache = select_ai.ResponseCache()
+    lazy_profile = AsyncProfile.lazy(PYSAI_ASYNC_1300_PROFILE)
+    await response_cache.async_lookup(lazy_profile, "prompt", "showsql")
+    assert lazy_profile.is_loaded
+    profile = await AsyncProfile(PYSAI_ASYNC_1300_PROFILE)
+    assert response_cache.request_key(
+        lazy_profile, "prompt", "showsql"
+    ) == response_cache.request_key(profile, "prompt", "showsql")
@@ -9,10 +9,15 @@
 1600 - Profile generate API tests
 """
 
+import copy
 import json
 import logging
+import sqlite3
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import oracledb
 import pandas as pd
 import pytest
@@ -24,6 +29,9 @@ from select_ai import (
     ProfileAttributes,
 )
 from select_ai.profile import Action
+from select_ai.query_guard import guarded_batches
+from select_ai.single_flight import SingleFlight
+from select_ai.streaming import callfunc_clob
 
 logger = logging.getLogger(__name__)
 
@@ -338,3 +346,358 @@ def test_1617_none_prompt_raises_value_error(negative_profile):
 #     )
 #     with pytest.raises(oracledb.DatabaseError):
 #         negative_profile.run_sql(prompt="How many entries in the table")
+
+
+def test_1620_response_cache(generate_profile):
+    """show_sql responses are served from the response cache"""
+    generate_profile.response_cache = select_ai.ResponseCache()
+    try:
+        sql = generate_profile.show_sql(prompt=PROMPTS[1])
+        cached_sql = generate_profile.show_sql(prompt=f"  {PROMPTS[1]} ")
+        assert cached_sql == sql
+        stats = generate_profile.response_cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+    finally:
+        generate_profile.response_cache = None
+
+
+def test_1621_response_cache_bypassed_for_uncached_action(generate_profile):
+    """chat responses are not cached by default"""
+    generate_profile.response_cache = select_ai.ResponseCache()
+    try:
+        generate_profile.chat(prompt=PROMPTS[0])
+        stats = generate_profile.response_cache.stats()
+        assert stats.hits == 0
+        assert stats.misses == 0
+        assert stats.size == 0
+    finally:
+        generate_profile.response_cache = None
+
+
+def test_1622_shared_response_cache(generate_profile, tmp_path):
+    """show_sql responses are shared through a SQLite backed cache"""
+    path = str(tmp_path / "select_ai_cache.db")
+    generate_profile.response_cache = select_ai.ResponseCache(
+        backend=select_ai.SQLiteCache(path)
+    )
+    try:
+        sql = generate_profile.show_sql(prompt=PROMPTS[2])
+        # a second cache on the same file sees the cached response
+        generate_profile.response_cache = select_ai.ResponseCache(
+            backend=select_ai.SQLiteCache(path)
+        )
+        assert generate_profile.show_sql(prompt=PROMPTS[2]) == sql
+        assert generate_profile.response_cache.stats().hits == 1
+    finally:
+        generate_profile.response_cache = None
+
+
+def test_1623_semantic_response_cache(generate_profile):
+    """show_sql serves similar prompts from a semantic cache"""
+
+    def embedder(texts):
+        # bag of words, ignoring the words in IGNORED
+        vectors = np.zeros((len(texts), 64))
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                if word not in IGNORED:
+                    vectors[row, hash(word) % 64] += 1
+        return vectors
+
+    IGNORED = {"please", "kindly"}
+    generate_profile.response_cache = select_ai.SemanticCache(
+        embedder=embedder, threshold=0.99
+    )
+    try:
+        sql = generate_profile.show_sql(prompt=PROMPTS[0])
+        similar_prompt = f"please {PROMPTS[0]}"
+        assert generate_profile.show_sql(prompt=similar_prompt) == sql
+        stats = generate_profile.response_cache.stats()
+        assert stats.semantic_hits == 1
+        assert stats.hits == 0
+        assert stats.misses == 1
+    finally:
+        generate_profile.response_cache = None
+
+
+def test_1624_concurrent_generate_coalesced(generate_profile):
+    """identical concurrent show_sql calls share one database call"""
+    threads = 8
+    barrier = threading.Barrier(threads)
+
+    def show_sql():
+        barrier.wait()
+        return generate_profile.show_sql(prompt=PROMPTS[1])
+
+    select_ai.enable_coalescing()
+    try:
+        select_ai.coalescing_stats(reset=True)
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(lambda _: show_sql(), range(threads)))
+        assert len(set(results)) == 1
+    finally:
+        select_ai.disable_coalescing()
+    stats = select_ai.coalescing_stats()
+    assert stats.calls + stats.coalesced == threads
+    assert stats.calls < threads
+
+
+def test_1625_generate_many(generate_profile):
+    """generate_many returns the responses in input order"""
+    results = generate_profile.generate_many(
+        [
+            (PROMPTS[0], Action.CHAT),
+            (PROMPTS[1], Action.SHOWSQL),
+            (PROMPTS[2], Action.RUNSQL),
+        ]
+    )
+    assert len(results) == 3
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], str)
+    assert isinstance(results[2], pd.DataFrame)
+
+
+def test_1626_generate_many_captures_errors(generate_profile):
+    """failing prompts do not abort the batch"""
+    missing_profile = copy.copy(generate_profile)
+    missing_profile.profile_name = f"{PROFILE_PREFIX}_MISSING"
+    results = missing_profile.generate_many(
+        [(PROMPTS[0], Action.CHAT), (PROMPTS[1], Action.SHOWSQL)]
+    )
+    assert len(results) == 2
+    for result in results:
+        assert isinstance(result, select_ai.GenerateError)
+
+
+def test_1627_generate_many_empty_prompt(generate_profile):
+    """an empty prompt raises ValueError"""
+    with pytest.raises(ValueError):
+        generate_profile.generate_many([("", Action.SHOWSQL)])
+
+
+def test_1628_run_sql_locally(generate_profile):
+    """run_sql executes the generated SQL locally into typed columns"""
+    pytest.importorskip("pyarrow")
+    df = generate_profile.run_sql(prompt=PROMPTS[1], execute_locally=True)
+    assert isinstance(df, pd.DataFrame)
+    assert len(df.columns) > 0
+    table = generate_profile.run_sql(
+        prompt=PROMPTS[1], execute_locally=True, output_type="arrow"
+    )
+    assert table.num_columns == len(df.columns)
+
+
+def test_1629_run_sql_locally_invalid_output_type(generate_profile):
+    """run_sql rejects an unknown output_type"""
+    with pytest.raises(ValueError):
+        generate_profile.run_sql(
+            prompt=PROMPTS[1], execute_locally=True, output_type="polars"
+        )
+
+
+def test_1630_run_sql_batches(generate_profile):
+    """run_sql_batches yields at most batch_size and max_rows rows"""
+    pytest.importorskip("pyarrow")
+    batches = list(
+        generate_profile.run_sql_batches(
+            prompt=PROMPTS[2], batch_size=2, max_rows=3
+        )
+    )
+    assert all(isinstance(batch, pd.DataFrame) for batch in batches)
+    assert all(len(batch) <= 2 for batch in batches)
+    assert sum(len(batch) for batch in batches) <= 3
+
+
+def test_1631_run_sql_batches_invalid_batch_size(generate_profile):
+    """run_sql_batches rejects a batch_size lower than 1"""
+    with pytest.raises(ValueError):
+        next(generate_profile.run_sql_batches(prompt=PROMPTS[2], batch_size=0))
+
+
+def test_1632_generate_and_run(generate_profile):
+    """generate_and_run returns the SQL, its result and the timings"""
+    pytest.importorskip("pyarrow")
+    result = generate_profile.generate_and_run(prompt=PROMPTS[1])
+    assert isinstance(result, select_ai.SQLResult)
+    assert "SELECT" in result.sql.upper()
+    assert isinstance(result.data, pd.DataFrame)
+    assert result.llm_time > 0
+    assert result.total_time >= result.llm_time
+
+
+def test_1633_query_guard_rejects(generate_profile):
+    """the query guard rejects statements above max_cost"""
+    pytest.importorskip("pyarrow")
+    generate_profile.query_guard = select_ai.QueryGuard(max_cost=0)
+    try:
+        with pytest.raises(select_ai.QueryRejectedError):
+            generate_profile.run_sql(prompt=PROMPTS[2])
+        (metrics,) = generate_profile.query_guard.history()
+        assert metrics.decision == "rejected"
+        assert metrics.cost > 0
+    finally:
+        generate_profile.query_guard = None
+
+
+def test_1634_query_guard_row_cap(generate_profile):
+    """the query guard limits statements above max_cardinality"""
+    pytest.importorskip("pyarrow")
+    generate_profile.query_guard = select_ai.QueryGuard(
+        max_cardinality=0, row_cap=1, call_timeout=60000
+    )
+    try:
+        result = generate_profile.generate_and_run(prompt=PROMPTS[2])
+        assert len(result.data) <= 1
+        assert result.plan.decision == "capped"
+    finally:
+        generate_profile.query_guard = None
+
+
+def test_1635_chat_stream_read_ahead(generate_profile):
+    """chat with stream=True and read_ahead returns the whole response"""
+    chunks = generate_profile.chat(
+        prompt="What is OCI ?", stream=True, chunk_size=256, read_ahead=4
+    )
+    response = "".join(chunks)
+    assert "Oracle Cloud Infrastructure" in response
+
+
+def test_1636_stream_negative_read_ahead(generate_profile):
+    """a negative read_ahead raises ValueError"""
+    with pytest.raises(ValueError):
+        "".join(
+            generate_profile.chat(
+                prompt="What is OCI ?", stream=True, read_ahead=-1
+            )
+        )
+
+
+@pytest.fixture(scope="module")
+def repeat_clob_function():
+    function_name = f"{PROFILE_PREFIX}_REPEAT"
+    ddl = f"""
+    CREATE OR REPLACE FUNCTION {function_name}(
+        text VARCHAR2, times NUMBER
+    ) RETURN CLOB IS
+        l_result CLOB := EMPTY_CLOB();
+    BEGIN
+        IF times IS NULL THEN
+            RETURN NULL;
+        END IF;
+        FOR i IN 1 .. times LOOP
+            l_result := l_result || text;
+        END LOOP;
+        RETURN l_result;
+    END;
+    """
+    with select_ai.cursor() as cr:
+        cr.execute(ddl)
+    yield function_name
+    with select_ai.cursor() as cr:
+        cr.execute(f"DROP FUNCTION {function_name}")
+
+
+@pytest.mark.parametrize("times", [None, 0, 1, 10, 32767, 40000])
+def test_1637_callfunc_clob_inline_and_lob(repeat_clob_function, times):
+    """CLOB responses are returned inline when they fit and read from the
+    LOB otherwise. An empty CLOB is an empty string and NULL is None"""
+    with select_ai.cursor() as cr:
+        result = callfunc_clob(
+            cr, repeat_clob_function, {"text": "x", "times": times}
+        )
+    if times is None:
+        assert result is None
+    else:
+        assert result == "x" * times
+
+
+def test_1638_generate_showsql_inline(generate_profile):
+    """show_sql returns the generated SQL through the inline path"""
+    sql = generate_profile.show_sql(prompt=PROMPTS[1])
+    assert isinstance(sql, str)
+    assert "SELECT" in sql.upper()
+
+
+def test_1639_sqlite_cache_locked_database(tmp_path):
+    """Lookups do not write the SQLite file and a locked file is a miss"""
+    path = str(tmp_path / "select_ai_cache.db")
+    cache = select_ai.SQLiteCache(path, timeout=0.1)
+    cache.put("key", "value")
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("BEGIN EXCLUSIVE")
+    try:
+        assert cache.get("key") == "value"
+        cache.put("other", "value")
+        cache.invalidate("key")
+        cache.clear()
+        assert cache.stats().size == 1
+    finally:
+        conn.execute("ROLLBACK")
+        conn.close()
+    assert cache.get("other") is None
+    cache.close()
+
+
+def test_1640_query_guard_leaves_no_transaction(generate_profile):
+    """the plan rows of the query guard do not leave a transaction open"""
+    with select_ai.db.get_connection() as conn:
+        query_guard = select_ai.QueryGuard()
+        query, metrics = query_guard.check(conn, "SELECT 1 FROM DUAL")
+        assert metrics.decision == "allowed"
+        assert not conn.transaction_in_progress
+
+
+def test_1641_guarded_batches_call_timeout(generate_profile):
+    """call_timeout only applies while a batch is fetched"""
+    query_guard = select_ai.QueryGuard(call_timeout=60000)
+    with select_ai.db.get_connection() as conn:
+        call_timeout = conn.call_timeout
+
+        def fetch_batches():
+            for batch in range(2):
+                assert conn.call_timeout == 60000
+                yield batch
+
+        for _ in guarded_batches(query_guard, conn, fetch_batches()):
+            assert conn.call_timeout == call_timeout
+
+
+def test_1642_coalesced_result_not_shared():
+    """changing the leader's DataFrame leaves the waiters' frames intact"""
+    waiters = 3
+    single_flight = SingleFlight()
+    release = threading.Event()
+
+    def run_sql():
+        release.wait()
+        return pd.DataFrame({"COUNT": [1, 2, 3]})
+
+    def lead():
+        frame = single_flight.do("key", run_sql)
+        frame.loc[:, "COUNT"] = 0
+        return frame
+
+    with ThreadPoolExecutor(max_workers=waiters + 1) as executor:
+        leader = executor.submit(lead)
+        while single_flight.stats.calls == 0:
+            pass
+        futures = [
+            executor.submit(single_flight.do, "key", run_sql)
+            for _ in range(waiters)
+        ]
+        while single_flight.stats.coalesced < waiters:
+            pass
+        release.set()
+        assert leader.result()["COUNT"].tolist() == [0, 0, 0]
+        frames = [future.result() for future in futures]
+    for frame in frames:
+        assert frame["COUNT"].tolist() == [1, 2, 3]
+    assert len({id(frame) for frame in frames}) == waiters
+
+
+def test_1643_semantic_cache_default_actions():
+    """the semantic cache does not share RUNSQL rows unless asked to"""
+    cache = select_ai.SemanticCache(embedder=lambda texts: np.ones((1, 4)))
+    assert cache.is_cacheable(Action.SHOWSQL)
+    assert not cache.is_cacheable(Action.RUNSQL)
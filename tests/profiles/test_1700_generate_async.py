@@ -9,10 +9,13 @@
 1700 - AsyncProfile generate API tests
 """
 
+import asyncio
 import json
 import logging
+import threading
 import uuid
 
+import numpy as np
 import oracledb
 import pandas as pd
 import pytest
@@ -24,6 +27,7 @@ from select_ai import (
     ProfileAttributes,
 )
 from select_ai.profile import Action
+from select_ai.single_flight import AsyncSingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -372,3 +376,271 @@ async def test_1717_none_prompt_raises_value_error(async_negative_profile):
 #     )
 #     with pytest.raises(oracledb.DatabaseError):
 #         await async_negative_profile.run_sql(prompt="How many entries in the table")
+
+
+async def test_1720_response_cache(async_generate_profile):
+    """show_sql responses are served from the response cache"""
+    async_generate_profile.response_cache = select_ai.ResponseCache()
+    try:
+        sql = await async_generate_profile.show_sql(prompt=PROMPTS[1])
+        cached_sql = await async_generate_profile.show_sql(
+            prompt=f"  {PROMPTS[1]} "
+        )
+        assert cached_sql == sql
+        stats = async_generate_profile.response_cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+    finally:
+        async_generate_profile.response_cache = None
+
+
+async def test_1721_concurrent_generate_coalesced(async_generate_profile):
+    """identical concurrent show_sql tasks share one database call"""
+    tasks = 8
+    select_ai.enable_coalescing()
+    try:
+        select_ai.coalescing_stats(reset=True)
+        results = await asyncio.gather(
+            *[
+                async_generate_profile.show_sql(prompt=PROMPTS[2])
+                for _ in range(tasks)
+            ]
+        )
+        assert len(set(results)) == 1
+    finally:
+        select_ai.disable_coalescing()
+    stats = select_ai.coalescing_stats()
+    assert stats.calls == 1
+    assert stats.coalesced == tasks - 1
+
+
+async def test_1722_run_pipeline_batched(async_generate_profile):
+    """run_pipeline splits the prompts into pipelines and keeps the order"""
+    prompt_specifications = [
+        (PROMPTS[0], Action.CHAT),
+        (PROMPTS[1], Action.SHOWSQL),
+        (PROMPTS[2], Action.SHOWSQL),
+    ]
+    timings = []
+    responses = await async_generate_profile.run_pipeline(
+        prompt_specifications,
+        continue_on_error=True,
+        batch_size=1,
+        timings=timings,
+    )
+    assert len(responses) == 3
+    assert all(isinstance(response, str) for response in responses)
+    assert [timing.offset for timing in timings] == [0, 1, 2]
+    assert all(timing.size == 1 for timing in timings)
+
+
+async def test_1723_run_pipeline_invalid_batch_size(async_generate_profile):
+    """run_pipeline rejects a batch_size lower than 1"""
+    with pytest.raises(ValueError):
+        await async_generate_profile.run_pipeline(
+            [(PROMPTS[0], Action.CHAT)], batch_size=0
+        )
+
+
+async def test_1724_run_pipeline_iter(async_generate_profile):
+    """run_pipeline_iter yields every response with its prompt index"""
+    prompt_specifications = [
+        (PROMPTS[0], Action.CHAT),
+        (PROMPTS[1], Action.SHOWSQL),
+        (PROMPTS[2], Action.RUNSQL),
+    ]
+    responses = {}
+    timings = []
+    async for index, response in async_generate_profile.run_pipeline_iter(
+        prompt_specifications,
+        continue_on_error=True,
+        batch_size=2,
+        timings=timings,
+    ):
+        responses[index] = response
+    assert sorted(responses) == [0, 1, 2]
+    assert sorted(timing.size for timing in timings) == [1, 2]
+    assert isinstance(responses[1], str)
+    assert isinstance(responses[2], pd.DataFrame)
+
+
+async def test_1725_run_sql_locally(async_generate_profile):
+    """run_sql executes the generated SQL locally into typed columns"""
+    pytest.importorskip("pyarrow")
+    df = await async_generate_profile.run_sql(
+        prompt=PROMPTS[1], execute_locally=True
+    )
+    assert isinstance(df, pd.DataFrame)
+    assert len(df.columns) > 0
+    table = await async_generate_profile.run_sql(
+        prompt=PROMPTS[1], execute_locally=True, output_type="arrow"
+    )
+    assert table.num_columns == len(df.columns)
+
+
+async def test_1726_run_sql_locally_invalid_output_type(
+    async_generate_profile,
+):
+    """run_sql rejects an unknown output_type"""
+    with pytest.raises(ValueError):
+        await async_generate_profile.run_sql(
+            prompt=PROMPTS[1], execute_locally=True, output_type="polars"
+        )
+
+
+async def test_1727_run_sql_batches(async_generate_profile):
+    """run_sql_batches yields at most batch_size and max_rows rows"""
+    pytest.importorskip("pyarrow")
+    batches = [
+        batch
+        async for batch in async_generate_profile.run_sql_batches(
+            prompt=PROMPTS[2], batch_size=2, max_rows=3, output_type="arrow"
+        )
+    ]
+    assert all(batch.num_rows <= 2 for batch in batches)
+    assert sum(batch.num_rows for batch in batches) <= 3
+
+
+async def test_1728_generate_and_run(async_generate_profile):
+    """generate_and_run returns the SQL, its result and the timings"""
+    pytest.importorskip("pyarrow")
+    result = await async_generate_profile.generate_and_run(prompt=PROMPTS[1])
+    assert isinstance(result, select_ai.SQLResult)
+    assert "SELECT" in result.sql.upper()
+    assert isinstance(result.data, pd.DataFrame)
+    assert result.llm_time > 0
+
+
+async def test_1729_chat_stream_read_ahead(async_generate_profile):
+    """chat with stream=True and read_ahead returns the whole response"""
+    chunks = await async_generate_profile.chat(
+        prompt="What is OCI ?", stream=True, chunk_size=256, read_ahead=4
+    )
+    response = "".join([chunk async for chunk in chunks])
+    assert "Oracle Cloud Infrastructure" in response
+
+
+async def test_1730_semantic_response_cache(async_generate_profile):
+    """show_sql serves similar prompts from a semantic cache without
+    running the embedder on the event loop"""
+    loop_thread = threading.get_ident()
+    embedder_threads = []
+
+    def embedder(texts):
+        embedder_threads.append(threading.get_ident())
+        vectors = np.zeros((len(texts), 64))
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                if word != "please":
+                    vectors[row, hash(word) % 64] += 1
+        return vectors
+
+    async_generate_profile.response_cache = select_ai.SemanticCache(
+        embedder=embedder, threshold=0.99
+    )
+    try:
+        sql = await async_generate_profile.show_sql(prompt=PROMPTS[0])
+        similar_prompt = f"please {PROMPTS[0]}"
+        assert (
+            await async_generate_profile.show_sql(prompt=similar_prompt) == sql
+        )
+        assert async_generate_profile.response_cache.stats().semantic_hits == 1
+        assert embedder_threads
+        assert loop_thread not in embedder_threads
+    finally:
+        async_generate_profile.response_cache = None
+
+
+async def test_1731_coalesced_leader_cancelled(async_generate_profile):
+    """waiters of a cancelled coalesced call run it themselves"""
+    select_ai.enable_coalescing()
+    try:
+        leader = asyncio.ensure_future(
+            async_generate_profile.show_sql(prompt=PROMPTS[1])
+        )
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.ensure_future(
+                async_generate_profile.show_sql(prompt=PROMPTS[1])
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+        results = await asyncio.gather(*waiters)
+    finally:
+        select_ai.disable_coalescing()
+    assert leader.cancelled()
+    assert len(set(results)) == 1
+
+
+async def test_1732_coalescing_disabled_by_default(async_generate_profile):
+    """generate calls are not coalesced unless enabled"""
+    select_ai.coalescing_stats(reset=True)
+    await asyncio.gather(
+        *[async_generate_profile.show_sql(prompt=PROMPTS[2]) for _ in range(2)]
+    )
+    stats = select_ai.coalescing_stats()
+    assert stats.calls == 0
+    assert stats.coalesced == 0
+
+
+async def test_1733_coalesced_result_not_shared():
+    """changing the leader's DataFrame leaves the waiters' frames intact"""
+    waiters = 3
+    single_flight = AsyncSingleFlight()
+    release = asyncio.Event()
+
+    async def run_sql():
+        await release.wait()
+        return pd.DataFrame({"COUNT": [1, 2, 3]})
+
+    async def lead():
+        frame = await single_flight.do("key", run_sql)
+        frame.loc[:, "COUNT"] = 0
+        return frame
+
+    leader = asyncio.ensure_future(lead())
+    await asyncio.sleep(0)
+    futures = [
+        asyncio.ensure_future(single_flight.do("key", run_sql))
+        for _ in range(waiters)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    frames = await asyncio.gather(leader, *futures)
+    assert frames[0]["COUNT"].tolist() == [0, 0, 0]
+    for frame in frames[1:]:
+        assert frame["COUNT"].tolist() == [1, 2, 3]
+    assert single_flight.stats.coalesced == waiters
+
+
+async def test_1734_sqlite_response_cache_off_event_loop(
+    async_generate_profile, tmp_path
+):
+    """a SQLite response cache is not read or written on the event loop"""
+    loop_thread = threading.get_ident()
+    backend_threads = []
+
+    class SQLiteCache(select_ai.SQLiteCache):
+        def get(self, key, default=None):
+            backend_threads.append(threading.get_ident())
+            return super().get(key, default)
+
+        def put(self, key, value):
+            backend_threads.append(threading.get_ident())
+            super().put(key, value)
+
+    backend = SQLiteCache(str(tmp_path / "select_ai_cache.db"))
+    async_generate_profile.response_cache = select_ai.ResponseCache(
+        backend=backend
+    )
+    try:
+        sql = await async_generate_profile.show_sql(prompt=PROMPTS[1])
+        assert await async_generate_profile.show_sql(prompt=PROMPTS[1]) == sql
+        assert async_generate_profile.response_cache.stats().hits == 1
+        assert backend_threads
+        assert loop_thread not in backend_threads
+    finally:
+        async_generate_profile.response_cache = None
+        backend.close()
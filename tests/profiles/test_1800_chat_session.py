@@ -277,3 +277,18 @@ def test_1805_invalid_conversation_object(chat_session_profile):
 #     with pytest.raises(Exception):
 #         with chat_session_profile.chat_session(conversation=conversation):
 #             _assert_keywords(chat_session_profile, [("Hello World", "hello")])
+
+
+def test_1807_chat_session_lease_per_turn(
+    chat_session_profile, conversation_factory
+):
+    """Chat session with lease_per_turn keeps the conversation context"""
+    conversation = conversation_factory(title="Lease per turn")
+    with chat_session_profile.chat_session(
+        conversation=conversation,
+        lease_per_turn=True,
+        affinity=True,
+    ) as session:
+        assert session._conn is None
+        assert session.tag.endswith(conversation.conversation_id)
+        _assert_keywords(session, CATEGORY_PROMPTS["general"][:2])
@@ -295,3 +295,33 @@ async def test_1906_missing_conversation_attributes(
             conversation=conversation
         ):
             await conversation.chat(prompt="Hello World")
+
+
+@pytest.mark.anyio
+async def test_1907_chat_session_lease_per_turn(
+    async_chat_session_profile, async_conversation_factory
+):
+    """Async chat session with lease_per_turn keeps the conversation
+    context"""
+    conversation = await async_conversation_factory(title="Lease per turn")
+    async with async_chat_session_profile.chat_session(
+        conversation=conversation,
+        lease_per_turn=True,
+    ) as session:
+        assert session._conn is None
+        await _assert_keywords(session, CATEGORY_PROMPTS["general"][:2])
+
+
+@pytest.mark.anyio
+async def test_1908_chat_session_affinity_rejected(
+    async_chat_session_profile, async_conversation_factory
+):
+    """Async chat sessions reject affinity, which Thin mode ignores"""
+    conversation = await async_conversation_factory(title="Affinity")
+    with pytest.raises(ValueError):
+        async with async_chat_session_profile.chat_session(
+            conversation=conversation,
+            lease_per_turn=True,
+            affinity=True,
+        ):
+            pass
@@ -0,0 +1,72 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+"""
+1050 - Standalone connection liveness tests
+"""
+
+import pytest
+import select_ai
+
+
+@pytest.fixture(autouse=True, scope="module")
+def standalone_connect(connect, test_env):
+    select_ai.disconnect()
+    select_ai.connect(**test_env.connect_params())
+    yield
+    select_ai.disconnect()
+    select_ai.create_pool(**test_env.connect_params(use_pool=True))
+
+
+@pytest.fixture(autouse=True)
+def ping_interval():
+    ping_interval = select_ai.db.get_ping_interval()
+    select_ai.liveness_stats(reset=True)
+    yield
+    select_ai.set_ping_interval(ping_interval)
+
+
+def test_1050():
+    """Pings are skipped within the ping interval"""
+    select_ai.set_ping_interval(60)
+    for _ in range(5):
+        with select_ai.cursor() as cr:
+            cr.execute("SELECT 1 FROM DUAL")
+    stats = select_ai.liveness_stats()
+    assert stats.pings <= 1
+    assert stats.pings_skipped >= 4
+
+
+def test_1051():
+    """Ping interval 0 pings before every operation"""
+    select_ai.set_ping_interval(0)
+    for _ in range(3):
+        with select_ai.cursor() as cr:
+            cr.execute("SELECT 1 FROM DUAL")
+    stats = select_ai.liveness_stats()
+    assert stats.pings == 3
+    assert stats.pings_skipped == 0
+
+
+def test_1052():
+    """is_connected() always pings"""
+    select_ai.set_ping_interval(60)
+    with select_ai.cursor() as cr:
+        cr.execute("SELECT 1 FROM DUAL")
+    assert select_ai.is_connected()
+    assert select_ai.liveness_stats().pings >= 1
+
+
+def test_1053():
+    """liveness_stats(reset=True) clears the counters"""
+    with select_ai.cursor() as cr:
+        cr.execute("SELECT 1 FROM DUAL")
+    select_ai.liveness_stats(reset=True)
+    stats = select_ai.liveness_stats()
+    assert stats.pings == 0
+    assert stats.pings_skipped == 0
+    assert stats.reconnects == 0
@@ -0,0 +1,96 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+"""
+1060 - Async connection leasing and connection scope tests
+"""
+
+import asyncio
+
+import pytest
+import select_ai
+
+SESSION_ID = "SELECT SYS_CONTEXT('USERENV', 'SID') FROM DUAL"
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def standalone_async_connect(async_connect, test_env):
+    await select_ai.async_disconnect()
+    await select_ai.async_connect(
+        **test_env.connect_params(), max_connections=3
+    )
+    yield
+    await select_ai.async_disconnect()
+    select_ai.create_pool_async(**test_env.connect_params(use_pool=True))
+
+
+async def _session_id():
+    async with select_ai.async_cursor() as cr:
+        await cr.execute(SESSION_ID)
+        (session_id,) = await cr.fetchone()
+    return session_id
+
+
+async def _scoped_session_id():
+    async with select_ai.async_connection_scope():
+        session_id = await _session_id()
+        await asyncio.sleep(0.1)
+    return session_id
+
+
+async def test_1060():
+    """Concurrent connection scopes lease different connections"""
+    session_ids = await asyncio.gather(
+        *[_scoped_session_id() for _ in range(3)]
+    )
+    assert len(set(session_ids)) == 3
+
+
+async def test_1061():
+    """A task does not hold its connection between calls"""
+    await _session_id()
+    session_ids = await asyncio.wait_for(
+        asyncio.gather(*[_scoped_session_id() for _ in range(3)]), timeout=30
+    )
+    assert len(set(session_ids)) == 3
+
+
+async def test_1062():
+    """Tasks wait for a connection once max_connections are leased"""
+    session_ids = await asyncio.gather(*[_session_id() for _ in range(10)])
+    assert len(set(session_ids)) <= 3
+
+
+async def test_1063():
+    """A connection scope keeps its connection for the current task only"""
+    async with select_ai.async_connection_scope():
+        scope_session_id = await _session_id()
+        assert await _session_id() == scope_session_id
+        child_session_id = await asyncio.create_task(_session_id())
+    assert child_session_id != scope_session_id
+
+
+async def test_1064():
+    """max_connections must be positive"""
+    with pytest.raises(ValueError):
+        await select_ai.async_connect(
+            user="u", password="p", dsn="d", max_connections=0
+        )
+
+
+async def test_1065(test_env):
+    """A connection leased when the connections are closed is closed when
+    its scope ends"""
+    async with select_ai.async_connection_scope():
+        async with select_ai.async_cursor() as cr:
+            conn = cr.connection
+        await asyncio.create_task(select_ai.async_disconnect())
+        assert conn.is_healthy()
+    assert not conn.is_healthy()
+    await select_ai.async_connect(
+        **test_env.connect_params(), max_connections=3
+    )
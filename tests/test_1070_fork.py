@@ -0,0 +1,130 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+"""
+1070 - Fork and thread lifecycle tests of the connection registry
+"""
+
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+
+import pytest
+import select_ai
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "register_at_fork"), reason="os.fork() is not available"
+)
+
+
+def _query_in_child(queue):
+    try:
+        with select_ai.cursor() as cr:
+            cr.execute("SELECT 1 FROM DUAL")
+            (value,) = cr.fetchone()
+        queue.put((os.getpid(), value))
+    except Exception as e:
+        queue.put((os.getpid(), repr(e)))
+
+
+def test_1070():
+    """A forked child recreates the pool created by its parent"""
+    with select_ai.cursor() as cr:
+        cr.execute("SELECT 1 FROM DUAL")
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=_query_in_child, args=(queue,))
+    process.start()
+    child_pid, value = queue.get(timeout=120)
+    process.join()
+    assert child_pid != os.getpid()
+    assert value == 1
+    assert process.exitcode == 0
+
+
+def test_1071():
+    """The parent keeps using its pool after a fork"""
+    pool = select_ai.db.ConnectionManager().pool
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=_query_in_child, args=(queue,))
+    process.start()
+    queue.get(timeout=120)
+    process.join()
+    assert select_ai.db.ConnectionManager().pool is pool
+    with select_ai.cursor() as cr:
+        cr.execute("SELECT 1 FROM DUAL")
+
+
+def test_1072(test_env):
+    """Standalone connections are discarded when their thread exits"""
+    keys = []
+
+    def connect():
+        select_ai.connect(**test_env.connect_params())
+        keys.append((os.getpid(), threading.get_ident()))
+
+    thread = threading.Thread(target=connect)
+    thread.start()
+    thread.join()
+    assert keys
+    assert keys[0] not in select_ai.db.__conn__
+    assert keys[0] not in select_ai.db.__conn_params__
+
+
+# Runs in a fresh interpreter so that the forked child goes through a
+# normal interpreter shutdown, finalizers included, when it calls
+# sys.exit(). multiprocessing children exit through os._exit() instead
+SYS_EXIT_CHILD_SCRIPT = textwrap.dedent(
+    """
+    import json
+    import os
+    import sys
+
+    import select_ai
+
+    params = json.loads(sys.argv[1])
+    if "min_size" in params:
+        select_ai.create_pool(**params)
+    else:
+        select_ai.connect(**params)
+    with select_ai.cursor() as cr:
+        cr.execute("SELECT 1 FROM DUAL")
+    pid = os.fork()
+    if pid == 0:
+        sys.exit(0)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    with select_ai.cursor() as cr:
+        cr.execute("SELECT 1 FROM DUAL")
+        (value,) = cr.fetchone()
+    print(value)
+    """
+)
+
+
+@pytest.mark.parametrize("use_pool", [False, True])
+def test_1073(test_env, use_pool):
+    """A child exiting through sys.exit() leaves the parent's connection
+    and pool usable"""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            SYS_EXIT_CHILD_SCRIPT,
+            json.dumps(test_env.connect_params(use_pool=use_pool)),
+        ],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "1"
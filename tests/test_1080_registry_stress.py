@@ -0,0 +1,86 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# Licensed under the Universal Permissive License v 1.0 as shown at
+# http://oss.oracle.com/licenses/upl.
+# -----------------------------------------------------------------------------
+
+"""
+1080 - Connection registry stress tests with many threads
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import select_ai
+from select_ai.db import _Registry
+
+ITERATIONS = 200
+
+
+def _hammer(num_threads, fn):
+    barrier = threading.Barrier(num_threads)
+
+    def worker(index):
+        barrier.wait()
+        return [fn(index, i) for i in range(ITERATIONS)]
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        return list(executor.map(worker, range(num_threads)))
+
+
+@pytest.mark.parametrize("num_threads", [1, 8, 64])
+def test_1080(num_threads):
+    """Concurrent writers and readers never lose or corrupt entries"""
+    registry = _Registry()
+
+    def fn(index, i):
+        key = (index, i)
+        registry[key] = i
+        assert registry.get(key) == i
+        assert registry.pop(key) == i
+        assert key not in registry
+        registry[index] = i
+
+    _hammer(num_threads, fn)
+    assert sorted(registry.keys()) == list(range(num_threads))
+    assert registry.values() == [ITERATIONS - 1] * num_threads
+    assert len(registry.drain()) == num_threads
+    assert len(registry) == 0
+
+
+@pytest.mark.parametrize("num_threads", [1, 8, 32])
+def test_1081(num_threads):
+    """cursor() from many threads sharing the pool"""
+
+    def fn(index, i):
+        with select_ai.cursor() as cr:
+            cr.execute("SELECT :1 FROM DUAL", [i])
+            (value,) = cr.fetchone()
+        assert value == i
+
+    _hammer(num_threads, fn)
+
+
+def test_1082(test_env):
+    """Threads connecting and disconnecting standalone connections while
+    other threads use the pool"""
+    pool = select_ai.db.__pool__.pop(os.getpid())
+    pool_params = select_ai.db.__pool_params__.pop("pool")
+    try:
+
+        def fn(index, i):
+            if i % 50 == 0:
+                select_ai.connect(**test_env.connect_params())
+            with select_ai.cursor() as cr:
+                cr.execute("SELECT 1 FROM DUAL")
+            if i % 50 == 49:
+                select_ai.disconnect()
+
+        _hammer(8, fn)
+        assert len(select_ai.db.__conn__) == 0
+    finally:
+        select_ai.db.__pool__[os.getpid()] = pool
+        select_ai.db.__pool_params__["pool"] = pool_params